@@ -9,6 +9,8 @@ from psycopg2.extras import RealDictCursor
 from pymongo import MongoClient, UpdateOne
 from dotenv import load_dotenv
 
+from source_replay import TWITTER_SOURCE, http_get
+
 # ============================
 # ENV
 # ============================
@@ -101,7 +103,8 @@ def fetch_tweets(keyword: str, start_date: Optional[str], end_date: Optional[str
     Fetch tweets from RapidAPI (Alexander Vikhorev's Twitter API).
     Returns: (tweets_list, rate_limit_remaining, error_message)
     """
-    if not RAPIDAPI_KEY or not RAPIDAPI_HOST:
+    # TWITTER_SOURCE=replay serves recorded responses and needs no credentials
+    if TWITTER_SOURCE != "replay" and (not RAPIDAPI_KEY or not RAPIDAPI_HOST):
         return [], 0, "Missing RapidAPI credentials (RAPIDAPI_KEY or RAPIDAPI_HOST)"
 
     url = f"https://{RAPIDAPI_HOST}/{TWITTER_ENDPOINT.lstrip('/')}"  # Ensure single slash
@@ -113,7 +116,7 @@ def fetch_tweets(keyword: str, start_date: Optional[str], end_date: Optional[str
     params = build_query_params(keyword, start_date, end_date)
 
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=30)
+        response = http_get(url, headers=headers, params=params, timeout=30)
 
         # Extract rate limit info
         rate_limit_remaining = int(response.headers.get("X-RateLimit-Remaining", 0))
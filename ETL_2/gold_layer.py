@@ -14,100 +14,186 @@ if not PG_DSN:
     raise RuntimeError("POSTGRES_DSN is not set")
 
 # =====================================================
-# SQL STATEMENTS (SET-BASED)
+# SQL STATEMENTS (SET-BASED, WATERMARK-DRIVEN)
 # =====================================================
+# Each statement reads the request's silver rows above its gold_watermarks
+# entry once (src), inserts the facts (ins), adds them to the daily
+# rollup (roll) and advances the watermark to the highest id it read
+# (mark). No gold_processed UPDATE passes needed.
+#
+# dim_date / dim_time are joined on the date_id / time_id keys the silver
+# layer stores with every row (UTC, YYYYMMDD / HHMM) and the request date
+# range is an integer range on the stored key. Rows written before silver
+# stored the keys are filled by the FILL_*_KEYS statements first.
 
-# INSERT POSTS into fact table (content_type_id = 1)
-# Filters by dates from global_keywords if specified
-INSERT_POST_SENTIMENT_SQL = """
-INSERT INTO fact_sentiment_events (
-    silver_content_id, model_id, platform_id, content_type_id,
-    sentiment_id, date_id, time_id, sentiment_score, request_id
-)
-SELECT
-    sp.silver_post_id, 
-    1, -- Model: RoBERTa
-    1, -- Platform: Reddit
-    1, -- Content Type: Post
-    ds.sentiment_id, 
-    COALESCE(dd.date_id, 20251231),
-    COALESCE(dt.time_id, 1200),
-    sp.post_sentiment_score, 
-    %s
+_SET_KEYS = """
+    {date_col} = TO_CHAR({ts_col}, 'YYYYMMDD')::INT,
+    {time_col} = (EXTRACT(HOUR FROM {ts_col}) * 100 + EXTRACT(MINUTE FROM {ts_col}))::INT
+"""
+
+FILL_POST_KEYS_SQL = """
+UPDATE silver_reddit_posts SET """ + _SET_KEYS.format(
+    date_col="date_id", time_col="time_id", ts_col="created_at_utc"
+) + """
+WHERE global_keyword_id = %(request_id)s
+AND date_id IS NULL AND created_at_utc IS NOT NULL
+"""
+
+FILL_COMMENT_KEYS_SQL = """
+UPDATE silver_reddit_comments sc SET """ + _SET_KEYS.format(
+    date_col="comment_date_id", time_col="comment_time_id", ts_col="sc.comment_created_at_utc"
+) + """
 FROM silver_reddit_posts sp
-JOIN global_keywords gk ON gk.global_keyword_id = sp.global_keyword_id
-JOIN dim_sentiment ds ON ds.sentiment_label = sp.post_sentiment_label
-LEFT JOIN dim_date dd ON dd.calendar_date = DATE(sp.created_at_utc)
-LEFT JOIN dim_time dt ON dt.time_id = (EXTRACT(HOUR FROM sp.created_at_utc) * 100 + EXTRACT(MINUTE FROM sp.created_at_utc))
-WHERE sp.global_keyword_id = %s
-AND sp.gold_processed = FALSE
-AND (gk.start_date IS NULL OR DATE(sp.created_at_utc) >= gk.start_date)
-AND (gk.end_date IS NULL OR DATE(sp.created_at_utc) <= gk.end_date)
-ON CONFLICT ON CONSTRAINT fact_sentiment_events_unique_content DO NOTHING;
+WHERE sc.silver_post_id = sp.silver_post_id
+AND sp.global_keyword_id = %(request_id)s
+AND sc.comment_date_id IS NULL AND sc.comment_created_at_utc IS NOT NULL
+"""
+
+FILL_TWEET_KEYS_SQL = """
+UPDATE silver_twitter_tweets SET """ + _SET_KEYS.format(
+    date_col="tweet_date_id", time_col="tweet_time_id", ts_col="tweet_created_at"
+) + """
+WHERE global_keyword_id = %(request_id)s
+AND tweet_date_id IS NULL AND tweet_created_at IS NOT NULL
 """
 
+def _fact_load_sql(source_sql, fact_sql, platform_id, content_type_id, id_column):
+    """
+    Wrap one content type's src / ins bodies in the shared watermark,
+    roll and mark clauses. ``source_sql`` ends in a WHERE clause and
+    ``id_column`` is the qualified silver id the watermark tracks.
+    """
+    column = id_column.split(".")[-1]
+    return f"""
+WITH src AS (
+    {source_sql.strip()}
+    AND {id_column} > COALESCE((
+        SELECT last_silver_id FROM gold_watermarks
+        WHERE request_id = %(request_id)s AND platform_id = {platform_id} AND content_type_id = {content_type_id}
+    ), 0)
+),
+ins AS (
+    {fact_sql.strip()}
+    ON CONFLICT ON CONSTRAINT fact_sentiment_events_unique_content DO NOTHING
+    RETURNING request_id, date_id, platform_id, content_type_id, sentiment_id, sentiment_score
+),
+roll AS (
+    INSERT INTO gold_daily_sentiment_rollup (
+        request_id, date_id, platform_id, content_type_id, sentiment_id, item_count, score_sum
+    )
+    SELECT request_id, date_id, platform_id, content_type_id, sentiment_id, COUNT(*), SUM(sentiment_score)
+    FROM ins
+    GROUP BY request_id, date_id, platform_id, content_type_id, sentiment_id
+    ON CONFLICT (request_id, date_id, platform_id, content_type_id, sentiment_id) DO UPDATE
+    SET item_count = gold_daily_sentiment_rollup.item_count + EXCLUDED.item_count,
+        score_sum = gold_daily_sentiment_rollup.score_sum + EXCLUDED.score_sum
+),
+mark AS (
+    INSERT INTO gold_watermarks (request_id, platform_id, content_type_id, last_silver_id)
+    SELECT %(request_id)s, {platform_id}, {content_type_id}, MAX({column}) FROM src
+    HAVING MAX({column}) IS NOT NULL
+    ON CONFLICT (request_id, platform_id, content_type_id) DO UPDATE
+    SET last_silver_id = GREATEST(gold_watermarks.last_silver_id, EXCLUDED.last_silver_id),
+        updated_at = NOW()
+)
+SELECT (SELECT COUNT(*) FROM ins), (SELECT COUNT(*) FROM src);
+"""
+
+
+# INSERT POSTS into fact table (content_type_id = 1)
+# Filters by dates from global_keywords if specified
+INSERT_POST_SENTIMENT_SQL = _fact_load_sql("""
+    SELECT sp.*
+    FROM silver_reddit_posts sp
+    WHERE sp.global_keyword_id = %(request_id)s
+""", """
+    INSERT INTO fact_sentiment_events (
+        silver_content_id, model_id, platform_id, content_type_id,
+        sentiment_id, date_id, time_id, sentiment_score, request_id
+    )
+    SELECT
+        sp.silver_post_id, 
+        1, -- Model: RoBERTa
+        1, -- Platform: Reddit
+        1, -- Content Type: Post
+        ds.sentiment_id, 
+        COALESCE(dd.date_id, 20251231),
+        COALESCE(dt.time_id, 1200),
+        sp.post_sentiment_score, 
+        %(request_id)s
+    FROM src sp
+    JOIN global_keywords gk ON gk.global_keyword_id = sp.global_keyword_id
+    JOIN dim_sentiment ds ON ds.sentiment_label = sp.post_sentiment_label
+    LEFT JOIN dim_date dd ON dd.date_id = sp.date_id
+    LEFT JOIN dim_time dt ON dt.time_id = sp.time_id
+    WHERE (gk.start_date IS NULL OR sp.date_id >= TO_CHAR(gk.start_date, 'YYYYMMDD')::INT)
+    AND (gk.end_date IS NULL OR sp.date_id <= TO_CHAR(gk.end_date, 'YYYYMMDD')::INT)
+""", platform_id=1, content_type_id=1, id_column="sp.silver_post_id")
+
 # INSERT COMMENTS into fact table (content_type_id = 2)
 # Uses negative silver_comment_id to avoid collision with post IDs
 # Filters by dates from global_keywords if specified
-INSERT_COMMENT_SENTIMENT_SQL = """
-INSERT INTO fact_sentiment_events (
-    silver_content_id, model_id, platform_id, content_type_id,
-    sentiment_id, date_id, time_id, sentiment_score, request_id
-)
-SELECT
-    -sc.silver_comment_id,  -- Negative to distinguish from posts
-    1, -- Model: RoBERTa
-    1, -- Platform: Reddit
-    2, -- Content Type: Comment
-    ds.sentiment_id, 
-    COALESCE(dd.date_id, 20251231),
-    COALESCE(dt.time_id, 1200),
-    sc.comment_sentiment_score, 
-    %s
-FROM silver_reddit_comments sc
-JOIN silver_reddit_posts sp ON sc.silver_post_id = sp.silver_post_id
-JOIN global_keywords gk ON gk.global_keyword_id = sp.global_keyword_id
-JOIN dim_sentiment ds ON ds.sentiment_label = sc.comment_sentiment_label
-LEFT JOIN dim_date dd ON dd.calendar_date = DATE(sc.comment_created_at_utc)
-LEFT JOIN dim_time dt ON dt.time_id = (EXTRACT(HOUR FROM sc.comment_created_at_utc) * 100 + EXTRACT(MINUTE FROM sc.comment_created_at_utc))
-WHERE sp.global_keyword_id = %s
-AND sp.gold_processed = FALSE
-AND (gk.start_date IS NULL OR DATE(sc.comment_created_at_utc) >= gk.start_date)
-AND (gk.end_date IS NULL OR DATE(sc.comment_created_at_utc) <= gk.end_date)
-ON CONFLICT ON CONSTRAINT fact_sentiment_events_unique_content DO NOTHING;
-"""
+INSERT_COMMENT_SENTIMENT_SQL = _fact_load_sql("""
+    SELECT sc.*, sp.global_keyword_id
+    FROM silver_reddit_comments sc
+    JOIN silver_reddit_posts sp ON sc.silver_post_id = sp.silver_post_id
+    WHERE sp.global_keyword_id = %(request_id)s
+""", """
+    INSERT INTO fact_sentiment_events (
+        silver_content_id, model_id, platform_id, content_type_id,
+        sentiment_id, date_id, time_id, sentiment_score, request_id
+    )
+    SELECT
+        -sc.silver_comment_id,  -- Negative to distinguish from posts
+        1, -- Model: RoBERTa
+        1, -- Platform: Reddit
+        2, -- Content Type: Comment
+        ds.sentiment_id, 
+        COALESCE(dd.date_id, 20251231),
+        COALESCE(dt.time_id, 1200),
+        sc.comment_sentiment_score, 
+        %(request_id)s
+    FROM src sc
+    JOIN global_keywords gk ON gk.global_keyword_id = sc.global_keyword_id
+    JOIN dim_sentiment ds ON ds.sentiment_label = sc.comment_sentiment_label
+    LEFT JOIN dim_date dd ON dd.date_id = sc.comment_date_id
+    LEFT JOIN dim_time dt ON dt.time_id = sc.comment_time_id
+    WHERE (gk.start_date IS NULL OR sc.comment_date_id >= TO_CHAR(gk.start_date, 'YYYYMMDD')::INT)
+    AND (gk.end_date IS NULL OR sc.comment_date_id <= TO_CHAR(gk.end_date, 'YYYYMMDD')::INT)
+""", platform_id=1, content_type_id=2, id_column="sc.silver_comment_id")
 
 # INSERT TWEETS into fact table (content_type_id = 3)
 # Filters by dates from global_keywords if specified
-INSERT_TWEET_SENTIMENT_SQL = """
-INSERT INTO fact_sentiment_events (
-    silver_content_id, model_id, platform_id, content_type_id,
-    sentiment_id, date_id, time_id, sentiment_score, engagement_score, request_id, created_at
-)
-SELECT
-    st.silver_tweet_id,
-    1, -- Model: RoBERTa
-    2, -- Platform: Twitter
-    3, -- Content Type: Tweet
-    ds.sentiment_id,
-    COALESCE(dd.date_id, 20251231),
-    COALESCE(dt.time_id, 1200),
-    st.tweet_sentiment_score,
-    (COALESCE(st.retweet_count, 0) + COALESCE(st.favorite_count, 0) + 
-     COALESCE(st.reply_count, 0) + COALESCE(st.quote_count, 0)) AS engagement_score,
-    %s,
-    NOW()
-FROM silver_twitter_tweets st
-JOIN global_keywords gk ON gk.global_keyword_id = st.global_keyword_id
-JOIN dim_sentiment ds ON ds.sentiment_label = st.tweet_sentiment_label
-LEFT JOIN dim_date dd ON dd.calendar_date = DATE(st.tweet_created_at)
-LEFT JOIN dim_time dt ON dt.time_id = (EXTRACT(HOUR FROM st.tweet_created_at) * 100 + EXTRACT(MINUTE FROM st.tweet_created_at))
-WHERE st.global_keyword_id = %s
-AND st.gold_processed = FALSE
-AND (gk.start_date IS NULL OR DATE(st.tweet_created_at) >= gk.start_date)
-AND (gk.end_date IS NULL OR DATE(st.tweet_created_at) <= gk.end_date)
-ON CONFLICT ON CONSTRAINT fact_sentiment_events_unique_content DO NOTHING;
-"""
+INSERT_TWEET_SENTIMENT_SQL = _fact_load_sql("""
+    SELECT st.*
+    FROM silver_twitter_tweets st
+    WHERE st.global_keyword_id = %(request_id)s
+""", """
+    INSERT INTO fact_sentiment_events (
+        silver_content_id, model_id, platform_id, content_type_id,
+        sentiment_id, date_id, time_id, sentiment_score, engagement_score, request_id, created_at
+    )
+    SELECT
+        st.silver_tweet_id,
+        1, -- Model: RoBERTa
+        2, -- Platform: Twitter
+        3, -- Content Type: Tweet
+        ds.sentiment_id,
+        COALESCE(dd.date_id, 20251231),
+        COALESCE(dt.time_id, 1200),
+        st.tweet_sentiment_score,
+        (COALESCE(st.retweet_count, 0) + COALESCE(st.favorite_count, 0) + 
+         COALESCE(st.reply_count, 0) + COALESCE(st.quote_count, 0)) AS engagement_score,
+        %(request_id)s,
+        NOW()
+    FROM src st
+    JOIN global_keywords gk ON gk.global_keyword_id = st.global_keyword_id
+    JOIN dim_sentiment ds ON ds.sentiment_label = st.tweet_sentiment_label
+    LEFT JOIN dim_date dd ON dd.date_id = st.tweet_date_id
+    LEFT JOIN dim_time dt ON dt.time_id = st.tweet_time_id
+    WHERE (gk.start_date IS NULL OR st.tweet_date_id >= TO_CHAR(gk.start_date, 'YYYYMMDD')::INT)
+    AND (gk.end_date IS NULL OR st.tweet_date_id <= TO_CHAR(gk.end_date, 'YYYYMMDD')::INT)
+""", platform_id=2, content_type_id=3, id_column="st.silver_tweet_id")
 
 
 # =====================================================
@@ -121,52 +207,31 @@ def run_gold_etl(keyword, request_id, platform='reddit'):
     """
     conn = psycopg2.connect(PG_DSN)
     conn.autocommit = False
+    params = {"request_id": int(request_id)}
     try:
         with conn.cursor() as cur:
+            cur.execute("SET LOCAL TIME ZONE 'UTC'")
             if platform == 'twitter':
-                # Twitter processing
-                cur.execute(INSERT_TWEET_SENTIMENT_SQL, (request_id, request_id))
-                tweets_inserted = cur.rowcount
-                print(f"[GOLD TWITTER] Inserted {tweets_inserted} tweet sentiment rows.")
-
-                # Mark tweets as gold_processed
-                cur.execute("""
-                    UPDATE silver_twitter_tweets
-                    SET gold_processed = TRUE
-                    WHERE global_keyword_id = %s AND gold_processed = FALSE
-                """, (request_id,))
-                tweets_marked = cur.rowcount
-                print(f"[GOLD TWITTER] Marked {tweets_marked} silver tweets as gold_processed.")
+                cur.execute(FILL_TWEET_KEYS_SQL, params)
+
+                # Twitter processing (watermark advances in the same statement)
+                cur.execute(INSERT_TWEET_SENTIMENT_SQL, params)
+                tweets_inserted, tweets_read = cur.fetchone()
+                print(f"[GOLD TWITTER] Inserted {tweets_inserted} tweet sentiment rows ({tweets_read} new silver tweets).")
 
             else:  # Default to Reddit
+                cur.execute(FILL_POST_KEYS_SQL, params)
+                cur.execute(FILL_COMMENT_KEYS_SQL, params)
+
                 # 1. Insert POSTS into fact table
-                cur.execute(INSERT_POST_SENTIMENT_SQL, (request_id, request_id))
-                posts_inserted = cur.rowcount
-                print(f"[GOLD] Inserted {posts_inserted} post sentiment rows.")
+                cur.execute(INSERT_POST_SENTIMENT_SQL, params)
+                posts_inserted, posts_read = cur.fetchone()
+                print(f"[GOLD] Inserted {posts_inserted} post sentiment rows ({posts_read} new silver posts).")
 
                 # 2. Insert COMMENTS into fact table
-                cur.execute(INSERT_COMMENT_SENTIMENT_SQL, (request_id, request_id))
-                comments_inserted = cur.rowcount
-                print(f"[GOLD] Inserted {comments_inserted} comment sentiment rows.")
-
-                # 3. Mark Silver posts as gold_processed
-                cur.execute("""
-                    UPDATE silver_reddit_posts 
-                    SET gold_processed = TRUE 
-                    WHERE global_keyword_id = %s AND gold_processed = FALSE
-                """, (request_id,))
-                print(f"[GOLD] Marked {cur.rowcount} silver posts as gold_processed.")
-
-                # 4. Mark comment summaries as gold_processed
-                cur.execute("""
-                    UPDATE silver_reddit_comment_sentiment_summary css
-                    SET gold_processed = TRUE
-                    FROM silver_reddit_posts sp
-                    WHERE css.silver_post_id = sp.silver_post_id
-                    AND sp.global_keyword_id = %s
-                    AND css.gold_processed = FALSE
-                """, (request_id,))
-                print(f"[GOLD] Marked {cur.rowcount} comment summaries as gold_processed.")
+                cur.execute(INSERT_COMMENT_SENTIMENT_SQL, params)
+                comments_inserted, comments_read = cur.fetchone()
+                print(f"[GOLD] Inserted {comments_inserted} comment sentiment rows ({comments_read} new silver comments).")
 
         conn.commit()
         print(f"[GOLD] Transaction committed for {platform}.")
@@ -2,6 +2,7 @@ import os
 import re
 import html
 import hashlib
+import time
 from datetime import datetime, timezone
 from typing import List
 
@@ -72,6 +73,15 @@ def hash_author(author: str):
     return hashlib.sha256(author.encode()).hexdigest()
 
 
+def dim_keys(dt):
+    """(date_id YYYYMMDD, time_id HHMM) of a timestamp in UTC, for the gold dim joins."""
+    if dt is None:
+        return None, None
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc)
+    return dt.year * 10000 + dt.month * 100 + dt.day, dt.hour * 100 + dt.minute
+
+
 def is_eligible_comment(comment: dict) -> bool:
     body = comment.get("body", "")
     author = comment.get("author", "")
@@ -102,43 +112,14 @@ def aggregate_sentiment(sentiments: List[dict]):
 # =====================================================
 # MAIN PROCESS
 # =====================================================
-def run_silver(request_id, batch_size=50):
+def _process_batch(raw_docs, rid, cursor_pg):
     """
-    Main Silver Layer process: Cleans data, runs RoBERTa sentiment,
-    and persists to PostgreSQL with Transactional Integrity.
-    OPTIMIZED: Increased batch_size from 32 to 50 for faster processing.
+    Clean, score and persist one batch of bronze documents in a single
+    Postgres transaction. Returns (posts_committed, comments_inserted, texts_scored),
+    or None if inference crashed and draining should stop.
     """
-    cursor_pg = pg_conn.cursor()
     processed_mongo_ids = []  # Track successful Postgres writes
 
-    # 1. ROBUST REQUEST ID HANDLING
-    try:
-        # Force integer conversion to prevent 'NoneType' or string indexing errors
-        rid = int(request_id) if request_id else None
-        if rid is None:
-            print("[SILVER] CRITICAL: No Request ID provided. Aborting.")
-            return
-    except (TypeError, ValueError):
-        print(f"[SILVER] CRITICAL: Invalid Request ID format: {request_id}")
-        return
-
-    # 2. FETCH UNPROCESSED DOCUMENTS - OPTIMIZED: Filter by request_id
-    query_filter = {
-        "silver_processed": {"$ne": True},
-        "global_keyword_id": rid  # Only process docs for THIS request
-    }
-    unprocessed_count = bronze.count_documents(query_filter)
-    print(f"[DEBUG] Silver Query Filter: {query_filter}")
-    print(f"[DEBUG] Total Unprocessed in Bronze for Request {rid}: {unprocessed_count}")
-
-    # Use a small limit to prevent OOM (Out of Memory) crashes on 8GB RAM
-    raw_docs = list(bronze.find(query_filter).limit(batch_size))
-
-    if not raw_docs:
-        print("[SILVER] No new data to process.")
-        cursor_pg.close()
-        return
-
     all_texts_to_score = []
     doc_mapping = []
 
@@ -177,16 +158,14 @@ def run_silver(request_id, batch_size=50):
             continue
 
     if not all_texts_to_score:
-        cursor_pg.close()
-        return
+        return 0, 0, 0
 
     # 4. INFERENCE PHASE: BATCH SENTIMENT
     try:
         all_scores = run_sentiment_batch(all_texts_to_score)
     except Exception as e:
         print(f"[SILVER] Inference Crash: {e}")
-        cursor_pg.close()
-        return
+        return None
 
     # 5. PERSISTENCE PHASE: TRANSACTIONAL WRITE
     current_score_idx = 0
@@ -211,7 +190,9 @@ def run_silver(request_id, batch_size=50):
 
             agg_label, agg_score = aggregate_sentiment(comment_sentiments)
 
-            # Insert Post (Strict 17 Parameter Tuple)
+            created_at = datetime.fromtimestamp(post.get("created_utc", 0), tz=timezone.utc)
+
+            # Insert Post (Strict 19 Parameter Tuple)
             cursor_pg.execute(
                 """
                 INSERT INTO silver_reddit_posts (
@@ -219,9 +200,9 @@ def run_silver(request_id, batch_size=50):
                     post_id, title_clean, body_clean, author_hash,
                     subreddit_name, post_url, post_score, upvote_ratio, 
                     total_comments, post_sentiment_label, post_sentiment_score,
-                    created_at_utc, processed_at_utc
+                    created_at_utc, processed_at_utc, date_id, time_id
                 )
-                VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
+                VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
                 ON CONFLICT (original_bronze_id) DO NOTHING
                 RETURNING silver_post_id
                 """,
@@ -232,8 +213,9 @@ def run_silver(request_id, batch_size=50):
                     post.get("subreddit_name_prefixed"), post.get("url"), post.get("score", 0),
                     post.get("upvote_ratio", 0), post.get("num_comments", 0),
                     post_sentiment["label"], post_sentiment["score"],
-                    datetime.fromtimestamp(post.get("created_utc", 0), tz=timezone.utc),
-                    datetime.now(timezone.utc)
+                    created_at,
+                    datetime.now(timezone.utc),
+                    *dim_keys(created_at)
                 )
             )
 
@@ -248,15 +230,18 @@ def run_silver(request_id, batch_size=50):
 
                 comment_sentiment = comment_sentiments[i]
                 comment_id = comment.get("id") or f"{post_id_val}_comment_{i}"
+                comment_created_at = datetime.fromtimestamp(comment.get("created_utc", 0), tz=timezone.utc) if comment.get(
+                    "created_utc") else None
 
                 cursor_pg.execute(
                     """
                     INSERT INTO silver_reddit_comments (
                         silver_post_id, comment_id, comment_body_clean, author_hash,
                         comment_score, comment_created_at_utc,
-                        comment_sentiment_label, comment_sentiment_score
+                        comment_sentiment_label, comment_sentiment_score,
+                        comment_date_id, comment_time_id
                     )
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
                     ON CONFLICT DO NOTHING
                     """,
                     (
@@ -265,10 +250,10 @@ def run_silver(request_id, batch_size=50):
                         clean_text(comment.get("body", "")),
                         hash_author(comment.get("author")),
                         comment.get("score", 0),
-                        datetime.fromtimestamp(comment.get("created_utc", 0), tz=timezone.utc) if comment.get(
-                            "created_utc") else None,
+                        comment_created_at,
                         comment_sentiment["label"],
-                        comment_sentiment["score"]
+                        comment_sentiment["score"],
+                        *dim_keys(comment_created_at)
                     )
                 )
                 total_comments_inserted += 1
@@ -306,9 +291,69 @@ def run_silver(request_id, batch_size=50):
         print(f"CRITICAL PERSISTENCE ERROR: {e}")
         raise e  # Re-raise for brandpulse_master
 
+    return len(processed_mongo_ids), total_comments_inserted, len(all_texts_to_score)
+
+
+def run_silver(request_id, batch_size=50):
+    """
+    Main Silver Layer process: Cleans data, runs RoBERTa sentiment,
+    and persists to PostgreSQL with Transactional Integrity.
+    OPTIMIZED: Increased batch_size from 32 to 50 for faster processing.
+    DRAIN MODE: Keeps pulling batches (paged by _id, capped at batch_size)
+    and committing each one until the request's backlog is empty.
+    """
+    # 1. ROBUST REQUEST ID HANDLING
+    try:
+        # Force integer conversion to prevent 'NoneType' or string indexing errors
+        rid = int(request_id) if request_id else None
+        if rid is None:
+            print("[SILVER] CRITICAL: No Request ID provided. Aborting.")
+            return
+    except (TypeError, ValueError):
+        print(f"[SILVER] CRITICAL: Invalid Request ID format: {request_id}")
+        return
+
+    # 2. FETCH UNPROCESSED DOCUMENTS - OPTIMIZED: Filter by request_id
+    query_filter = {
+        "silver_processed": {"$ne": True},
+        "global_keyword_id": rid  # Only process docs for THIS request
+    }
+    unprocessed_count = bronze.count_documents(query_filter)
+    print(f"[DEBUG] Silver Query Filter: {query_filter}")
+    print(f"[DEBUG] Total Unprocessed in Bronze for Request {rid}: {unprocessed_count}")
+
+    cursor_pg = pg_conn.cursor()
+    last_id = None
+    batch_number = 0
+    try:
+        while True:
+            batch_filter = dict(query_filter)
+            if last_id is not None:
+                batch_filter["_id"] = {"$gt": last_id}
+
+            # Use a small limit to prevent OOM (Out of Memory) crashes on 8GB RAM
+            raw_docs = list(bronze.find(batch_filter).sort("_id", 1).limit(batch_size))
+            if not raw_docs:
+                break
+
+            last_id = raw_docs[-1]["_id"]
+            batch_number += 1
+            batch_started = time.perf_counter()
+
+            result = _process_batch(raw_docs, rid, cursor_pg)
+            if result is None:
+                break
+            posts, comments, texts = result
+
+            elapsed = max(time.perf_counter() - batch_started, 1e-9)
+            print(f"[SILVER] Batch {batch_number}: {len(raw_docs)} docs, {texts} texts in {elapsed:.2f}s "
+                  f"({len(raw_docs) / elapsed:.1f} docs/s, {texts / elapsed:.1f} texts/s)")
     finally:
         cursor_pg.close()
 
+    if not batch_number:
+        print("[SILVER] No new data to process.")
+
 
 # =====================================================
 # TWITTER PROCESSING
@@ -432,6 +477,7 @@ def process_twitter_data(request_id: int, batch_size: int = 50):
             tweet_id = tweet.get("tweet_id")
             author = tweet.get("author", "")
             tweet_url = f"https://twitter.com/{author}/status/{tweet_id}" if author and tweet_id else None
+            tweet_created_at = dateparser.parse(tweet.get("created_at")) if tweet.get("created_at") else None
 
             # Insert into silver_twitter_tweets
             cursor_pg.execute(
@@ -442,9 +488,9 @@ def process_twitter_data(request_id: int, batch_size: int = 50):
                     author_hash, author_id_hash,
                     retweet_count, favorite_count, reply_count, quote_count,
                     tweet_sentiment_label, tweet_sentiment_score,
-                    tweet_created_at, processed_at
+                    tweet_created_at, processed_at, tweet_date_id, tweet_time_id
                 )
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW())
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW(), %s, %s)
                 ON CONFLICT (original_bronze_id) DO NOTHING
                 """,
                 (
@@ -462,7 +508,8 @@ def process_twitter_data(request_id: int, batch_size: int = 50):
                     tweet.get("quote_count", 0),
                     sentiment_label,
                     sentiment_score,
-                    dateparser.parse(tweet.get("created_at")) if tweet.get("created_at") else None
+                    tweet_created_at,
+                    *dim_keys(tweet_created_at)
                 )
             )
 
@@ -0,0 +1,153 @@
+import os
+import gzip
+import json
+import random
+import hashlib
+import tempfile
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import requests
+from dotenv import load_dotenv
+
+# =====================================================
+# ENV SETUP
+# =====================================================
+# Record/replay for the RapidAPI Twitter source, so bronze_twitter_ingest
+# can run without credentials or network access (CI, benchmark hosts).
+#
+#   TWITTER_SOURCE=live    requests.get, unchanged (default)
+#   TWITTER_SOURCE=record  requests.get, response also saved as a fixture
+#   TWITTER_SOURCE=replay  recorded responses only
+#
+# Fixtures are gzip JSON files under SOURCE_FIXTURE_DIR/twitter/http/,
+# one per (endpoint path, query params). Host and request headers are not
+# part of the key and are never written, so the API key stays out of the
+# fixtures. Replayed responses wait SOURCE_REPLAY_LATENCY_MS +/-
+# SOURCE_REPLAY_JITTER_MS (jitter seeded per request) and carry
+# X-RateLimit-* headers from a simulated quota of SOURCE_REPLAY_RATE_LIMIT
+# requests per SOURCE_REPLAY_RATE_WINDOW_S.
+load_dotenv()
+
+TWITTER_SOURCE = os.getenv("TWITTER_SOURCE", "live").strip().lower()
+SOURCE_FIXTURE_DIR = os.getenv("SOURCE_FIXTURE_DIR", "fixtures/sources")
+SOURCE_REPLAY_LATENCY_MS = float(os.getenv("SOURCE_REPLAY_LATENCY_MS", "0"))
+SOURCE_REPLAY_JITTER_MS = float(os.getenv("SOURCE_REPLAY_JITTER_MS", "0"))
+SOURCE_REPLAY_RATE_LIMIT = int(os.getenv("SOURCE_REPLAY_RATE_LIMIT", "600"))
+SOURCE_REPLAY_RATE_WINDOW_S = float(os.getenv("SOURCE_REPLAY_RATE_WINDOW_S", "600"))
+
+if TWITTER_SOURCE not in ("live", "record", "replay"):
+    raise RuntimeError(f"Unknown TWITTER_SOURCE '{TWITTER_SOURCE}' (expected live, record or replay)")
+
+# Response headers worth keeping in a fixture
+RECORDED_HEADERS = ("Content-Type", "X-RateLimit-Limit", "X-RateLimit-Remaining", "X-RateLimit-Reset")
+
+
+# =====================================================
+# FIXTURES
+# =====================================================
+def fixture_key(url, params):
+    """Request key: endpoint path plus sorted query params (no host, no headers)."""
+    return json.dumps([urlsplit(url).path, sorted((params or {}).items())])
+
+
+def fixture_path(key):
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    return Path(SOURCE_FIXTURE_DIR) / "twitter" / "http" / f"{digest}.json.gz"
+
+
+def save_fixture(key, response):
+    path = fixture_path(key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    record = {
+        "key": key,
+        "status_code": response.status_code,
+        "headers": {h: response.headers[h] for h in RECORDED_HEADERS if h in response.headers},
+        "body": response.text,
+    }
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as gz:
+            gz.write(json.dumps(record).encode("utf-8"))
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def load_fixture(key):
+    path = fixture_path(key)
+    if not path.exists():
+        raise FileNotFoundError(
+            f"No recorded Twitter response for {key} ({path}). Capture it first with TWITTER_SOURCE=record."
+        )
+    with gzip.open(path, "rb") as gz:
+        return json.loads(gz.read().decode("utf-8"))
+
+
+# =====================================================
+# REPLAY
+# =====================================================
+_quota_lock = threading.Lock()
+_quota = {"window_start": time.time(), "used": 0}
+
+
+def consume_quota():
+    """Count one replayed request; return its X-RateLimit-* headers."""
+    with _quota_lock:
+        now = time.time()
+        if now - _quota["window_start"] >= SOURCE_REPLAY_RATE_WINDOW_S:
+            _quota["window_start"] = now
+            _quota["used"] = 0
+        _quota["used"] += 1
+        return {
+            "X-RateLimit-Limit": str(SOURCE_REPLAY_RATE_LIMIT),
+            "X-RateLimit-Remaining": str(max(0, SOURCE_REPLAY_RATE_LIMIT - _quota["used"])),
+            "X-RateLimit-Reset": str(int(_quota["window_start"] + SOURCE_REPLAY_RATE_WINDOW_S)),
+        }
+
+
+class ReplayResponse:
+    """The parts of requests.Response that bronze_twitter_ingest uses."""
+
+    def __init__(self, url, record, rate_headers):
+        self.url = url
+        self.status_code = record["status_code"]
+        self.text = record["body"]
+        self.headers = requests.structures.CaseInsensitiveDict({**record["headers"], **rate_headers})
+
+    def json(self):
+        return json.loads(self.text)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} Error (replayed) for url: {self.url}", response=self)
+
+
+def replay_get(url, params=None):
+    key = fixture_key(url, params)
+    record = load_fixture(key)
+
+    delay_ms = SOURCE_REPLAY_LATENCY_MS
+    if SOURCE_REPLAY_JITTER_MS:
+        delay_ms += random.Random(key).uniform(-SOURCE_REPLAY_JITTER_MS, SOURCE_REPLAY_JITTER_MS)
+    if delay_ms > 0:
+        time.sleep(delay_ms / 1000.0)
+
+    return ReplayResponse(url, record, consume_quota())
+
+
+# =====================================================
+# ENTRYPOINT
+# =====================================================
+def http_get(url, headers=None, params=None, timeout=30):
+    """requests.get for TWITTER_SOURCE=live, recording or replaying otherwise."""
+    if TWITTER_SOURCE == "replay":
+        return replay_get(url, params)
+
+    response = requests.get(url, headers=headers, params=params, timeout=timeout)
+    if TWITTER_SOURCE == "record":
+        save_fixture(fixture_key(url, params), response)
+    return response
@@ -0,0 +1,161 @@
+"""
+BrandPulse Clean – Synthetic Bronze Generator
+=============================================
+Builds bronze_raw_reddit_data documents shaped like the ones
+pipeline/bronze/reddit_ingest.py writes, for benchmarking silver and gold
+without Reddit access.
+
+Source: New. Knobs:
+    posts, comments_per_post  – volume (comments vary ±50% per post)
+    min_words, max_words      – text length range for posts and comments
+    duplicate_ratio           – share of posts/comments repeating an
+                                earlier text verbatim (crossposts, spam)
+    nested_ratio              – share of comments in the old listing
+                                format ({"kind": "t1", "data": {...}});
+                                the rest are flat. Both are unified by
+                                detect_comment_format().
+    noise_ratio               – share of comments silver drops as
+                                ineligible ([deleted], AutoModerator,
+                                < 5 words)
+
+The same seed always produces the same documents.
+"""
+
+import random
+from datetime import datetime, timedelta, timezone
+
+_POSITIVE = (
+    "great", "love", "excellent", "amazing", "fantastic", "reliable", "smooth",
+    "happy", "impressed", "recommend", "solid", "fast", "beautiful", "worth",
+)
+_NEGATIVE = (
+    "terrible", "hate", "awful", "broken", "slow", "disappointed", "refund",
+    "worst", "overpriced", "buggy", "useless", "annoying", "crashes", "scam",
+)
+_NEUTRAL = (
+    "the", "a", "it", "this", "my", "battery", "screen", "update", "price",
+    "store", "camera", "week", "app", "support", "model", "version", "today",
+    "after", "with", "and", "for", "about", "since", "new", "old", "still",
+    "just", "got", "using", "compared", "setup", "delivery", "case", "review",
+)
+_SUBREDDITS = ("r/technology", "r/gadgets", "r/apple", "r/android", "r/BuyItForLife", "r/assholedesign")
+
+
+class _TextSource:
+    """Random sentences around a keyword, with verbatim repeats at duplicate_ratio."""
+
+    def __init__(self, rng, keyword, min_words, max_words, duplicate_ratio):
+        self.rng = rng
+        self.keyword = keyword
+        self.min_words = min_words
+        self.max_words = max_words
+        self.duplicate_ratio = duplicate_ratio
+        self.seen = []
+
+    def sentence(self, words=None):
+        if self.seen and self.rng.random() < self.duplicate_ratio:
+            return self.rng.choice(self.seen)
+
+        count = words or self.rng.randint(self.min_words, self.max_words)
+        tone = self.rng.choice((_POSITIVE, _NEGATIVE, _NEUTRAL))
+        picked = [
+            self.rng.choice(tone) if self.rng.random() < 0.25 else self.rng.choice(_NEUTRAL)
+            for _ in range(max(count - 1, 0))
+        ]
+        picked.insert(self.rng.randint(0, len(picked)), self.keyword)
+        text = " ".join(picked).capitalize() + "."
+        self.seen.append(text)
+        return text
+
+
+def _comment(rng, text, created_utc, index, post_name, noise_ratio, nested_ratio):
+    author = f"user_{rng.randint(1, 50000)}"
+    body = text
+    if rng.random() < noise_ratio:
+        kind = rng.randrange(3)
+        if kind == 0:
+            author = "[deleted]"
+        elif kind == 1:
+            author = "AutoModerator"
+        else:
+            body = "this"
+
+    fields = {
+        "id": f"{post_name}_c{index}",
+        "body": body,
+        "author": author,
+        "score": rng.randint(-5, 500),
+        "created_utc": created_utc,
+    }
+    if rng.random() < nested_ratio:
+        return {"kind": "t1", "data": fields}
+    return fields
+
+
+def generate_docs(request_id, keyword="benchmark", posts=200, comments_per_post=10,
+                  min_words=8, max_words=60, duplicate_ratio=0.1, nested_ratio=0.3,
+                  noise_ratio=0.1, seed=42, start=None, days=30):
+    """
+    Generate bronze Reddit documents for one request.
+
+    Parameters
+    ----------
+    request_id : int
+        global_keyword_id stamped on every document.
+    start : datetime, optional
+        Earliest post time (default: 2026-01-01 UTC). Posts are spread
+        over ``days`` days; comments follow their post by up to 2 days.
+
+    Returns
+    -------
+    list of dict
+        Documents without ``_id`` (MongoDB assigns it on insert).
+    """
+    rng = random.Random(seed)
+    text = _TextSource(rng, keyword, min_words, max_words, duplicate_ratio)
+    start = start or datetime(2026, 1, 1, tzinfo=timezone.utc)
+    fetched_at = datetime.now(timezone.utc)
+
+    docs = []
+    for i in range(posts):
+        name = f"t3_bench{seed}_{i}"
+        created = start + timedelta(seconds=rng.randint(0, days * 86400))
+        n_comments = max(0, round(comments_per_post * rng.uniform(0.5, 1.5)))
+        comments = [
+            _comment(
+                rng, text.sentence(),
+                (created + timedelta(seconds=rng.randint(60, 2 * 86400))).timestamp(),
+                c, name, noise_ratio, nested_ratio,
+            )
+            for c in range(n_comments)
+        ]
+        subreddit = rng.choice(_SUBREDDITS)
+
+        docs.append({
+            "platform": "reddit",
+            "keyword": keyword,
+            "fetched_at": fetched_at,
+            "raw_post": {
+                "title": text.sentence(words=rng.randint(5, 15)),
+                "selftext": text.sentence() if rng.random() < 0.8 else "",
+                "author": f"user_{rng.randint(1, 50000)}",
+                "score": rng.randint(0, 5000),
+                "created_utc": created.timestamp(),
+                "url": f"https://www.reddit.com/{subreddit}/comments/bench{seed}_{i}/",
+            },
+            "raw_comments": comments,
+            "meta": {
+                "external_id": name,
+                "subreddit": subreddit[2:],
+                "api_endpoint": "benchmark.generator",
+                "response_status": 200,
+            },
+            "global_keyword_id": int(request_id),
+            "silver_processed": False,
+        })
+    return docs
+
+
+def count_texts(docs):
+    """(post count, comment count) in generated documents, before silver filtering."""
+    return len(docs), sum(len(d["raw_comments"]) for d in docs)
@@ -0,0 +1,216 @@
+"""
+BrandPulse Clean – Inference Scaling Benchmark
+==============================================
+Measures sentiment throughput against core count for in-process torch
+threading and for the forked inference pool.
+
+Source: New. Companion to pipeline/silver/inference_pool.py.
+
+    python -m benchmarks.inference_scaling --cores 1,2,4,8,16
+    python -m benchmarks.inference_scaling --cores 4,8,16 --threads-per-worker 2 --callers 4
+
+For every core count C it runs up to three layouts:
+    threads – one process, torch.set_num_threads(C)     (run_sentiment_batch)
+    procs   – C pinned workers x 1 thread               (InferencePool)
+    hybrid  – C / --threads-per-worker pinned workers x --threads-per-worker
+              threads (only with --threads-per-worker > 1)
+
+Every measurement runs in a fresh interpreter, so no layout inherits
+another's torch thread pools (which also must not exist before the pool
+forks). Texts come from the synthetic generator (same seed, same texts),
+the result cache is disabled, and --callers threads submit batches of
+--batch texts concurrently, like queue-worker jobs sharing one process.
+
+Reported per run: texts/s, speedup over threads@1, parallel efficiency
+(speedup / cores), p50/p95 batch latency, startup time (model load,
+plus fork for the pool) and peak RSS of the parent and of the largest
+worker. Workers share the weights copy-on-write, so the RSS of a worker
+counts those shared pages as well; the real extra memory per worker is
+well below it.
+"""
+
+import argparse
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import threading
+import time
+
+from benchmarks.generator import _TextSource
+from utils.metrics import percentile
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.inference_scaling", description=__doc__.split("\n\n")[0],
+    )
+    parser.add_argument("--cores", default="1,2,4,8,16", help="comma-separated core counts")
+    parser.add_argument("--texts", type=int, default=4000, help="texts scored per run")
+    parser.add_argument("--batch", type=int, default=250, help="texts per call (a silver batch)")
+    parser.add_argument("--callers", type=int, default=1, help="threads submitting batches concurrently")
+    parser.add_argument("--threads-per-worker", type=int, default=1, help="threads per worker for the hybrid layout")
+    parser.add_argument("--min-chunk", type=int, help="InferencePool min_chunk (default: INFERENCE_MIN_CHUNK)")
+    parser.add_argument("--min-words", type=int, default=8)
+    parser.add_argument("--max-words", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", help="also write the results to this file")
+    # Internal: one measurement in this interpreter, printed as JSON
+    parser.add_argument("--measure", nargs=3, metavar=("LAYOUT", "WORKERS", "THREADS"), help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def _texts(args):
+    source = _TextSource(random.Random(args.seed), "benchmark", args.min_words, args.max_words, 0.0)
+    return [source.sentence() for _ in range(args.texts)]
+
+
+def _drive(score, texts, batch, callers):
+    """Score ``texts`` in batches from ``callers`` threads; returns (seconds, batch latencies ms)."""
+    batches = [texts[i:i + batch] for i in range(0, len(texts), batch)]
+    latencies = []
+    lock = threading.Lock()
+    next_batch = iter(batches)
+
+    def caller():
+        while True:
+            with lock:
+                chunk = next(next_batch, None)
+            if chunk is None:
+                return
+            started = time.perf_counter()
+            score(chunk)
+            with lock:
+                latencies.append((time.perf_counter() - started) * 1000)
+
+    threads = [threading.Thread(target=caller) for _ in range(max(1, callers))]
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return time.perf_counter() - started, latencies
+
+
+def _measure(args):
+    """Run one layout in this interpreter and print its result as JSON."""
+    layout, workers, threads = args.measure[0], int(args.measure[1]), int(args.measure[2])
+    import torch
+
+    from config.settings import INFERENCE_MIN_CHUNK
+    from pipeline.silver import sentiment
+    from pipeline.silver.inference_pool import InferencePool
+
+    texts = _texts(args)
+    started = time.perf_counter()
+    pool = None
+    if layout == "threads":
+        torch.set_num_threads(threads)
+        sentiment._get_sentiment_pipeline()
+        score = sentiment._score_texts
+    else:
+        pool = InferencePool(
+            workers, threads_per_worker=threads, pin_cores=True,
+            min_chunk=args.min_chunk or INFERENCE_MIN_CHUNK,
+        )
+        score = pool.score
+    # One warm-up call per worker, outside the timing
+    _drive(score, texts[:args.batch], max(1, args.batch // max(workers, 1)), workers)
+    startup_s = time.perf_counter() - started
+
+    try:
+        elapsed, latencies = _drive(score, texts, args.batch, args.callers)
+    finally:
+        if pool is not None:
+            pool.close()
+
+    print(json.dumps({
+        "layout": layout,
+        "workers": workers,
+        "threads": threads,
+        "cores": workers * threads,
+        "texts": len(texts),
+        "seconds": round(elapsed, 3),
+        "texts_per_s": round(len(texts) / max(elapsed, 1e-9), 1),
+        "batch_p50_ms": round(percentile(latencies, 50), 1),
+        "batch_p95_ms": round(percentile(latencies, 95), 1),
+        "startup_s": round(startup_s, 2),
+        "parent_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "worker_rss_mb": round(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024, 1),
+    }))
+    return 0
+
+
+def _plan(args):
+    """(layout, workers, threads) for every requested core count."""
+    runs = []
+    for cores in (int(c) for c in args.cores.split(",") if c.strip()):
+        runs.append(("threads", 1, cores))
+        runs.append(("procs", cores, 1))
+        tpw = args.threads_per_worker
+        if tpw > 1 and cores >= tpw and cores % tpw == 0:
+            runs.append(("hybrid", cores // tpw, tpw))
+    return runs
+
+
+def _run_one(argv, layout, workers, threads):
+    env = dict(os.environ, SENTIMENT_CACHE_PATH="", TOKENIZERS_PARALLELISM="false")
+    cmd = [sys.executable, "-m", "benchmarks.inference_scaling", *argv,
+           "--measure", layout, str(workers), str(threads)]
+    proc = subprocess.run(cmd, env=env, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"{layout} {workers}x{threads} failed:\n{proc.stderr.strip()}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def format_results(results):
+    """Render the scaling table."""
+    base = next((r for r in results if r["layout"] == "threads" and r["cores"] == 1), None)
+    lines = ["", "INFERENCE SCALING", "================="]
+    lines.append(
+        f"  {'cores':>5} {'layout':<8} {'procs x thr':>11} {'texts/s':>9} {'speedup':>8} {'eff':>6} "
+        f"{'p50 ms':>8} {'p95 ms':>8} {'start s':>8} {'rss MB':>13}"
+    )
+    for r in results:
+        speedup = r["texts_per_s"] / base["texts_per_s"] if base else None
+        speedup_s = "n/a" if speedup is None else f"{speedup:.2f}x"
+        eff_s = "n/a" if speedup is None else f"{speedup / r['cores']:.0%}"
+        rss = f"{r['parent_rss_mb']:.0f}/{r['worker_rss_mb']:.0f}" if r["layout"] != "threads" else f"{r['parent_rss_mb']:.0f}"
+        lines.append(
+            f"  {r['cores']:>5} {r['layout']:<8} {str(r['workers']) + ' x ' + str(r['threads']):>11} "
+            f"{r['texts_per_s']:>9} {speedup_s:>8} {eff_s:>6} "
+            f"{r['batch_p50_ms']:>8} {r['batch_p95_ms']:>8} {r['startup_s']:>8} {rss:>13}"
+        )
+    lines.append("")
+    lines.append("rss MB: parent, or parent/largest worker (shared weights counted in both).")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    args = _parse_args(argv)
+    if args.measure:
+        return _measure(args)
+
+    available = len(os.sched_getaffinity(0))
+    results = []
+    for layout, workers, threads in _plan(args):
+        if workers * threads > available:
+            print(f"[BENCH] Skipping {layout} {workers}x{threads}: only {available} cores available.")
+            continue
+        print(f"[BENCH] {layout} {workers}x{threads} ...", flush=True)
+        results.append(_run_one(argv, layout, workers, threads))
+
+    print(format_results(results))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"params": {k: v for k, v in vars(args).items() if k not in ("json", "measure")},
+                       "results": results}, f, indent=2, sort_keys=True)
+            f.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
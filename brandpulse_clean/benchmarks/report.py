@@ -0,0 +1,152 @@
+"""
+BrandPulse Clean – Benchmark Report
+===================================
+Turns one benchmark run into headline numbers and compares them with a
+stored baseline.
+
+Source: New. Used by benchmarks/run.py.
+
+Headline metrics (direction used for the comparison):
+    silver_docs_per_s, silver_texts_per_s, gold_facts_per_s – higher is better
+    batch_p50_ms, batch_p95_ms, peak_rss_mb               – lower is better
+
+A metric regresses when it is worse than the baseline by more than the
+tolerance (default 10%). Baselines record the run parameters; comparing
+runs with different parameters prints a warning.
+"""
+
+import json
+import platform
+from pathlib import Path
+
+from utils.metrics import percentile
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+HIGHER_IS_BETTER = ("silver_docs_per_s", "silver_texts_per_s", "gold_facts_per_s")
+LOWER_IS_BETTER = ("batch_p50_ms", "batch_p95_ms", "peak_rss_mb")
+
+
+def _rate(count, seconds):
+    return round(count / seconds, 2) if seconds else None
+
+
+def build_report(params, silver, silver_s, gold_facts, gold_s, batch_ms, peak_rss_kb, model_load_s):
+    """
+    Collect the headline metrics of one run.
+
+    Parameters
+    ----------
+    params : dict
+        Generator and runner parameters (stored with baselines).
+    silver : dict
+        Summary returned by run_silver().
+    batch_ms : list of float
+        End-to-end latency of every silver batch.
+    peak_rss_kb : int
+        ru_maxrss of the process (kilobytes on Linux).
+    """
+    return {
+        "params": params,
+        "host": {"python": platform.python_version(), "machine": platform.machine()},
+        "metrics": {
+            "silver_docs_per_s": _rate(silver["docs"], silver_s),
+            "silver_texts_per_s": _rate(silver["texts"], silver_s),
+            "gold_facts_per_s": _rate(gold_facts, gold_s),
+            "batch_p50_ms": percentile(batch_ms, 50),
+            "batch_p95_ms": percentile(batch_ms, 95),
+            "peak_rss_mb": round(peak_rss_kb / 1024.0, 1),
+        },
+        "details": {
+            "silver_s": round(silver_s, 3),
+            "gold_s": round(gold_s, 3),
+            "model_load_s": round(model_load_s, 3),
+            "docs": silver["docs"],
+            "texts": silver["texts"],
+            "posts": silver["posts"],
+            "comments": silver["comments"],
+            "batches": silver["batches"],
+            "gold_facts": gold_facts,
+            "stages": silver["stages"],
+            "queues": silver["queues"],
+        },
+    }
+
+
+def compare(report, baseline, tolerance=0.10):
+    """
+    Compare headline metrics with a baseline report.
+
+    Returns
+    -------
+    list of dict
+        One row per metric: name, current, baseline, change (fraction,
+        positive = better) and regressed (bool).
+    """
+    rows = []
+    for name in HIGHER_IS_BETTER + LOWER_IS_BETTER:
+        current = report["metrics"].get(name)
+        base = baseline["metrics"].get(name)
+        if current is None or not base:
+            rows.append({"name": name, "current": current, "baseline": base, "change": None, "regressed": False})
+            continue
+        if name in LOWER_IS_BETTER:
+            change = (base - current) / base
+        else:
+            change = (current - base) / base
+        rows.append({
+            "name": name,
+            "current": current,
+            "baseline": base,
+            "change": round(change, 4),
+            "regressed": change < -tolerance,
+        })
+    return rows
+
+
+def format_report(report, comparison=None, baseline=None):
+    """Render a report (and optional baseline comparison) as plain text."""
+    lines = ["", "BENCHMARK RESULTS", "================="]
+    details = report["details"]
+    lines.append(
+        f"{details['docs']} docs / {details['texts']} texts in {details['batches']} batches; "
+        f"silver {details['silver_s']}s, gold {details['gold_s']}s, model load {details['model_load_s']}s"
+    )
+    lines.append(f"Stage busy time (s): {details['stages']}")
+    lines.append("")
+
+    if comparison is None:
+        for name, value in report["metrics"].items():
+            lines.append(f"  {name:<20} {value}")
+        lines.append("")
+        lines.append("No baseline to compare against (save one with --save-baseline).")
+        return "\n".join(lines)
+
+    if baseline and baseline.get("params") != report["params"]:
+        lines.append("WARNING: baseline was recorded with different parameters:")
+        lines.append(f"  baseline: {baseline.get('params')}")
+        lines.append(f"  current:  {report['params']}")
+        lines.append("")
+
+    lines.append(f"  {'metric':<20} {'current':>12} {'baseline':>12} {'change':>9}")
+    for row in comparison:
+        change = "n/a" if row["change"] is None else f"{row['change']:+.1%}"
+        flag = "  REGRESSION" if row["regressed"] else ""
+        lines.append(f"  {row['name']:<20} {str(row['current']):>12} {str(row['baseline']):>12} {change:>9}{flag}")
+    return "\n".join(lines)
+
+
+def load_baseline(path=DEFAULT_BASELINE):
+    """Return the stored baseline report, or None if there is none."""
+    path = Path(path)
+    if not path.exists():
+        return None
+    with path.open() as f:
+        return json.load(f)
+
+
+def save_report(report, path=DEFAULT_BASELINE):
+    """Write a report as JSON (used for baselines and --json output)."""
+    with Path(path).open("w") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+        f.write("\n")
@@ -0,0 +1,197 @@
+"""
+BrandPulse Clean – End-to-End Benchmark Runner
+==============================================
+Generates synthetic bronze documents, drives run_silver() and
+run_reddit_gold() over them, and reports throughput, batch latency and
+peak memory against a stored baseline.
+
+Source: New.
+
+    python -m benchmarks.run --posts 500 --comments 10 --mongomock
+    python -m benchmarks.run --posts 500 --save-baseline
+    python -m benchmarks.run --posts 500 --fail-on-regression
+
+Isolation:
+    Postgres – every run creates a throwaway schema bench_<pid> in the
+               POSTGRES_DSN database from benchmarks/schema.sql, points
+               every connection at it through PGOPTIONS (search_path), and
+               drops it afterwards (--keep to inspect it).
+    MongoDB  – --mongomock swaps the shared client in database/mongo.py for
+               an in-memory mongomock client (pip install mongomock).
+               Without it the documents go to MONGO_URI under a dedicated
+               request ID and are deleted afterwards; use a scratch
+               instance.
+
+The sentiment cache is disabled (SENTIMENT_CACHE_PATH="") unless
+--with-cache is given, so repeated runs measure the model. Model load
+time is measured by a warm-up call and reported separately.
+"""
+
+import argparse
+import os
+import resource
+import sys
+import time
+from pathlib import Path
+
+from benchmarks import generator, report
+
+SCHEMA_FILE = Path(__file__).resolve().parent / "schema.sql"
+DEFAULT_REQUEST_ID = 2_000_000_000
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--posts", type=int, default=200)
+    parser.add_argument("--comments", type=int, default=10, help="mean comments per post")
+    parser.add_argument("--min-words", type=int, default=8)
+    parser.add_argument("--max-words", type=int, default=60)
+    parser.add_argument("--duplicate-ratio", type=float, default=0.1)
+    parser.add_argument("--nested-ratio", type=float, default=0.3, help="share of listing-format comments")
+    parser.add_argument("--noise-ratio", type=float, default=0.1, help="share of ineligible comments")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--batch-size", type=int, help="run_silver batch size (default: SILVER_BATCH_SIZE)")
+    parser.add_argument("--request-id", type=int, default=DEFAULT_REQUEST_ID)
+    parser.add_argument("--mongomock", action="store_true", help="use an in-memory MongoDB")
+    parser.add_argument("--with-cache", action="store_true", help="keep the sentiment cache enabled")
+    parser.add_argument("--keep", action="store_true", help="keep the benchmark Postgres schema")
+    parser.add_argument("--baseline", default=str(report.DEFAULT_BASELINE))
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.10)
+    parser.add_argument("--fail-on-regression", action="store_true")
+    parser.add_argument("--json", help="also write the report to this file")
+    return parser.parse_args(argv)
+
+
+def _setup_postgres(schema, request_id, keyword):
+    from database.postgres import get_pg_connection
+
+    conn = get_pg_connection(autocommit=True, pooled=False)
+    try:
+        with conn.cursor() as cur:
+            cur.execute(f"CREATE SCHEMA {schema}")
+            cur.execute(f"SET search_path TO {schema}")
+            cur.execute(SCHEMA_FILE.read_text())
+            cur.execute(
+                "INSERT INTO global_keywords (global_keyword_id, keyword, status) VALUES (%s, %s, 'PROCESSING')",
+                (request_id, keyword),
+            )
+    finally:
+        conn.close()
+
+
+def _drop_postgres(schema):
+    from database.postgres import get_pg_connection
+
+    conn = get_pg_connection(autocommit=True, pooled=False)
+    try:
+        with conn.cursor() as cur:
+            cur.execute(f"DROP SCHEMA IF EXISTS {schema} CASCADE")
+    finally:
+        conn.close()
+
+
+def _setup_mongo(use_mongomock):
+    from database import mongo
+
+    if use_mongomock:
+        try:
+            import mongomock
+        except ImportError:
+            raise RuntimeError("--mongomock needs the mongomock package (pip install mongomock)")
+        mongo._client = mongomock.MongoClient()
+    return mongo.get_mongo_collections()[0]
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+    schema = f"bench_{os.getpid()}"
+
+    # Must be set before config.settings is imported / any connection opens
+    os.environ["PGOPTIONS"] = f"{os.environ.get('PGOPTIONS', '')} -c search_path={schema}".strip()
+    if not args.with_cache:
+        os.environ["SENTIMENT_CACHE_PATH"] = ""
+
+    from config.settings import SILVER_BATCH_SIZE
+    from pipeline.gold.reddit_aggregator import run_reddit_gold
+    from pipeline.silver.reddit_processor import run_silver
+    from pipeline.silver.sentiment import run_sentiment_batch
+    from utils import metrics
+
+    args.batch_size = args.batch_size or SILVER_BATCH_SIZE
+    params = {
+        "posts": args.posts, "comments": args.comments,
+        "min_words": args.min_words, "max_words": args.max_words,
+        "duplicate_ratio": args.duplicate_ratio, "nested_ratio": args.nested_ratio,
+        "noise_ratio": args.noise_ratio, "seed": args.seed,
+        "batch_size": args.batch_size, "mongomock": args.mongomock,
+        "with_cache": args.with_cache,
+    }
+    keyword = f"benchmark{args.seed}"
+    rid = args.request_id
+
+    bronze_col = _setup_mongo(args.mongomock)
+    if bronze_col.count_documents({"global_keyword_id": rid}, limit=1):
+        print(f"[BENCH] Bronze already has documents for request {rid}; pass another --request-id.")
+        return 2
+
+    _setup_postgres(schema, rid, keyword)
+    try:
+        docs = generator.generate_docs(
+            rid, keyword=keyword, posts=args.posts, comments_per_post=args.comments,
+            min_words=args.min_words, max_words=args.max_words,
+            duplicate_ratio=args.duplicate_ratio, nested_ratio=args.nested_ratio,
+            noise_ratio=args.noise_ratio, seed=args.seed,
+        )
+        bronze_col.insert_many(docs)
+        posts, comments = generator.count_texts(docs)
+        print(f"[BENCH] Loaded {posts} posts / {comments} comments into bronze (schema {schema}).")
+
+        started = time.perf_counter()
+        run_sentiment_batch(["Warming up the sentiment model before timing."])
+        model_load_s = time.perf_counter() - started
+
+        run, token = metrics.start_run()
+        try:
+            started = time.perf_counter()
+            silver = run_silver(rid, batch_size=args.batch_size)
+            silver_s = time.perf_counter() - started
+
+            started = time.perf_counter()
+            run_reddit_gold(keyword, rid)
+            gold_s = time.perf_counter() - started
+        finally:
+            metrics.end_run(token)
+
+        result = report.build_report(
+            params, silver, silver_s,
+            run.counters.get("gold.facts", 0), gold_s,
+            run.batches.get("silver.batch_ms", []),
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+            model_load_s,
+        )
+    finally:
+        if not args.mongomock:
+            bronze_col.delete_many({"global_keyword_id": rid})
+        if args.keep:
+            print(f"[BENCH] Kept schema {schema}.")
+        else:
+            _drop_postgres(schema)
+
+    baseline = report.load_baseline(args.baseline)
+    comparison = report.compare(result, baseline, args.tolerance) if baseline else None
+    print(report.format_report(result, comparison, baseline))
+
+    if args.json:
+        report.save_report(result, args.json)
+    if args.save_baseline:
+        report.save_report(result, args.baseline)
+        print(f"[BENCH] Baseline saved to {args.baseline}.")
+
+    if args.fail_on_regression and comparison and any(row["regressed"] for row in comparison):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
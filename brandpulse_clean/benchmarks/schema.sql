@@ -0,0 +1,141 @@
+-- =========================================================
+-- BrandPulse Clean – Benchmark Schema
+-- =========================================================
+-- Created by benchmarks/run.py in a throwaway schema (search_path is
+-- set to it), then dropped. Column sets match the live silver and gold
+-- tables the pipeline writes, which database/schema.sql does not fully
+-- describe yet.
+
+CREATE TABLE global_keywords (
+    global_keyword_id SERIAL PRIMARY KEY,
+    keyword VARCHAR(255) NOT NULL,
+    platform_id INT DEFAULT 1,
+    bronze_processed BOOLEAN DEFAULT FALSE,
+    created_at TIMESTAMP DEFAULT NOW(),
+    status VARCHAR(50) DEFAULT 'IDLE',
+    last_run_at TIMESTAMP,
+    user_id INT,
+    start_date DATE,
+    end_date DATE
+);
+
+CREATE TABLE silver_reddit_posts (
+    silver_post_id SERIAL PRIMARY KEY,
+    original_bronze_id VARCHAR(255) UNIQUE NOT NULL,
+    platform VARCHAR(50),
+    keyword VARCHAR(255),
+    global_keyword_id INT,
+    post_id VARCHAR(255),
+    title_clean TEXT,
+    body_clean TEXT,
+    author_hash VARCHAR(255),
+    subreddit_name VARCHAR(255),
+    post_url TEXT,
+    post_score INT,
+    upvote_ratio FLOAT,
+    total_comments INT,
+    post_sentiment_label VARCHAR(50),
+    post_sentiment_score FLOAT,
+    created_at_utc TIMESTAMPTZ,
+    processed_at_utc TIMESTAMPTZ,
+    gold_processed BOOLEAN DEFAULT FALSE,
+    date_id INT,
+    time_id INT,
+    model_name VARCHAR(255),
+    near_duplicate_of VARCHAR(64)
+);
+
+CREATE TABLE silver_reddit_comments (
+    silver_comment_id SERIAL PRIMARY KEY,
+    silver_post_id INT REFERENCES silver_reddit_posts(silver_post_id),
+    comment_id VARCHAR(255),
+    comment_body_clean TEXT,
+    author_hash VARCHAR(255),
+    comment_score INT,
+    comment_created_at_utc TIMESTAMPTZ,
+    comment_sentiment_label VARCHAR(50),
+    comment_sentiment_score FLOAT,
+    gold_processed BOOLEAN DEFAULT FALSE,
+    comment_date_id INT,
+    comment_time_id INT,
+    near_duplicate_of VARCHAR(64),
+    UNIQUE (silver_post_id, comment_id)
+);
+
+CREATE TABLE silver_reddit_comment_sentiment_summary (
+    silver_post_id INT PRIMARY KEY REFERENCES silver_reddit_posts(silver_post_id),
+    aggregated_label VARCHAR(50),
+    aggregated_score FLOAT,
+    gold_processed BOOLEAN DEFAULT FALSE
+);
+
+CREATE INDEX idx_silver_posts_keyword_date ON silver_reddit_posts (global_keyword_id, date_id);
+CREATE INDEX idx_silver_comments_post_date ON silver_reddit_comments (silver_post_id, comment_date_id);
+
+CREATE TABLE dim_sentiment (
+    sentiment_id INT PRIMARY KEY,
+    sentiment_label VARCHAR(50) NOT NULL,
+    sentiment_order INT
+);
+
+CREATE TABLE dim_date (
+    date_id INT PRIMARY KEY,
+    calendar_date DATE NOT NULL,
+    year INT,
+    month INT,
+    day INT,
+    week INT
+);
+
+CREATE TABLE dim_time (
+    time_id INT PRIMARY KEY,
+    hour INT,
+    minute INT
+);
+
+CREATE TABLE fact_sentiment_events (
+    fact_id SERIAL PRIMARY KEY,
+    silver_content_id BIGINT,
+    model_id INT,
+    platform_id INT,
+    content_type_id INT,
+    sentiment_id INT,
+    date_id INT,
+    time_id INT,
+    sentiment_score FLOAT,
+    created_at TIMESTAMP DEFAULT NOW(),
+    request_id INT,
+    CONSTRAINT fact_sentiment_events_unique_content UNIQUE (silver_content_id, model_id, platform_id, content_type_id)
+);
+
+CREATE TABLE gold_watermarks (
+    request_id INT NOT NULL,
+    platform_id INT NOT NULL,
+    content_type_id INT NOT NULL,
+    last_silver_id BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (request_id, platform_id, content_type_id)
+);
+
+CREATE TABLE gold_daily_sentiment_rollup (
+    request_id INT NOT NULL,
+    date_id INT NOT NULL,
+    platform_id INT NOT NULL,
+    content_type_id INT NOT NULL,
+    sentiment_id INT NOT NULL,
+    item_count BIGINT NOT NULL DEFAULT 0,
+    score_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+    PRIMARY KEY (request_id, date_id, platform_id, content_type_id, sentiment_id)
+);
+
+-- Dimension rows
+INSERT INTO dim_sentiment VALUES (1, 'Negative', -1), (2, 'Neutral', 0), (3, 'Positive', 1);
+
+INSERT INTO dim_date (date_id, calendar_date, year, month, day, week)
+SELECT TO_CHAR(d, 'YYYYMMDD')::INT, d, EXTRACT(YEAR FROM d), EXTRACT(MONTH FROM d),
+       EXTRACT(DAY FROM d), EXTRACT(WEEK FROM d)
+FROM generate_series(DATE '2020-01-01', DATE '2030-12-31', INTERVAL '1 day') AS g(d);
+
+INSERT INTO dim_time (time_id, hour, minute)
+SELECT h * 100 + m, h, m
+FROM generate_series(0, 23) AS h, generate_series(0, 59) AS m;
@@ -21,11 +21,23 @@ load_dotenv(dotenv_path=_ENV_PATH)
 # MongoDB
 # ---------------------------------------------------------------------------
 MONGO_URI: str = os.getenv("MONGO_URI", "mongodb://localhost:27017/BrandPulse_1")
+# Create the bronze/jobs/errors indexes when a worker starts
+# (database/mongo_indexes.py; also: python main.py --ensure-indexes).
+MONGO_ENSURE_INDEXES: bool = os.getenv("MONGO_ENSURE_INDEXES", "true").strip().lower() in ("1", "true", "yes")
 
 # ---------------------------------------------------------------------------
 # PostgreSQL
 # ---------------------------------------------------------------------------
 POSTGRES_DSN: str = os.getenv("POSTGRES_DSN", "")
+# Process-wide connection pool (database/postgres.py). Size it for the
+# busiest process: each concurrent pipeline run holds up to ~3
+# connections (silver writer, job heartbeat, short status updates).
+# 0 disables pooling (every call connects).
+PG_POOL_MAX_SIZE: int = int(os.getenv("PG_POOL_MAX_SIZE", "20"))
+# How long a checkout waits for a free connection before failing.
+PG_POOL_TIMEOUT_S: float = float(os.getenv("PG_POOL_TIMEOUT_S", "30"))
+# Connections idle at least this long are checked with SELECT 1 on checkout.
+PG_POOL_HEALTHCHECK_IDLE_S: float = float(os.getenv("PG_POOL_HEALTHCHECK_IDLE_S", "30"))
 
 # ---------------------------------------------------------------------------
 # Reddit API
@@ -34,6 +46,30 @@ REDDIT_CLIENT_ID: str = os.getenv("REDDIT_CLIENT_ID", "")
 REDDIT_CLIENT_SECRET: str = os.getenv("REDDIT_CLIENT_SECRET", "")
 REDDIT_USER_AGENT: str = os.getenv("REDDIT_USER_AGENT", "BrandPulse-Ingestor/1.0")
 
+# Bronze fetches comment trees on this many threads (one PRAW client each).
+REDDIT_COMMENT_WORKERS: int = int(os.getenv("REDDIT_COMMENT_WORKERS", "8"))
+# Request budget shared by all Reddit clients in one process. Reddit allows
+# 100 QPM per OAuth client; keep headroom for PRAW's own retries.
+REDDIT_REQUESTS_PER_MINUTE: float = float(os.getenv("REDDIT_REQUESTS_PER_MINUTE", "60"))
+
+# Where bronze gets Reddit data (pipeline/bronze/sources.py):
+#   live   – the Reddit API (default)
+#   record – the Reddit API, saving every response under SOURCE_FIXTURE_DIR
+#   replay – recorded responses only; no network access or credentials
+REDDIT_SOURCE: str = os.getenv("REDDIT_SOURCE", "live").strip().lower()
+SOURCE_FIXTURE_DIR: str = os.getenv(
+    "SOURCE_FIXTURE_DIR",
+    str(Path(__file__).resolve().parent.parent / "fixtures" / "sources"),
+)
+# Replay timing: each replayed response waits LATENCY ± JITTER milliseconds
+# (jitter is seeded per request, so repeated runs wait the same amounts).
+SOURCE_REPLAY_LATENCY_MS: float = float(os.getenv("SOURCE_REPLAY_LATENCY_MS", "0"))
+SOURCE_REPLAY_JITTER_MS: float = float(os.getenv("SOURCE_REPLAY_JITTER_MS", "0"))
+# Simulated API quota reported by replayed rate-limit headers: this many
+# requests per window, counted across every replay client in the process.
+SOURCE_REPLAY_RATE_LIMIT: int = int(os.getenv("SOURCE_REPLAY_RATE_LIMIT", "600"))
+SOURCE_REPLAY_RATE_WINDOW_S: float = float(os.getenv("SOURCE_REPLAY_RATE_WINDOW_S", "600"))
+
 # ---------------------------------------------------------------------------
 # Sentiment Model
 # ---------------------------------------------------------------------------
@@ -43,3 +79,124 @@ SENTIMENT_MODEL: str = os.getenv(
     "SENTIMENT_MODEL",
     "ibrahimtime/bertweet-sentiment-finetuned",
 )
+
+# Inference runtime: "torch" (eager HuggingFace pipeline) or "onnx"
+# (onnxruntime on CPU, exported once and cached under ONNX_CACHE_DIR).
+SENTIMENT_BACKEND: str = os.getenv("SENTIMENT_BACKEND", "torch").strip().lower()
+ONNX_CACHE_DIR: str = os.getenv(
+    "ONNX_CACHE_DIR",
+    str(Path(__file__).resolve().parent.parent / ".cache" / "onnx"),
+)
+
+# Padded-token budget per forward pass. run_sentiment_batch() sorts texts by
+# token length and groups them so that (bucket size x longest text) stays
+# under this budget, instead of padding every text to the longest one.
+SENTIMENT_TOKEN_BUDGET: int = int(os.getenv("SENTIMENT_TOKEN_BUDGET", "4096"))
+
+# On-disk cache of sentiment results keyed by (model, normalized text hash).
+# Set SENTIMENT_CACHE_PATH to an empty string to disable the cache.
+SENTIMENT_CACHE_PATH: str = os.getenv(
+    "SENTIMENT_CACHE_PATH",
+    str(Path(__file__).resolve().parent.parent / ".cache" / "sentiment_cache.sqlite3"),
+)
+SENTIMENT_CACHE_MAX_ENTRIES: int = int(os.getenv("SENTIMENT_CACHE_MAX_ENTRIES", "500000"))
+
+# Lexicon cascade (pipeline/silver/cascade.py): texts the lexicon labels with
+# confidence >= SENTIMENT_CASCADE_THRESHOLD skip the model. Pick the threshold
+# with `python main.py --calibrate-cascade` before turning it on.
+SENTIMENT_CASCADE: bool = os.getenv("SENTIMENT_CASCADE", "false").strip().lower() in ("1", "true", "yes")
+SENTIMENT_CASCADE_THRESHOLD: float = float(os.getenv("SENTIMENT_CASCADE_THRESHOLD", "0.8"))
+# Optional JSON file of {"word": weight} that replaces the built-in lexicon.
+SENTIMENT_CASCADE_LEXICON: str = os.getenv("SENTIMENT_CASCADE_LEXICON", "")
+
+# Multi-process inference (pipeline/silver/inference_pool.py): the model is
+# loaded once, then this many worker processes are forked and share it
+# copy-on-write. 0 scores in-process. torch backend only.
+INFERENCE_WORKERS: int = int(os.getenv("INFERENCE_WORKERS", "0"))
+# torch intra-op threads per worker (workers x threads should not exceed cores).
+INFERENCE_THREADS_PER_WORKER: int = int(os.getenv("INFERENCE_THREADS_PER_WORKER", "1"))
+# Pin each worker to its own cores (sched_setaffinity).
+INFERENCE_PIN_CORES: bool = os.getenv("INFERENCE_PIN_CORES", "false").strip().lower() in ("1", "true", "yes")
+# Fewest texts sent to one worker; small batches use fewer workers.
+INFERENCE_MIN_CHUNK: int = int(os.getenv("INFERENCE_MIN_CHUNK", "32"))
+
+# ---------------------------------------------------------------------------
+# Silver Layer
+# ---------------------------------------------------------------------------
+# Bronze documents per silver batch (one inference call, one Postgres
+# transaction). Batches hold only projected fields and cleaned text, and
+# the model's own memory is bounded by SENTIMENT_TOKEN_BUDGET.
+SILVER_BATCH_SIZE: int = int(os.getenv("SILVER_BATCH_SIZE", "250"))
+# Max batches waiting between silver stages (fetch → inference → write).
+# Together with SILVER_BATCH_SIZE this bounds silver memory use.
+SILVER_QUEUE_DEPTH: int = int(os.getenv("SILVER_QUEUE_DEPTH", "2"))
+# Near-duplicate detection (pipeline/silver/near_duplicates.py): texts whose
+# MinHash similarity to an earlier text of the same keyword reaches
+# SILVER_DEDUP_THRESHOLD reuse its sentiment instead of being scored.
+SILVER_DEDUP: bool = os.getenv("SILVER_DEDUP", "false").strip().lower() in ("1", "true", "yes")
+SILVER_DEDUP_THRESHOLD: float = float(os.getenv("SILVER_DEDUP_THRESHOLD", "0.9"))
+# Signature length and LSH bands (bands must divide NUM_PERM). With 16 bands
+# of 8 rows, a pair at 0.9 similarity becomes a candidate 99.99% of the time
+# (0.8: ~95%); candidates are then checked against the threshold.
+SILVER_DEDUP_NUM_PERM: int = int(os.getenv("SILVER_DEDUP_NUM_PERM", "128"))
+SILVER_DEDUP_BANDS: int = int(os.getenv("SILVER_DEDUP_BANDS", "16"))
+# Shorter texts are always scored: a one-word change flips a short text.
+SILVER_DEDUP_MIN_CHARS: int = int(os.getenv("SILVER_DEDUP_MIN_CHARS", "40"))
+
+# ---------------------------------------------------------------------------
+# Pipeline Worker
+# ---------------------------------------------------------------------------
+# Unix socket the long-running worker (python main.py --worker) listens on.
+# routes/pipeline.js connects here when PIPELINE_WORKER_SOCKET is set.
+WORKER_SOCKET_PATH: str = os.getenv(
+    "WORKER_SOCKET_PATH",
+    "/tmp/brandpulse_worker.sock",
+)
+
+# ---------------------------------------------------------------------------
+# Job Queue (python main.py --queue-worker)
+# ---------------------------------------------------------------------------
+# Jobs run concurrently per queue-worker process. With
+# PIPELINE_SINGLE_FLIGHT on, a follower occupies its slot (and a dedicated
+# PostgreSQL connection) for up to FLIGHT_WAIT_SECONDS while it waits.
+PIPELINE_QUEUE_WORKERS: int = int(os.getenv("PIPELINE_QUEUE_WORKERS", "2"))
+# Idle workers poll pipeline_jobs this often.
+JOB_POLL_SECONDS: float = float(os.getenv("JOB_POLL_SECONDS", "2"))
+# Running jobs refresh heartbeat_at (and global_keywords.last_run_at) this often.
+JOB_HEARTBEAT_SECONDS: float = float(os.getenv("JOB_HEARTBEAT_SECONDS", "15"))
+# A running job whose heartbeat is older than this is considered dead and
+# is re-queued, or failed once it has used JOB_MAX_ATTEMPTS attempts.
+JOB_STALE_SECONDS: int = int(os.getenv("JOB_STALE_SECONDS", "120"))
+JOB_MAX_ATTEMPTS: int = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+# Jobs run concurrently by one async-queue-worker process (pipeline/aio).
+# Each waiting job is a suspended task, not a thread, so this can be far
+# higher than PIPELINE_QUEUE_WORKERS; keep PG_POOL_MAX_SIZE in step.
+AIO_QUEUE_WORKERS: int = int(os.getenv("AIO_QUEUE_WORKERS", "32"))
+
+# ---------------------------------------------------------------------------
+# Single-Flight Coalescing (pipeline/single_flight.py)
+# ---------------------------------------------------------------------------
+# Concurrent requests for the same keyword, platform and date range share
+# one Bronze/Silver run; followers copy the leader's silver results.
+# Off by default: every waiting follower holds a queue slot.
+PIPELINE_SINGLE_FLIGHT: bool = os.getenv("PIPELINE_SINGLE_FLIGHT", "false").strip().lower() in ("1", "true", "yes")
+# Followers check whether the leader has finished this often...
+FLIGHT_POLL_SECONDS: float = float(os.getenv("FLIGHT_POLL_SECONDS", "2"))
+# ...and run on their own after waiting this long.
+FLIGHT_WAIT_SECONDS: float = float(os.getenv("FLIGHT_WAIT_SECONDS", "300"))
+
+# ---------------------------------------------------------------------------
+# Silver Reuse (pipeline/silver/reddit_reuse.py)
+# ---------------------------------------------------------------------------
+# Copy earlier requests' silver results for the same keyword, model and
+# dates, and ingest only the dates they do not cover. Off by default.
+SILVER_REUSE: bool = os.getenv("SILVER_REUSE", "false").strip().lower() in ("1", "true", "yes")
+
+# ---------------------------------------------------------------------------
+# Streaming Bronze → Silver
+# ---------------------------------------------------------------------------
+# Score bronze documents while ingestion is still fetching comment trees,
+# instead of running Silver after Bronze has finished.
+PIPELINE_STREAMING: bool = os.getenv("PIPELINE_STREAMING", "true").strip().lower() in ("1", "true", "yes")
+# Documents written to MongoDB (and handed to Silver) per chunk.
+BRONZE_STREAM_CHUNK_SIZE: int = int(os.getenv("BRONZE_STREAM_CHUNK_SIZE", "5"))
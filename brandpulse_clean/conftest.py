@@ -0,0 +1 @@
+"""pytest puts this directory on sys.path, so tests import modules as main.py does."""
@@ -20,6 +20,7 @@ Collection names:
     - "bronze_raw_reddit_data"   → bronze_col
     - "bronze_ingestion_jobs"    → jobs_col
     - "bronze_errors"            → errors_col
+    - "silver_near_duplicates"   → get_near_duplicate_collection()
 """
 
 from pymongo import MongoClient
@@ -67,3 +68,10 @@ def get_mongo_collections():
     return bronze_col, jobs_col, errors_col
 
 
+def get_near_duplicate_collection():
+    """
+    Return the silver_near_duplicates collection: near-duplicate
+    representatives stored per keyword by
+    pipeline/silver/near_duplicates.py.
+    """
+    return _get_client()["BrandPulse_1"]["silver_near_duplicates"]
@@ -0,0 +1,196 @@
+"""
+BrandPulse Clean – MongoDB Indexes
+==================================
+Creates the indexes the Bronze and Silver queries rely on, and checks
+with explain() that those queries use them.
+
+Source: New. Run by the persistent and queue workers at startup, or by
+hand:
+
+    python main.py --ensure-indexes            # create missing indexes
+    python main.py --ensure-indexes --verify   # ...then explain the queries
+
+INDEXES:
+    bronze_raw_reddit_data
+        global_keyword_id, silver_processed, _id
+            run_silver(): the request's pending documents, paged by _id
+            (count_documents + find().sort("_id")).
+        platform, meta.external_id, keyword
+            ingest_keyword(): the upsert filter of every bronze document.
+    bronze_ingestion_jobs
+        global_keyword_id, started_at
+            a request's ingestion jobs, newest first.
+    bronze_errors
+        keyword, occurred_at
+            a keyword's recent ingestion errors.
+    silver_near_duplicates
+        keyword, model_name, bands
+            a batch's candidate representatives (multikey on bands).
+        keyword, model_name, text_hash (unique)
+            the upsert key of a stored representative.
+
+Equality on silver_processed only works for documents that have the
+field. Every writer sets it, but documents from before that are
+backfilled with silver_processed: false here, before the indexes are
+built.
+
+create_index() is a no-op for an index that already exists with the same
+keys and options, so ensure_indexes() is safe to run on every startup.
+"""
+
+import sys
+
+from pymongo import ASCENDING, DESCENDING
+from pymongo.errors import OperationFailure
+
+from database.mongo import get_mongo_collections, get_near_duplicate_collection
+from utils.logging import get_logger
+
+logger = get_logger("MONGO")
+
+BRONZE_INDEXES = [
+    ([("global_keyword_id", ASCENDING), ("silver_processed", ASCENDING), ("_id", ASCENDING)],
+     "request_pending"),
+    ([("platform", ASCENDING), ("meta.external_id", ASCENDING), ("keyword", ASCENDING)],
+     "upsert_key"),
+]
+
+JOBS_INDEXES = [
+    ([("global_keyword_id", ASCENDING), ("started_at", DESCENDING)], "request_started"),
+]
+
+ERRORS_INDEXES = [
+    ([("keyword", ASCENDING), ("occurred_at", DESCENDING)], "keyword_occurred"),
+]
+
+NEAR_DUPLICATE_INDEXES = [
+    ([("keyword", ASCENDING), ("model_name", ASCENDING), ("bands", ASCENDING)], "keyword_bands"),
+]
+
+
+def pending_filter(request_id):
+    """run_silver()'s filter for a request's unprocessed bronze documents."""
+    return {"global_keyword_id": int(request_id), "silver_processed": False}
+
+
+# Same keys already indexed under another name / with other options
+_INDEX_CONFLICT_CODES = (85, 86)
+
+
+def _create(collection, indexes):
+    for keys, name in indexes:
+        try:
+            collection.create_index(keys, name=name)
+        except OperationFailure as e:
+            if e.code not in _INDEX_CONFLICT_CODES:
+                raise
+            logger.warning("%s: keeping existing index on %s (%s)", collection.name, keys, e)
+
+
+def backfill_silver_processed(bronze_col):
+    """Set silver_processed: false on documents that predate the field."""
+    result = bronze_col.update_many(
+        {"silver_processed": {"$exists": False}},
+        {"$set": {"silver_processed": False}},
+    )
+    if result.modified_count:
+        logger.info("Backfilled silver_processed on %d bronze documents.", result.modified_count)
+    return result.modified_count
+
+
+def ensure_indexes():
+    """Backfill silver_processed, then create every missing index."""
+    bronze_col, jobs_col, errors_col = get_mongo_collections()
+    backfill_silver_processed(bronze_col)
+    _create(bronze_col, BRONZE_INDEXES)
+    _create(jobs_col, JOBS_INDEXES)
+    _create(errors_col, ERRORS_INDEXES)
+    near_duplicate_col = get_near_duplicate_collection()
+    _create(near_duplicate_col, NEAR_DUPLICATE_INDEXES)
+    try:
+        near_duplicate_col.create_index(
+            [("keyword", ASCENDING), ("model_name", ASCENDING), ("text_hash", ASCENDING)],
+            name="representative_key", unique=True,
+        )
+    except OperationFailure as e:
+        if e.code not in _INDEX_CONFLICT_CODES:
+            raise
+        logger.warning("silver_near_duplicates: keeping existing representative index (%s)", e)
+    logger.info("MongoDB indexes ensured.")
+
+
+def _stages(plan):
+    """Every stage name in an explain() plan tree."""
+    stages = [plan.get("stage")]
+    for child in ("inputStage", "queryPlan"):
+        if child in plan:
+            stages.extend(_stages(plan[child]))
+    for sub in plan.get("inputStages", []):
+        stages.extend(_stages(sub))
+    return [s for s in stages if s]
+
+
+def _winning_plan(explained):
+    planner = explained.get("queryPlanner", {})
+    return planner.get("winningPlan", {})
+
+
+def check_plan(explained):
+    """
+    Judge one explain() document.
+
+    Returns
+    -------
+    tuple : (stages, ok)
+        The winning plan's stage names (classic or SBE ``queryPlan``),
+        and whether it uses an IXSCAN with no COLLSCAN or in-memory SORT.
+    """
+    stages = _stages(_winning_plan(explained))
+    ok = "IXSCAN" in stages and "COLLSCAN" not in stages and "SORT" not in stages
+    return stages, ok
+
+
+def verify_indexes(request_id=0):
+    """
+    Explain the indexed queries and report the winning plan of each.
+
+    Returns
+    -------
+    list of dict
+        One row per query: name, stages and ok (an IXSCAN and no
+        COLLSCAN or in-memory SORT).
+    """
+    bronze_col, jobs_col, errors_col = get_mongo_collections()
+    queries = {
+        "silver.pending": bronze_col.find(pending_filter(request_id)).sort("_id", ASCENDING).limit(50),
+        "bronze.upsert": bronze_col.find(
+            {"platform": "reddit", "meta.external_id": "t3_explain", "keyword": "explain"}
+        ),
+        "jobs.by_request": jobs_col.find({"global_keyword_id": int(request_id)}).sort("started_at", DESCENDING),
+        "errors.by_keyword": errors_col.find({"keyword": "explain"}).sort("occurred_at", DESCENDING),
+    }
+
+    rows = []
+    for name, cursor in queries.items():
+        stages, ok = check_plan(cursor.explain())
+        rows.append({"name": name, "stages": stages, "ok": ok})
+    return rows
+
+
+def main(argv=None):
+    """CLI: --ensure-indexes [--verify]. Exit code 1 if a query is not indexed."""
+    argv = sys.argv[1:] if argv is None else argv
+    ensure_indexes()
+    if "--verify" not in argv:
+        return 0
+
+    failed = False
+    for row in verify_indexes():
+        status = "OK  " if row["ok"] else "FAIL"
+        print(f"[MONGO] {status} {row['name']:<18} {' <- '.join(row['stages'])}")
+        failed = failed or not row["ok"]
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
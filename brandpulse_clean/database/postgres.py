@@ -16,16 +16,253 @@ CRITICAL ARCHITECTURAL FIX:
     In this clean version, the connection is created INSIDE a function
     and returned to the caller. The caller controls commit/rollback
     and closing the connection.
+
+CONNECTION POOL:
+    get_pg_connection() checks connections out of a process-wide pool
+    (PgPool) instead of connecting every time. Each connect costs a TLS
+    handshake and authentication on managed Postgres, and a run used to do
+    that a dozen times. close() on a pooled connection hands it back:
+    open transactions are rolled back and the connection is kept for the
+    next caller. Callers are unchanged.
+
+    - At most PG_POOL_MAX_SIZE connections exist; further checkouts wait
+      up to PG_POOL_TIMEOUT_S, then raise PoolTimeout.
+    - A connection idle longer than PG_POOL_HEALTHCHECK_IDLE_S is checked
+      with SELECT 1 before it is handed out, and replaced if it is dead.
+    - Broken connections are discarded on return, never reused.
+    - get_pool_stats() reports checkouts, waits and hold times for tuning.
+    - A forked child never reuses its parent's connections.
+
+    Connections whose session state must end with the caller (advisory
+    locks, SET search_path) use get_pg_connection(pooled=False).
+    PG_POOL_MAX_SIZE=0 disables pooling.
 """
 
+import os
+import threading
+import time
+from contextlib import contextmanager
+
 import psycopg2
+from psycopg2 import extensions
+
+from config.settings import (
+    PG_POOL_HEALTHCHECK_IDLE_S,
+    PG_POOL_MAX_SIZE,
+    PG_POOL_TIMEOUT_S,
+    POSTGRES_DSN,
+)
+
+
+class PoolTimeout(RuntimeError):
+    """No pooled connection became free within PG_POOL_TIMEOUT_S."""
+
+
+def _connect(autocommit: bool = False):
+    if not POSTGRES_DSN:
+        raise RuntimeError(
+            "POSTGRES_DSN is not set. "
+            "Check your .env file or config/settings.py."
+        )
 
-from config.settings import POSTGRES_DSN
+    conn = psycopg2.connect(POSTGRES_DSN)
+    conn.autocommit = autocommit
+    return conn
 
 
-def get_pg_connection(autocommit: bool = False):
+class PooledConnection:
+    """
+    A checked-out psycopg2 connection. Behaves like the connection itself
+    (cursor, commit, rollback, autocommit, ...) except that close()
+    returns it to the pool.
     """
-    Create and return a new psycopg2 connection.
+
+    def __init__(self, pool, conn):
+        object.__setattr__(self, "_pool", pool)
+        object.__setattr__(self, "_conn", conn)
+        object.__setattr__(self, "_checked_out", time.perf_counter())
+
+    def __getattr__(self, name):
+        conn = object.__getattribute__(self, "_conn")
+        if conn is None:
+            raise psycopg2.InterfaceError("connection already returned to the pool")
+        return getattr(conn, name)
+
+    def __setattr__(self, name, value):
+        setattr(self._conn, name, value)
+
+    @property
+    def closed(self):
+        return 1 if self._conn is None else self._conn.closed
+
+    def close(self):
+        """Return the connection to the pool (idempotent)."""
+        conn = self._conn
+        if conn is None:
+            return
+        object.__setattr__(self, "_conn", None)
+        self._pool.release(conn, time.perf_counter() - self._checked_out)
+
+
+class PgPool:
+    """Bounded, thread-safe LIFO pool of psycopg2 connections."""
+
+    def __init__(self, max_size, timeout_s, healthcheck_idle_s):
+        self.max_size = max_size
+        self.timeout_s = timeout_s
+        self.healthcheck_idle_s = healthcheck_idle_s
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._lock = threading.Lock()
+        self._idle = []  # (connection, returned_at), most recent last
+        self._pid = os.getpid()
+        self._orphans = []
+        self._stats = {
+            "created": 0, "reused": 0, "discarded": 0, "health_check_failures": 0,
+            "checkouts": 0, "waits": 0, "timeouts": 0,
+            "wait_s": 0.0, "max_wait_s": 0.0, "hold_s": 0.0, "max_hold_s": 0.0,
+        }
+
+    def _check_fork(self):
+        # A forked child shares its parent's sockets; using or closing them
+        # would break the parent's sessions, so the child only forgets them.
+        if os.getpid() != self._pid:
+            with self._lock:
+                self._orphans.extend(conn for conn, _ in self._idle)
+                self._idle = []
+                self._slots = threading.BoundedSemaphore(self.max_size)
+                self._pid = os.getpid()
+
+    def _healthy(self, conn, returned_at):
+        if conn.closed:
+            return False
+        if time.monotonic() - returned_at < self.healthcheck_idle_s:
+            return True
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            if not conn.autocommit:
+                conn.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    def _discard(self, conn):
+        with self._lock:
+            self._stats["discarded"] += 1
+        try:
+            conn.close()
+        except psycopg2.Error:
+            pass
+
+    def acquire(self, autocommit=False):
+        """Check out a connection, waiting for a free slot if needed."""
+        self._check_fork()
+        started = time.perf_counter()
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._stats["waits"] += 1
+            if not self._slots.acquire(timeout=self.timeout_s):
+                with self._lock:
+                    self._stats["timeouts"] += 1
+                raise PoolTimeout(
+                    f"No PostgreSQL connection free after {self.timeout_s}s "
+                    f"(PG_POOL_MAX_SIZE={self.max_size})"
+                )
+        waited = time.perf_counter() - started
+
+        try:
+            conn = None
+            while conn is None:
+                with self._lock:
+                    idle = self._idle.pop() if self._idle else None
+                if idle is None:
+                    conn = _connect(autocommit)
+                    with self._lock:
+                        self._stats["created"] += 1
+                elif self._healthy(*idle):
+                    conn = idle[0]
+                    conn.autocommit = autocommit
+                    with self._lock:
+                        self._stats["reused"] += 1
+                else:
+                    with self._lock:
+                        self._stats["health_check_failures"] += 1
+                    self._discard(idle[0])
+        except Exception:
+            self._slots.release()
+            raise
+
+        with self._lock:
+            self._stats["checkouts"] += 1
+            self._stats["wait_s"] += waited
+            self._stats["max_wait_s"] = max(self._stats["max_wait_s"], waited)
+        return PooledConnection(self, conn)
+
+    def release(self, conn, held_s):
+        """Take a connection back; broken ones are closed instead of kept."""
+        if os.getpid() != self._pid:
+            self._orphans.append(conn)
+            return
+        try:
+            keep = not conn.closed
+            if keep and conn.get_transaction_status() != extensions.TRANSACTION_STATUS_IDLE:
+                conn.rollback()
+        except psycopg2.Error:
+            keep = False
+
+        if keep:
+            with self._lock:
+                self._idle.append((conn, time.monotonic()))
+        else:
+            self._discard(conn)
+        with self._lock:
+            self._stats["hold_s"] += held_s
+            self._stats["max_hold_s"] = max(self._stats["max_hold_s"], held_s)
+        self._slots.release()
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            idle = len(self._idle)
+        checkouts = max(stats["checkouts"], 1)
+        stats.update({
+            "max_size": self.max_size,
+            "idle": idle,
+            "avg_wait_ms": round(stats["wait_s"] / checkouts * 1000, 2),
+            "avg_hold_ms": round(stats["hold_s"] / checkouts * 1000, 2),
+        })
+        for key in ("wait_s", "max_wait_s", "hold_s", "max_hold_s"):
+            stats[key] = round(stats[key], 3)
+        return stats
+
+    def close_all(self):
+        """Close every idle connection (checked-out ones close on return)."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn, _ in idle:
+            self._discard(conn)
+
+
+# ---------------------------------------------------------------------------
+# Lazy pool singleton
+# ---------------------------------------------------------------------------
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool():
+    """Return the process-wide pool, created on first call (None if disabled)."""
+    global _pool
+    if _pool is None and PG_POOL_MAX_SIZE > 0:
+        with _pool_lock:
+            if _pool is None:
+                _pool = PgPool(PG_POOL_MAX_SIZE, PG_POOL_TIMEOUT_S, PG_POOL_HEALTHCHECK_IDLE_S)
+    return _pool
+
+
+def get_pg_connection(autocommit: bool = False, pooled: bool = True):
+    """
+    Return a psycopg2 connection from the pool (or a new one).
 
     Parameters
     ----------
@@ -33,17 +270,27 @@ def get_pg_connection(autocommit: bool = False):
         If False (default), the connection operates in transactional mode
         matching the original silver_layer.py and bronze_reddit_ingest.py
         behaviour where pg_conn.autocommit = False.
+    pooled : bool, optional
+        If False, open a dedicated connection that close() really closes.
+        Use it when session state must not outlive the caller (advisory
+        locks, SET commands).
 
     Returns
     -------
-    psycopg2.extensions.connection
+    PooledConnection or psycopg2.extensions.connection
         A live PostgreSQL connection. Caller is responsible for
-        calling conn.commit(), conn.rollback(), and conn.close().
+        calling conn.commit(), conn.rollback(), and conn.close()
+        (which returns a pooled connection to the pool).
 
     Raises
     ------
     RuntimeError
         If POSTGRES_DSN is not configured.
+    PoolTimeout
+        If the pool stays exhausted for PG_POOL_TIMEOUT_S.
+
+    Prefer pg_connection(): a connection that is never closed keeps its
+    pool slot for good.
 
     Example
     -------
@@ -56,12 +303,36 @@ def get_pg_connection(autocommit: bool = False):
         finally:
             conn.close()
     """
-    if not POSTGRES_DSN:
-        raise RuntimeError(
-            "POSTGRES_DSN is not set. "
-            "Check your .env file or config/settings.py."
-        )
+    pool = _get_pool() if pooled else None
+    if pool is None:
+        return _connect(autocommit)
+    return pool.acquire(autocommit)
 
-    conn = psycopg2.connect(POSTGRES_DSN)
-    conn.autocommit = autocommit
-    return conn
+
+@contextmanager
+def pg_connection(autocommit: bool = False):
+    """
+    Check out a pooled connection for the duration of a with-block.
+    The caller still commits; anything left uncommitted is rolled back.
+
+    Example
+    -------
+        with pg_connection() as conn, conn.cursor() as cur:
+            cur.execute("SELECT 1")
+    """
+    conn = get_pg_connection(autocommit)
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+
+def get_pool_stats():
+    """Pool counters and timings (None if pooling is disabled or unused)."""
+    return _pool.stats() if _pool is not None else None
+
+
+def close_pool():
+    """Close the pool's idle connections (e.g. on worker shutdown)."""
+    if _pool is not None:
+        _pool.close_all()
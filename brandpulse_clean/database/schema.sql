@@ -22,6 +22,74 @@ CREATE TABLE IF NOT EXISTS global_keywords (
     -- Note: Data audit identified overlapping unique constraints on keyword queries.
 );
 
+-- Work queue for the Python pipeline. The MERN backend only inserts rows;
+-- queue workers (python main.py --queue-worker) claim them with
+-- FOR UPDATE SKIP LOCKED, so any number of workers on any number of hosts
+-- can poll the same table without handing one job to two workers.
+CREATE TABLE IF NOT EXISTS pipeline_jobs (
+    job_id BIGSERIAL PRIMARY KEY,
+    global_keyword_id INT NOT NULL REFERENCES global_keywords(global_keyword_id),
+    keyword VARCHAR(255) NOT NULL,
+    platform VARCHAR(50) NOT NULL DEFAULT 'reddit',
+    status VARCHAR(20) NOT NULL DEFAULT 'queued', -- queued | running | done | failed
+    attempts INT NOT NULL DEFAULT 0,
+    worker_id VARCHAR(255),
+    enqueued_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    claimed_at TIMESTAMP,
+    heartbeat_at TIMESTAMP,
+    finished_at TIMESTAMP,
+    error TEXT,
+    history_saved BOOLEAN NOT NULL DEFAULT FALSE -- set once by the backend after saving analysis_history
+);
+
+-- Claim path: oldest queued job first
+CREATE INDEX IF NOT EXISTS idx_pipeline_jobs_queued
+    ON pipeline_jobs (enqueued_at) WHERE status = 'queued';
+
+-- History sweep (index.js): finished jobs whose analysis_history is not saved yet
+CREATE INDEX IF NOT EXISTS idx_pipeline_jobs_history_pending
+    ON pipeline_jobs (finished_at) WHERE status = 'done' AND NOT history_saved;
+
+-- At most one pending/running job per request
+CREATE UNIQUE INDEX IF NOT EXISTS idx_pipeline_jobs_active_request
+    ON pipeline_jobs (global_keyword_id) WHERE status IN ('queued', 'running');
+
+-- Single-flight coalescing (pipeline/single_flight.py): the request
+-- currently (or last) leading each (keyword, platform, date range). The
+-- leader also holds an advisory lock on the key while it runs.
+CREATE TABLE IF NOT EXISTS pipeline_flights (
+    flight_key TEXT PRIMARY KEY,         -- keyword|platform|start_date|end_date
+    leader_request_id INT NOT NULL,
+    status VARCHAR(20) NOT NULL,         -- RUNNING | COMPLETED | FAILED
+    started_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    finished_at TIMESTAMPTZ
+);
+
+-- One row per run_pipeline() call (pipeline/orchestrator.py).
+CREATE TABLE IF NOT EXISTS pipeline_runs (
+    run_id UUID PRIMARY KEY,
+    keyword VARCHAR(255),
+    keyword_normalized VARCHAR(255),
+    request_id INT,
+    platform VARCHAR(50),
+    status VARCHAR(20),          -- STARTED | COMPLETED | FAILED
+    bronze_status VARCHAR(20),   -- PENDING | COMPLETED | FAILED
+    bronze_doc_count INT DEFAULT 0,
+    bronze_completed_at TIMESTAMPTZ,
+    silver_status VARCHAR(20),
+    silver_post_count INT DEFAULT 0,
+    silver_completed_at TIMESTAMPTZ,
+    gold_status VARCHAR(20),
+    gold_fact_count INT DEFAULT 0,
+    gold_completed_at TIMESTAMPTZ,
+    error_message TEXT,
+    started_at TIMESTAMPTZ DEFAULT NOW(),
+    completed_at TIMESTAMPTZ
+);
+
+-- Per-stage durations, items/sec, bytes and batch sizes (utils/metrics.py)
+ALTER TABLE pipeline_runs ADD COLUMN IF NOT EXISTS metrics JSONB;
+
 -- ---------------------------------------------------------
 -- 2. Silver Layer (Cleaned & Enriched Data)
 -- ---------------------------------------------------------
@@ -74,6 +142,63 @@ CREATE TABLE IF NOT EXISTS silver_reddit_comment_sentiment_summary (
     summary_updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Precomputed dim_date / dim_time keys (UTC, YYYYMMDD / HHMM), written by
+-- the silver writer (utils/dim_keys.py) so gold joins the dimensions on
+-- their primary keys and date ranges are integer range predicates.
+-- Fill older rows with: python -m pipeline.silver.dim_key_backfill
+ALTER TABLE silver_reddit_posts
+    ADD COLUMN IF NOT EXISTS date_id INT,
+    ADD COLUMN IF NOT EXISTS time_id INT;
+
+ALTER TABLE silver_reddit_comments
+    ADD COLUMN IF NOT EXISTS comment_date_id INT,
+    ADD COLUMN IF NOT EXISTS comment_time_id INT;
+
+ALTER TABLE IF EXISTS silver_twitter_tweets
+    ADD COLUMN IF NOT EXISTS tweet_date_id INT,
+    ADD COLUMN IF NOT EXISTS tweet_time_id INT;
+
+CREATE INDEX IF NOT EXISTS idx_silver_posts_keyword_date
+    ON silver_reddit_posts (global_keyword_id, date_id);
+
+-- Only databases on the silver_post_id layout (benchmarks/schema.sql) have
+-- the column; the CREATE TABLE above links comments by link_id instead.
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'silver_reddit_comments' AND column_name = 'silver_post_id'
+    ) THEN
+        CREATE INDEX IF NOT EXISTS idx_silver_comments_post_date
+            ON silver_reddit_comments (silver_post_id, comment_date_id);
+    END IF;
+END $$;
+
+DO $$
+BEGIN
+    IF to_regclass('silver_twitter_tweets') IS NOT NULL THEN
+        CREATE INDEX IF NOT EXISTS idx_silver_tweets_keyword_date
+            ON silver_twitter_tweets (global_keyword_id, tweet_date_id);
+    END IF;
+END $$;
+
+-- Model that scored each post (SENTIMENT_MODEL). Later requests for the
+-- same keyword reuse posts scored by the current model
+-- (pipeline/silver/reddit_reuse.py); rows without a model are never reused.
+ALTER TABLE silver_reddit_posts
+    ADD COLUMN IF NOT EXISTS model_name VARCHAR(255);
+
+CREATE INDEX IF NOT EXISTS idx_silver_posts_reuse
+    ON silver_reddit_posts (LOWER(TRIM(keyword)), model_name, date_id);
+
+-- Near-duplicate tag (pipeline/silver/near_duplicates.py): the text hash of
+-- the representative whose sentiment a copy-pasted post or comment reused
+-- instead of being scored. NULL for texts the model scored.
+ALTER TABLE silver_reddit_posts
+    ADD COLUMN IF NOT EXISTS near_duplicate_of VARCHAR(64);
+ALTER TABLE silver_reddit_comments
+    ADD COLUMN IF NOT EXISTS near_duplicate_of VARCHAR(64);
+
 -- ---------------------------------------------------------
 -- 3. Gold Layer (Dimensional Modeling / Star Schema)
 -- ---------------------------------------------------------
@@ -107,7 +232,7 @@ CREATE TABLE IF NOT EXISTS dim_date (
 );
 
 CREATE TABLE IF NOT EXISTS dim_time (
-    time_id INT PRIMARY KEY, -- (hour * 60) + minute (0-1439)
+    time_id INT PRIMARY KEY, -- (hour * 100) + minute, e.g. 1259 for 12:59
     hour INT,
     minute INT,
     time_str VARCHAR(5)
@@ -125,6 +250,19 @@ CREATE TABLE IF NOT EXISTS dim_model (
     model_version VARCHAR(50)
 );
 
+-- Gold load progress: highest silver id already loaded into
+-- fact_sentiment_events per request and content type
+-- (pipeline/gold/reddit_aggregator.py). Replaces the gold_processed
+-- flag-rewrite passes over the silver tables.
+CREATE TABLE IF NOT EXISTS gold_watermarks (
+    request_id INT NOT NULL,
+    platform_id INT NOT NULL,
+    content_type_id INT NOT NULL,
+    last_silver_id BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (request_id, platform_id, content_type_id)
+);
+
 -- Facts
 CREATE TABLE IF NOT EXISTS fact_sentiment_events (
     fact_id SERIAL PRIMARY KEY,
@@ -142,3 +280,42 @@ CREATE TABLE IF NOT EXISTS fact_sentiment_events (
     event_timestamp TIMESTAMP,
     CONSTRAINT fact_sentiment_events_unique_content UNIQUE (silver_content_id, model_id, platform_id, content_type_id)
 );
+
+-- Daily sentiment rollup, maintained incrementally by the gold load from
+-- the facts it inserts (pipeline/gold/reddit_aggregator.py). Dashboard
+-- summaries read this instead of re-counting silver rows.
+-- Rebuild with: python -m pipeline.gold.rollup_queries backfill [request_id]
+CREATE TABLE IF NOT EXISTS gold_daily_sentiment_rollup (
+    request_id INT NOT NULL,
+    date_id INT NOT NULL,
+    platform_id INT NOT NULL,
+    content_type_id INT NOT NULL,
+    sentiment_id INT NOT NULL,
+    item_count BIGINT NOT NULL DEFAULT 0,
+    score_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+    PRIMARY KEY (request_id, date_id, platform_id, content_type_id, sentiment_id)
+);
+
+-- One-time fill for requests loaded before the rollup existed: every
+-- request with facts but no rollup rows is rolled up from
+-- fact_sentiment_events. Later runs of this file find nothing to add.
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'fact_sentiment_events' AND column_name = 'request_id'
+    ) THEN
+        INSERT INTO gold_daily_sentiment_rollup (
+            request_id, date_id, platform_id, content_type_id, sentiment_id, item_count, score_sum
+        )
+        SELECT f.request_id, f.date_id, f.platform_id, f.content_type_id, f.sentiment_id,
+               COUNT(*), COALESCE(SUM(f.sentiment_score), 0)
+        FROM fact_sentiment_events f
+        WHERE f.request_id IS NOT NULL
+        AND NOT EXISTS (
+            SELECT 1 FROM gold_daily_sentiment_rollup r WHERE r.request_id = f.request_id
+        )
+        GROUP BY f.request_id, f.date_id, f.platform_id, f.content_type_id, f.sentiment_id
+        ON CONFLICT (request_id, date_id, platform_id, content_type_id, sentiment_id) DO NOTHING;
+    END IF;
+END $$;
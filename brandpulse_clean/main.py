@@ -3,16 +3,61 @@ BrandPulse Clean – Main Entry Point
 ===================================
 CLI entry point invoked by the MERN backend (routes/pipeline.js).
 Usage: python main.py <keyword> <request_id> [platform]
+       python main.py --worker [socket_path]
+       python main.py --queue-worker [concurrency]
+       python main.py --async-queue-worker [concurrency]
+       python main.py --ensure-indexes [--verify]
+       python main.py --calibrate-cascade [--keywords k1,k2] [--thresholds 0.7,0.8]
+
+The first argument is the user's search keyword, so subcommands are
+flags: a search for "worker" must run the pipeline, not start a daemon.
 """
 
 import sys
-from pipeline.orchestrator import run_pipeline
 
 if __name__ == "__main__":
+    if len(sys.argv) >= 2 and sys.argv[1] == "--worker":
+        from config.settings import WORKER_SOCKET_PATH
+        from pipeline.worker import serve
+
+        serve(sys.argv[2] if len(sys.argv) > 2 else WORKER_SOCKET_PATH)
+        sys.exit(0)
+
+    if len(sys.argv) >= 2 and sys.argv[1] == "--queue-worker":
+        from config.settings import PIPELINE_QUEUE_WORKERS
+        from pipeline.job_queue import run_queue_worker
+
+        run_queue_worker(int(sys.argv[2]) if len(sys.argv) > 2 else PIPELINE_QUEUE_WORKERS)
+        sys.exit(0)
+
+    if len(sys.argv) >= 2 and sys.argv[1] == "--async-queue-worker":
+        from config.settings import AIO_QUEUE_WORKERS
+        from pipeline.aio.job_queue import run_async_queue_worker
+
+        run_async_queue_worker(int(sys.argv[2]) if len(sys.argv) > 2 else AIO_QUEUE_WORKERS)
+        sys.exit(0)
+
+    if len(sys.argv) >= 2 and sys.argv[1] == "--ensure-indexes":
+        from database.mongo_indexes import main as ensure_indexes_main
+
+        sys.exit(ensure_indexes_main(sys.argv[2:]))
+
+    if len(sys.argv) >= 2 and sys.argv[1] == "--calibrate-cascade":
+        from pipeline.silver.cascade import main as calibrate_cascade_main
+
+        sys.exit(calibrate_cascade_main(sys.argv[2:]))
+
     if len(sys.argv) < 3:
         print("Usage: python main.py <keyword> <request_id> [platform]")
+        print("       python main.py --worker [socket_path]")
+        print("       python main.py --queue-worker [concurrency]")
+        print("       python main.py --async-queue-worker [concurrency]")
+        print("       python main.py --ensure-indexes [--verify]")
+        print("       python main.py --calibrate-cascade [--keywords k1,k2] [--thresholds 0.7,0.8]")
         sys.exit(1)
 
+    from pipeline.orchestrator import run_pipeline
+
     keyword = sys.argv[1]
     request_id = sys.argv[2]
     platform = sys.argv[3] if len(sys.argv) > 3 else "reddit"
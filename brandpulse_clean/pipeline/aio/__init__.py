@@ -0,0 +1 @@
+# pipeline.aio package – asyncio pipeline (motor, asyncpg, asyncpraw)
@@ -0,0 +1,276 @@
+"""
+BrandPulse Clean – Async Bronze Reddit Ingestion
+================================================
+asyncio form of pipeline/bronze/reddit_ingest.iter_ingest_keyword():
+searches Reddit with asyncpraw and writes bronze documents with motor.
+
+Source: New. Used by run_pipeline_async() (pipeline/aio/orchestrator.py).
+
+Filters, limits, document shape and job/error records are those of the
+synchronous module (reject_reason, extract_post, bronze_upsert are
+shared). Comment trees are fetched as concurrent tasks, at most
+REDDIT_COMMENT_WORKERS per keyword, and every request waits for its slot
+in the same process-wide RateLimiter as the threaded path, with
+``await asyncio.sleep(limiter.reserve())`` instead of blocking.
+
+REDDIT_SOURCE=record|replay have no asyncpraw implementation: the
+synchronous ingest_keyword() then runs on a thread and yields nothing,
+and run_silver_async() picks its documents up in its final sweep.
+
+    pip install asyncpraw
+"""
+
+import asyncio
+import inspect
+import time
+from datetime import datetime, timezone
+
+import bson
+
+from config.settings import (
+    REDDIT_CLIENT_ID,
+    REDDIT_CLIENT_SECRET,
+    REDDIT_COMMENT_WORKERS,
+    REDDIT_SOURCE,
+    REDDIT_USER_AGENT,
+)
+from models.enums import PipelineStatus
+from pipeline.aio.db import get_mongo_collections, get_pg_pool, to_asyncpg
+from pipeline.bronze.reddit_ingest import (
+    MARK_PROCESSED_SQL,
+    MARK_STATUS_SQL,
+    _get_rate_limiter,
+    bronze_upsert,
+    extract_post,
+    ingest_keyword,
+    reject_reason,
+)
+from utils import metrics
+
+_reddit_client = None
+
+
+def _get_reddit_client():
+    """Return a shared asyncpraw.Reddit, created on first call."""
+    global _reddit_client
+    if _reddit_client is None:
+        try:
+            import asyncpraw
+        except ImportError:
+            raise RuntimeError("The asyncio pipeline needs the asyncpraw package (pip install asyncpraw)")
+        _reddit_client = asyncpraw.Reddit(
+            client_id=REDDIT_CLIENT_ID,
+            client_secret=REDDIT_CLIENT_SECRET,
+            user_agent=REDDIT_USER_AGENT,
+        )
+    return _reddit_client
+
+
+async def close_reddit_client():
+    """Close the asyncpraw HTTP session."""
+    global _reddit_client
+    if _reddit_client is not None:
+        await _reddit_client.close()
+        _reddit_client = None
+
+
+async def _rate_limit():
+    """Wait for one request slot of the process-wide Reddit budget."""
+    wait = _get_rate_limiter().reserve()
+    if wait > 0:
+        await asyncio.sleep(wait)
+
+
+async def _maybe_await(value):
+    return await value if inspect.isawaitable(value) else value
+
+
+async def mark_keyword_status(keyword_id, status):
+    pool = await get_pg_pool()
+    await pool.execute(*to_asyncpg(MARK_STATUS_SQL, (status, keyword_id)))
+
+
+async def mark_keyword_processed(keyword_id):
+    pool = await get_pg_pool()
+    await pool.execute(*to_asyncpg(MARK_PROCESSED_SQL, (keyword_id,)))
+
+
+async def fetch_comments(submission_id, slots):
+    """Fetch the top comments of one post (same fields as extract_comments())."""
+    async with slots:
+        await _rate_limit()
+        submission = await _get_reddit_client().submission(id=submission_id)
+        forest = submission.comments
+        await _maybe_await(forest.replace_more(limit=0))  # Get top comments only for speed
+        comments = await _maybe_await(forest.list())
+    return [{
+        "body": comment.body,
+        "author": str(comment.author),
+        "score": comment.score,
+        "created_utc": comment.created_utc
+    } for comment in comments[:10]]
+
+
+async def iter_ingest_keyword_async(keyword, request_id, date_windows=None, chunk_size=None):
+    """
+    Ingest one keyword, yielding each written chunk.
+
+    Parameters
+    ----------
+    chunk_size : int, optional
+        Write to MongoDB every ``chunk_size`` documents. By default all
+        documents are written at once after the last comment tree.
+
+    Yields
+    ------
+    list of str
+        meta.external_id of every document in the chunk just written.
+    """
+    keyword_id = int(request_id) if request_id else None
+    if not keyword_id:
+        raise ValueError("No Request ID provided for ingestion.")
+
+    if REDDIT_SOURCE != "live":
+        await asyncio.to_thread(ingest_keyword, keyword, keyword_id, date_windows=date_windows)
+        return
+
+    bronze_col, jobs_col, errors_col = get_mongo_collections()
+    reddit = _get_reddit_client()
+
+    # 1. LOCK STATE: Tell MERN we are starting
+    await mark_keyword_status(keyword_id, PipelineStatus.PROCESSING.value)
+
+    job_id = (await jobs_col.insert_one({
+        "platform": "reddit",
+        "keyword": keyword,
+        "global_keyword_id": keyword_id,
+        "started_at": datetime.now(timezone.utc),
+        "status": "running"
+    })).inserted_id
+
+    operations = []
+    chunk_ids = []
+    stats = {"processed": 0, "inserted": 0, "skipped_nsfw": 0,
+             "skipped_non_english": 0, "skipped_covered": 0, "errors": 0}
+    job_status = "completed"
+
+    print(f"[BRONZE] Ingesting keyword: {keyword}")
+
+    async def write_chunk():
+        started = time.perf_counter()
+        result = await bronze_col.bulk_write(operations, ordered=False)
+        metrics.add_time("bronze.write", time.perf_counter() - started)
+        metrics.count("bronze.write", len(operations))
+        new_docs = result.upserted_count + result.inserted_count
+        metrics.count("bronze.docs", new_docs)
+        operations.clear()
+        return new_docs
+
+    async def record_error(submission, e):
+        stats["errors"] += 1
+        await errors_col.insert_one({
+            "platform": "reddit",
+            "keyword": keyword,
+            "external_id": getattr(submission, "name", None),
+            "error": str(e),
+            "occurred_at": datetime.now(timezone.utc)
+        })
+
+    tasks = []
+    try:
+        # PASS 1: filter search results
+        accepted = []
+        search_started = time.perf_counter()
+        await _rate_limit()
+        subreddit = await reddit.subreddit("all")
+        async for submission in subreddit.search(
+                query=f'"{keyword}" nsfw:no',
+                sort="relevance",
+                limit=15,
+                time_filter="month"
+        ):
+            try:
+                reason = reject_reason(submission, keyword, date_windows)
+                if reason in ("nsfw", "covered", "non_english"):
+                    stats[f"skipped_{reason}"] += 1
+                if reason is not None:
+                    continue
+                accepted.append((submission, extract_post(submission)))
+            except Exception as e:
+                await record_error(submission, e)
+
+        metrics.add_time("bronze.search", time.perf_counter() - search_started)
+        metrics.count("bronze.search", len(accepted))
+
+        # PASS 2: comment trees as concurrent tasks, consumed in search order
+        comments_started = time.perf_counter()
+        comments_fetched = 0
+        slots = asyncio.Semaphore(max(REDDIT_COMMENT_WORKERS, 1))
+        tasks = [asyncio.ensure_future(fetch_comments(submission.id, slots)) for submission, _ in accepted]
+
+        for (submission, post_raw), task in zip(accepted, tasks):
+            try:
+                comments_raw = await task
+                comments_fetched += len(comments_raw)
+
+                operation, base_doc = bronze_upsert(keyword, keyword_id, submission, post_raw, comments_raw)
+                operations.append(operation)
+                chunk_ids.append(submission.name)
+                stats["processed"] += 1
+                metrics.count("bronze.write.bytes", len(bson.encode(base_doc)))
+
+                if chunk_size and len(operations) >= chunk_size:
+                    stats["inserted"] += await write_chunk()
+                    yield list(chunk_ids)
+                    chunk_ids.clear()
+            except Exception as e:
+                await record_error(submission, e)
+        metrics.add_time("bronze.comments", time.perf_counter() - comments_started)
+        metrics.count("bronze.comments", comments_fetched)
+
+        if operations:
+            stats["inserted"] += await write_chunk()
+            yield list(chunk_ids)
+            chunk_ids.clear()
+
+        # 2. SUCCESS STATE
+        if stats["inserted"] > 0:
+            await mark_keyword_processed(keyword_id)
+            await mark_keyword_status(keyword_id, PipelineStatus.COMPLETED.value)
+        else:
+            await mark_keyword_status(keyword_id, PipelineStatus.IDLE.value)
+
+    except GeneratorExit:
+        # 4. ABORTED STATE: the consumer stopped before ingestion finished
+        job_status = "aborted"
+        await mark_keyword_status(keyword_id, PipelineStatus.FAILED.value)
+        print(f"[BRONZE] Ingestion of {keyword} stopped by its consumer")
+        raise
+    except Exception as e:
+        # 3. FAILURE STATE
+        await mark_keyword_status(keyword_id, PipelineStatus.FAILED.value)
+        await errors_col.insert_one({
+            "platform": "reddit",
+            "keyword": keyword,
+            "error": f"CRITICAL PIPELINE FAILURE: {str(e)}",
+            "occurred_at": datetime.now(timezone.utc)
+        })
+        print(f"[BRONZE] Critical failure for {keyword}: {e}")
+    finally:
+        for task in tasks:
+            task.cancel()
+        # Job logging runs even when the generator is closed early
+        await jobs_col.update_one(
+            {"_id": job_id},
+            {"$set": {
+                "finished_at": datetime.now(timezone.utc),
+                "status": job_status,
+                "stats": stats,
+            }}
+        )
+    print(f"[BRONZE] Completed {keyword} | Inserted: {stats['inserted']}")
+
+
+async def ingest_keyword_async(keyword, request_id, date_windows=None):
+    async for _ in iter_ingest_keyword_async(keyword, request_id, date_windows=date_windows):
+        pass
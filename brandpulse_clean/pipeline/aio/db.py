@@ -0,0 +1,131 @@
+"""
+BrandPulse Clean – Async Database Clients
+=========================================
+Lazy motor (MongoDB) and asyncpg (PostgreSQL) clients for the asyncio
+pipeline.
+
+Source: New. The async counterparts of database/mongo.py and
+database/postgres.py. Both drivers are optional dependencies, imported on
+first use:
+
+    pip install motor asyncpg
+
+The asyncpg pool holds up to PG_POOL_MAX_SIZE connections, like the
+synchronous pool. Clients belong to the event loop that created them;
+close_clients() drops them when that loop ends.
+"""
+
+import asyncio
+import re
+
+from config.settings import MONGO_URI, PG_POOL_MAX_SIZE, POSTGRES_DSN
+
+_motor_client = None
+_pg_pool = None
+_pg_pool_lock = None
+
+
+def _require(module):
+    try:
+        return __import__(module)
+    except ImportError:
+        raise RuntimeError(f"The asyncio pipeline needs the {module} package (pip install {module})")
+
+
+def _get_motor_client():
+    """Return a shared AsyncIOMotorClient, created on first call."""
+    global _motor_client
+    if _motor_client is None:
+        motor = _require("motor.motor_asyncio")
+        _motor_client = motor.motor_asyncio.AsyncIOMotorClient(MONGO_URI)
+    return _motor_client
+
+
+def get_mongo_collections():
+    """
+    Return the three Bronze-layer collections as motor collections.
+
+    Returns
+    -------
+    tuple : (bronze_col, jobs_col, errors_col)
+        Same collections as database.mongo.get_mongo_collections().
+    """
+    db = _get_motor_client()["BrandPulse_1"]
+    return db["bronze_raw_reddit_data"], db["bronze_ingestion_jobs"], db["bronze_errors"]
+
+
+async def get_pg_pool():
+    """Return the shared asyncpg pool, created on first call."""
+    global _pg_pool, _pg_pool_lock
+    if _pg_pool is None:
+        if _pg_pool_lock is None:
+            _pg_pool_lock = asyncio.Lock()
+        async with _pg_pool_lock:
+            if _pg_pool is None:
+                if not POSTGRES_DSN:
+                    raise RuntimeError(
+                        "POSTGRES_DSN is not set. "
+                        "Check your .env file or config/settings.py."
+                    )
+                asyncpg = _require("asyncpg")
+                _pg_pool = await asyncpg.create_pool(
+                    POSTGRES_DSN, min_size=1, max_size=max(PG_POOL_MAX_SIZE, 1),
+                )
+    return _pg_pool
+
+
+async def close_clients():
+    """Close the asyncpg pool and the motor client."""
+    global _motor_client, _pg_pool, _pg_pool_lock
+    if _pg_pool is not None:
+        await _pg_pool.close()
+    if _motor_client is not None:
+        _motor_client.close()
+    _motor_client = _pg_pool = _pg_pool_lock = None
+
+
+_PARAM = re.compile(r"%\((\w+)\)s|%s|%%")
+
+
+def to_asyncpg(sql, params=()):
+    """
+    Convert a psycopg2 statement and its parameters to asyncpg form, so the
+    async path runs the exact SQL of the synchronous modules.
+
+    Parameters
+    ----------
+    sql : str
+        Statement with %s or %(name)s placeholders (%% for a literal %).
+    params : tuple or dict
+        psycopg2 parameters.
+
+    Returns
+    -------
+    tuple : (sql, args)
+        Statement with $1..$n placeholders and the positional arguments.
+    """
+    args = []
+    numbers = {}
+    positional = iter(params) if not isinstance(params, dict) else None
+
+    def replace(match):
+        if match.group(0) == "%%":
+            return "%"
+        name = match.group(1)
+        if name is None:
+            args.append(next(positional))
+            return f"${len(args)}"
+        if name not in numbers:
+            args.append(params[name])
+            numbers[name] = len(args)
+        return f"${numbers[name]}"
+
+    return _PARAM.sub(replace, sql), args
+
+
+def rowcount(status):
+    """Rows affected, from an asyncpg command status such as 'INSERT 0 5'."""
+    try:
+        return int(status.rsplit(" ", 1)[-1])
+    except (AttributeError, ValueError):
+        return 0
@@ -0,0 +1,53 @@
+"""
+BrandPulse Clean – Async Gold Reddit Aggregator
+===============================================
+asyncio form of pipeline/gold/reddit_aggregator.run_reddit_gold(): the
+same watermark statements, in one asyncpg transaction.
+
+Source: New. Used by run_pipeline_async() (pipeline/aio/orchestrator.py).
+"""
+
+import time
+
+from pipeline.aio.db import get_pg_pool, rowcount, to_asyncpg
+from pipeline.gold.reddit_aggregator import INSERT_COMMENT_SENTIMENT_SQL, INSERT_POST_SENTIMENT_SQL
+from pipeline.silver.dim_key_backfill import REQUEST_COMMENTS_SQL, REQUEST_POSTS_SQL
+from utils import metrics
+
+
+async def run_reddit_gold_async(keyword, request_id):
+    """
+    Aggregate Silver Reddit data into Gold fact tables (see
+    run_reddit_gold()). On any failure the whole transaction, watermark
+    moves included, is rolled back.
+    """
+    params = {"request_id": int(request_id)}
+    pool = await get_pg_pool()
+    async with pool.acquire() as conn:
+        async with conn.transaction():
+            # 0. Rows written before silver stored dimension keys
+            await conn.execute("SET LOCAL TIME ZONE 'UTC'")
+            backfilled = 0
+            for sql in (REQUEST_POSTS_SQL, REQUEST_COMMENTS_SQL):
+                backfilled += rowcount(await conn.execute(*to_asyncpg(sql, params)))
+            if backfilled:
+                print(f"[GOLD] Backfilled date/time keys on {backfilled} silver rows.")
+
+            # 1. Insert POSTS into fact table
+            started = time.perf_counter()
+            posts_inserted, posts_read = await conn.fetchrow(*to_asyncpg(INSERT_POST_SENTIMENT_SQL, params))
+            metrics.add_time("gold.posts", time.perf_counter() - started)
+            metrics.count("gold.posts", posts_inserted)
+            print(f"[GOLD] Inserted {posts_inserted} post sentiment rows ({posts_read} new silver posts).")
+
+            # 2. Insert COMMENTS into fact table
+            started = time.perf_counter()
+            comments_inserted, comments_read = await conn.fetchrow(
+                *to_asyncpg(INSERT_COMMENT_SENTIMENT_SQL, params)
+            )
+            metrics.add_time("gold.comments", time.perf_counter() - started)
+            metrics.count("gold.comments", comments_inserted)
+            metrics.count("gold.facts", posts_inserted + comments_inserted)
+            print(f"[GOLD] Inserted {comments_inserted} comment sentiment rows ({comments_read} new silver comments).")
+
+    print(f"[GOLD] Transaction committed for reddit.")
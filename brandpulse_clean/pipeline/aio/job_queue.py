@@ -0,0 +1,195 @@
+"""
+BrandPulse Clean – Async Job Queue Worker
+=========================================
+Claims pipeline_jobs rows and runs them with run_pipeline_async(), up to
+AIO_QUEUE_WORKERS at once on one event loop.
+
+Source: New. asyncio counterpart of pipeline/job_queue.run_queue_worker():
+
+    python main.py --async-queue-worker [concurrency]
+
+Claim, heartbeat, finish and stale-job reclaim use the same SQL as the
+threaded worker (pipeline/job_queue.py), so both kinds of worker can
+serve the same queue side by side. A threaded worker needs a thread per
+running job; here a running job that waits on Reddit, MongoDB or
+PostgreSQL costs one suspended task, so concurrency can be set far
+higher. Inference is the one CPU-bound step; it runs on an executor
+shared by every job (pipeline/aio/silver.py), and on the forked inference
+pool when INFERENCE_WORKERS is set.
+"""
+
+import asyncio
+import os
+import socket
+
+from config.settings import (
+    AIO_QUEUE_WORKERS,
+    INFERENCE_WORKERS,
+    JOB_HEARTBEAT_SECONDS,
+    JOB_MAX_ATTEMPTS,
+    JOB_POLL_SECONDS,
+    JOB_STALE_SECONDS,
+    MONGO_ENSURE_INDEXES,
+)
+from database.mongo_indexes import ensure_indexes
+from models.enums import PipelineStatus
+from pipeline.aio.bronze import close_reddit_client
+from pipeline.aio.db import close_clients, get_mongo_collections, get_pg_pool, to_asyncpg
+from pipeline.aio.orchestrator import run_pipeline_async, update_status_by_id_async
+from pipeline.aio.silver import run_in_inference_thread
+from pipeline.silver.inference_pool import close_inference_pool, get_inference_pool
+from pipeline.job_queue import CLAIM_JOB_SQL, FINISH_JOB_SQL, HEARTBEAT_SQL, RECLAIM_STALE_SQL
+from pipeline.silver.sentiment import _get_sentiment_pipeline
+from utils.logging import get_logger
+
+logger = get_logger("QUEUE")
+
+
+async def warm_up_async():
+    """Load the model (or fork the inference pool) and open both database clients."""
+    logger.info("Loading sentiment model...")
+    if INFERENCE_WORKERS:
+        # Fork now, while the event loop thread is the only thread
+        get_inference_pool()
+    else:
+        await run_in_inference_thread(_get_sentiment_pipeline)
+
+    logger.info("Connecting to MongoDB...")
+    bronze_col, _, _ = get_mongo_collections()
+    await bronze_col.database.client.admin.command("ping")
+    if MONGO_ENSURE_INDEXES:
+        logger.info("Ensuring MongoDB indexes...")
+        await asyncio.to_thread(ensure_indexes)
+
+    logger.info("Checking PostgreSQL connectivity...")
+    pool = await get_pg_pool()
+    await pool.fetchval("SELECT 1")
+
+    logger.info("Worker warm.")
+
+
+async def _claim_job(worker_id):
+    """Claim the oldest queued job, or return None if the queue is empty."""
+    pool = await get_pg_pool()
+    row = await pool.fetchrow(*to_asyncpg(CLAIM_JOB_SQL, (worker_id,)))
+    if row is None:
+        return None
+    job_id, request_id, keyword, platform, attempts = row
+    return {
+        "job_id": job_id,
+        "request_id": request_id,
+        "keyword": keyword,
+        "platform": platform,
+        "attempts": attempts,
+    }
+
+
+async def _finish_job(job_id, worker_id, status, error=None):
+    """Record the job's outcome; on failure the stale-job check reclaims it."""
+    try:
+        pool = await get_pg_pool()
+        await pool.execute(*to_asyncpg(FINISH_JOB_SQL, (status, error, job_id, worker_id)))
+    except Exception as e:
+        logger.error("%s could not mark job %s %s: %s", worker_id, job_id, status, e)
+
+
+async def _heartbeat(job_id, worker_id):
+    """Refresh the job's heartbeat until cancelled."""
+    pool = await get_pg_pool()
+    while True:
+        await asyncio.sleep(JOB_HEARTBEAT_SECONDS)
+        try:
+            await pool.execute(*to_asyncpg(HEARTBEAT_SQL, (job_id, worker_id)))
+        except Exception as e:
+            logger.warning("Heartbeat failed for job %s: %s", job_id, e)
+
+
+async def reclaim_stale_jobs_async():
+    """Re-queue (or fail) running jobs whose worker stopped heartbeating."""
+    pool = await get_pg_pool()
+    rows = await pool.fetch(*to_asyncpg(
+        RECLAIM_STALE_SQL, (JOB_MAX_ATTEMPTS, JOB_MAX_ATTEMPTS, float(JOB_STALE_SECONDS))
+    ))
+    for job_id, request_id, status in rows:
+        logger.warning("Reclaimed stale job %s (request %s) -> %s", job_id, request_id, status)
+        if status == "failed":
+            await update_status_by_id_async(request_id, PipelineStatus.FAILED.value)
+    return len(rows)
+
+
+async def _run_job(job, worker_id):
+    """Execute one claimed job with a heartbeat task alongside it."""
+    logger.info(
+        "%s running job %s (request %s, attempt %s)",
+        worker_id, job["job_id"], job["request_id"], job["attempts"],
+    )
+    beat = asyncio.ensure_future(_heartbeat(job["job_id"], worker_id))
+    try:
+        await run_pipeline_async(job["keyword"], job["request_id"], job["platform"])
+    except Exception as e:
+        # run_pipeline_async() has already marked global_keywords FAILED
+        status, error = "failed", str(e)
+    else:
+        status, error = "done", None
+    finally:
+        beat.cancel()
+    await _finish_job(job["job_id"], worker_id, status, error)
+
+
+async def _worker_loop(worker_id):
+    """Claim and run jobs until cancelled."""
+    while True:
+        try:
+            job = await _claim_job(worker_id)
+        except Exception as e:
+            logger.error("%s could not claim a job: %s", worker_id, e)
+            job = None
+
+        if job is None:
+            await asyncio.sleep(JOB_POLL_SECONDS)
+            continue
+        await _run_job(job, worker_id)
+
+
+async def _reclaim_loop():
+    while True:
+        try:
+            await reclaim_stale_jobs_async()
+        except Exception as e:
+            logger.error("Stale job check failed: %s", e)
+        await asyncio.sleep(JOB_STALE_SECONDS / 2)
+
+
+async def serve_async_queue(concurrency=AIO_QUEUE_WORKERS):
+    """Warm up, then run ``concurrency`` claim loops until cancelled."""
+    await warm_up_async()
+
+    prefix = f"{socket.gethostname()}:{os.getpid()}:aio"
+    logger.info("Async queue worker %s started with %d slots.", prefix, concurrency)
+    tasks = [asyncio.ensure_future(_worker_loop(f"{prefix}:{slot}")) for slot in range(concurrency)]
+    tasks.append(asyncio.ensure_future(_reclaim_loop()))
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await close_reddit_client()
+        await close_clients()
+        close_inference_pool()
+
+
+def run_async_queue_worker(concurrency=AIO_QUEUE_WORKERS):
+    """
+    Process pipeline_jobs on one event loop until interrupted.
+
+    Parameters
+    ----------
+    concurrency : int
+        Number of jobs this process runs at the same time
+        (default: AIO_QUEUE_WORKERS).
+    """
+    try:
+        asyncio.run(serve_async_queue(concurrency))
+    except KeyboardInterrupt:
+        logger.info("Async queue worker stopped.")
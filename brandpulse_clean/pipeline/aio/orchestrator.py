@@ -0,0 +1,142 @@
+"""
+BrandPulse Clean – Async Pipeline Orchestrator
+==============================================
+run_pipeline_async(): Bronze → Silver → Gold on the event loop, so one
+process can run dozens of I/O-bound requests at once.
+
+Source: New. asyncio counterpart of pipeline/orchestrator.run_pipeline(),
+driven by run_async_queue_worker() (pipeline/aio/job_queue.py).
+
+WHAT IS ASYNC:
+    MongoDB      – motor
+    PostgreSQL   – asyncpg (pipeline/aio/db.py)
+    Reddit       – asyncpraw (pipeline/aio/bronze.py)
+    Inference    – run_sentiment_batch_deduped() on an executor thread
+                   (pipeline/aio/silver.py), so the loop stays free while
+                   the model works and the model is never idle while
+                   requests wait on the network.
+
+Status updates, the pipeline_runs record and metrics are those of
+run_pipeline() (same SQL, same PipelineStatus values, same summary).
+Bronze and Silver always stream: each chunk is scored as soon as it is
+written. Single-flight coalescing and silver reuse are not part of this
+path; they remain in the threaded run_pipeline().
+
+Only the 'reddit' platform has an async implementation.
+"""
+
+import json
+import uuid
+
+from config.settings import BRONZE_STREAM_CHUNK_SIZE
+from models.enums import PipelineStatus
+from pipeline.aio.bronze import iter_ingest_keyword_async
+from pipeline.aio.db import get_pg_pool, to_asyncpg
+from pipeline.aio.gold import run_reddit_gold_async
+from pipeline.aio.silver import run_silver_async
+from pipeline.orchestrator import (
+    START_RUN_SQL,
+    UPDATE_STATUS_SQL,
+    _STAGE_COUNT_COLUMNS,
+    complete_stage_sql,
+    finish_run_sql,
+)
+from utils import metrics
+
+
+async def _execute(sql, params, error_message):
+    """Run one bookkeeping statement; failures are printed, never raised."""
+    try:
+        pool = await get_pg_pool()
+        await pool.execute(*to_asyncpg(sql, params))
+    except Exception as e:
+        print(f"[ORCHESTRATOR ERROR]: {error_message}: {e}")
+
+
+async def update_status_by_id_async(request_id, status):
+    """Signals the current state to the MERN backend using the Request ID."""
+    await _execute(
+        UPDATE_STATUS_SQL, (status, int(request_id)),
+        f"Failed to update status to {status} for ID {request_id}",
+    )
+
+
+async def _complete_stage(run_id, stage, run_metrics):
+    counter = _STAGE_COUNT_COLUMNS[stage][3]
+    await _execute(
+        complete_stage_sql(stage), (run_metrics.counters.get(counter, 0), run_id),
+        "Failed to write pipeline_runs",
+    )
+
+
+async def _finish_run(run_id, status, summary, stage=None, error=None):
+    await _execute(
+        finish_run_sql(stage), (status, error, json.dumps(summary), run_id),
+        "Failed to write pipeline_runs",
+    )
+
+
+async def run_pipeline_async(keyword, request_id, platform='reddit'):
+    """
+    Execute Bronze → Silver → Gold for one request without blocking the
+    event loop.
+
+    Parameters
+    ----------
+    keyword : str
+        The search term to process.
+    request_id : str or int
+        The global_keyword_id from the MERN backend.
+    platform : str
+        Target platform (default: 'reddit').
+    """
+    print(f"--- STARTING PIPELINE FOR: {keyword} (Request ID: {request_id}, Platform: {platform}) ---")
+
+    run_metrics, token = metrics.start_run()
+    run_id = str(uuid.uuid4())
+    await _execute(
+        START_RUN_SQL, (run_id, keyword, keyword.strip().lower(), int(request_id), platform),
+        "Failed to write pipeline_runs",
+    )
+    stage = None
+
+    try:
+        if platform.strip().lower() != 'reddit':
+            raise ValueError(f"Platform '{platform}' has no asyncio pipeline. Available platforms: ['reddit']")
+
+        # 1-2. BRONZE → SILVER: score chunks while ingestion continues
+        print(f"[STEP 1-2/3] Streaming raw {platform} data into sentiment analysis...")
+        stage = "silver"
+        with metrics.timed("stream"):
+            chunks = iter_ingest_keyword_async(keyword, request_id, chunk_size=BRONZE_STREAM_CHUNK_SIZE)
+            try:
+                await run_silver_async(request_id, source=chunks)
+            finally:
+                await chunks.aclose()
+        await _complete_stage(run_id, "bronze", run_metrics)
+        await _complete_stage(run_id, stage, run_metrics)
+
+        # 3. GOLD: Aggregate into Fact Tables
+        print("[STEP 3/3] Aggregating results for the Dashboard...")
+        stage = "gold"
+        with metrics.timed(stage):
+            await run_reddit_gold_async(keyword, request_id)
+        await _complete_stage(run_id, stage, run_metrics)
+        stage = None
+
+        await update_status_by_id_async(request_id, PipelineStatus.COMPLETED.value)
+        summary = run_metrics.summary()
+        await _finish_run(run_id, PipelineStatus.COMPLETED.value, summary)
+        print(f"[ORCHESTRATOR] Run {run_id} metrics: {json.dumps(summary)}")
+        print(f"--- PIPELINE COMPLETED SUCCESSFULLY FOR: {keyword} ({platform}) ---")
+
+    except Exception as e:
+        print(f"--- PIPELINE FAILED AT ERROR: {str(e)} ---")
+        await update_status_by_id_async(request_id, PipelineStatus.FAILED.value)
+        summary = run_metrics.summary()
+        await _finish_run(run_id, PipelineStatus.FAILED.value, summary, stage=stage, error=str(e))
+        print(f"[ORCHESTRATOR] Run {run_id} metrics: {json.dumps(summary)}")
+        raise e
+
+    finally:
+        metrics.end_run(token)
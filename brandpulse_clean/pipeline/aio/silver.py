@@ -0,0 +1,301 @@
+"""
+BrandPulse Clean – Async Silver Reddit Processor
+================================================
+asyncio form of pipeline/silver/reddit_processor.run_silver(): motor
+reads bronze, asyncpg writes silver, and the model runs on an executor
+thread so the event loop keeps serving other requests while it scores.
+
+Source: New. Used by run_pipeline_async() (pipeline/aio/orchestrator.py).
+
+STAGES (tasks joined by utils.stage_queue.AsyncStageQueue):
+    fetch + clean – motor cursor with BRONZE_PROJECTION, batches of
+                    ``batch_size``; cleaning runs on a worker thread.
+    inference     – run_sentiment_batch_deduped() on the inference executor
+                    (_get_inference_executor()); with SILVER_DEDUP its
+                    near-duplicate lookup (sync pymongo) runs there too.
+                    Batches of every request in the process queue there,
+                    so one loaded model is kept busy by all of them. The
+                    executor has one thread, or one per forked worker with
+                    INFERENCE_WORKERS, so the pool can score several
+                    requests' batches at once.
+    persistence   – one asyncpg connection, one transaction per batch.
+                    Posts, comments and summaries are COPYed into temp
+                    tables and inserted with the statements and conflict
+                    rules of pipeline/silver/reddit_writer.py.
+
+Cleaning, row building, batch metrics and the run summary are shared with
+the synchronous processor, so both paths write identical rows.
+"""
+
+import asyncio
+import contextvars
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from config.settings import INFERENCE_WORKERS, SILVER_BATCH_SIZE, SILVER_QUEUE_DEPTH
+from database.mongo_indexes import pending_filter
+from pipeline.aio.db import get_mongo_collections, get_pg_pool, rowcount
+from pipeline.silver.near_duplicates import run_sentiment_batch_deduped
+from pipeline.silver.reddit_processor import (
+    BRONZE_PROJECTION,
+    _Batch,
+    _child_rows,
+    _post_rows,
+    _prepare_batch,
+    _record_batch,
+    _summarize,
+)
+from pipeline.silver.reddit_writer import (
+    COMMENT_COLUMNS,
+    COMMENTS_STAGE,
+    INSERT_COMMENTS_FROM_STAGE_SQL,
+    POST_COLUMNS,
+    STAGE_TABLE_SQL,
+    SUMMARY_COLUMNS,
+    SUMMARY_STAGE,
+    UPSERT_SUMMARIES_FROM_STAGE_SQL,
+)
+from utils.stage_queue import END, AsyncStageQueue
+
+POSTS_STAGE = "silver_reddit_posts_stage"
+
+# Same conflict rule as reddit_writer.INSERT_POSTS_SQL
+INSERT_POSTS_FROM_STAGE_SQL = f"""
+INSERT INTO silver_reddit_posts ({", ".join(POST_COLUMNS)})
+SELECT {", ".join(POST_COLUMNS)} FROM {POSTS_STAGE}
+ON CONFLICT (original_bronze_id) DO UPDATE
+SET original_bronze_id = EXCLUDED.original_bronze_id
+RETURNING original_bronze_id, silver_post_id
+"""
+
+# ---------------------------------------------------------------------------
+# Inference executor — one per process, shared by every async request
+# ---------------------------------------------------------------------------
+_inference_executor = None
+
+
+def _get_inference_executor():
+    """Return the executor that runs inference, created on first call."""
+    global _inference_executor
+    if _inference_executor is None:
+        _inference_executor = ThreadPoolExecutor(
+            max_workers=max(1, INFERENCE_WORKERS), thread_name_prefix="inference",
+        )
+    return _inference_executor
+
+
+async def run_in_inference_thread(fn, *args):
+    """Run ``fn`` on the inference executor, in the caller's context (metrics)."""
+    ctx = contextvars.copy_context()
+    return await asyncio.get_running_loop().run_in_executor(
+        _get_inference_executor(), ctx.run, fn, *args
+    )
+
+
+# ---------------------------------------------------------------------------
+# PERSISTENCE
+# ---------------------------------------------------------------------------
+async def _stage(conn, stage_table, source_table, columns, rows):
+    """COPY ``rows`` into a session temp table shaped like ``source_table``."""
+    await conn.execute(STAGE_TABLE_SQL.format(
+        stage_table=stage_table, cols=", ".join(columns), source_table=source_table,
+    ))
+    await conn.execute(f"TRUNCATE {stage_table}")
+    await conn.copy_records_to_table(stage_table, records=rows, columns=list(columns))
+
+
+async def _persist_batch(conn, doc_mapping, all_scores, rid, bronze_col):
+    """
+    Persist one scored batch in a single transaction, then mark the
+    committed documents silver_processed.
+
+    Returns
+    -------
+    tuple : (posts_committed, comments_inserted)
+    """
+    post_rows, scored_items = _post_rows(doc_mapping, all_scores, rid)
+    comments_inserted = 0
+    processed_mongo_ids = []
+    if post_rows:
+        async with conn.transaction():
+            await _stage(conn, POSTS_STAGE, "silver_reddit_posts", POST_COLUMNS, post_rows)
+            returned = await conn.fetch(INSERT_POSTS_FROM_STAGE_SQL)
+            silver_post_ids = {row[0]: row[1] for row in returned}
+
+            comment_rows, summary_rows, processed_mongo_ids = _child_rows(scored_items, silver_post_ids)
+            if comment_rows:
+                await _stage(conn, COMMENTS_STAGE, "silver_reddit_comments", COMMENT_COLUMNS, comment_rows)
+                comments_inserted = rowcount(await conn.execute(INSERT_COMMENTS_FROM_STAGE_SQL))
+            if summary_rows:
+                await _stage(
+                    conn, SUMMARY_STAGE, "silver_reddit_comment_sentiment_summary",
+                    SUMMARY_COLUMNS, summary_rows,
+                )
+                await conn.execute(UPSERT_SUMMARIES_FROM_STAGE_SQL)
+
+    # Only marks processed once the Postgres transaction committed
+    if processed_mongo_ids:
+        await bronze_col.update_many(
+            {"_id": {"$in": processed_mongo_ids}},
+            {"$set": {"silver_processed": True}}
+        )
+        print(f"[SILVER] Committed {len(processed_mongo_ids)} posts and {comments_inserted} comments.")
+    return len(processed_mongo_ids), comments_inserted
+
+
+# ---------------------------------------------------------------------------
+# STAGES
+# ---------------------------------------------------------------------------
+async def _emit_batch(raw_docs, number, started, bronze_col, out_q, stage_times):
+    """Clean one fetched batch off the event loop and queue it."""
+    fetched = time.perf_counter()
+    stage_times["fetch"] += fetched - started
+    texts, doc_mapping, noise_ids = await asyncio.to_thread(_prepare_batch, raw_docs)
+    if noise_ids:
+        await bronze_col.update_many(
+            {"_id": {"$in": noise_ids}},
+            {"$set": {"silver_processed": True, "skipped_reason": "noise"}}
+        )
+    stage_times["prepare"] += time.perf_counter() - fetched
+    await out_q.put(_Batch(number, len(raw_docs), texts, doc_mapping, started))
+
+
+async def _read_bronze(bronze_col, query_filter, batch_size, out_q, stage_times, batch_number=0):
+    """Queue matching bronze documents in _id order, ``batch_size`` at a time."""
+    cursor = bronze_col.find(query_filter, BRONZE_PROJECTION).sort("_id", 1).batch_size(batch_size)
+    try:
+        raw_docs = []
+        started = time.perf_counter()
+        async for raw_doc in cursor:
+            raw_docs.append(raw_doc)
+            if len(raw_docs) < batch_size:
+                continue
+            batch_number += 1
+            await _emit_batch(raw_docs, batch_number, started, bronze_col, out_q, stage_times)
+            raw_docs = []
+            started = time.perf_counter()
+
+        if raw_docs:
+            batch_number += 1
+            await _emit_batch(raw_docs, batch_number, started, bronze_col, out_q, stage_times)
+        else:
+            stage_times["fetch"] += time.perf_counter() - started
+    finally:
+        await cursor.close()
+    return batch_number
+
+
+async def _fetch_stage(bronze_col, query_filter, source, batch_size, out_q, stage_times):
+    """
+    Producer task. With ``source`` (an async iterable of external-ID
+    chunks, e.g. iter_ingest_keyword_async()), score each chunk as it is
+    written, then sweep the request's other pending documents.
+    """
+    streamed_ids = []
+    batch_number = 0
+    if source is not None:
+        async for external_ids in source:
+            started = time.perf_counter()
+            chunk_filter = dict(query_filter, **{"meta.external_id": {"$in": list(external_ids)}})
+            raw_docs = await bronze_col.find(chunk_filter, BRONZE_PROJECTION).sort("_id", 1).to_list(None)
+            for i in range(0, len(raw_docs), batch_size):
+                batch_docs = raw_docs[i:i + batch_size]
+                streamed_ids.extend(doc["_id"] for doc in batch_docs)
+                batch_number += 1
+                await _emit_batch(batch_docs, batch_number, started, bronze_col, out_q, stage_times)
+                started = time.perf_counter()
+        query_filter = dict(query_filter, _id={"$nin": streamed_ids})
+
+    await _read_bronze(bronze_col, query_filter, batch_size, out_q, stage_times, batch_number)
+    await out_q.close()
+
+
+async def _infer_stage(in_q, out_q, stage_times):
+    """Score each batch on the inference thread."""
+    while True:
+        batch = await in_q.get()
+        if batch is END:
+            break
+        if batch.texts:
+            started = time.perf_counter()
+            try:
+                batch.scores = await run_in_inference_thread(
+                    run_sentiment_batch_deduped, batch.texts, batch.doc_mapping[0]["keyword"],
+                )
+            except Exception as e:
+                print(f"[SILVER] Inference Crash: {e}")
+                raise e
+            stage_times["infer"] += time.perf_counter() - started
+        await out_q.put(batch)
+    await out_q.close()
+
+
+async def _write_stage(in_q, rid, bronze_col, totals, stage_times):
+    """Commit scored batches on one pooled asyncpg connection."""
+    pool = await get_pg_pool()
+    async with pool.acquire() as conn:
+        while True:
+            batch = await in_q.get()
+            if batch is END:
+                break
+
+            started = time.perf_counter()
+            posts = comments = 0
+            if batch.texts:
+                try:
+                    posts, comments = await _persist_batch(conn, batch.doc_mapping, batch.scores, rid, bronze_col)
+                except Exception as e:
+                    print(f"CRITICAL PERSISTENCE ERROR: {e}")
+                    raise e
+            stage_times["write"] += time.perf_counter() - started
+            _record_batch(batch, posts, comments, totals)
+
+
+async def run_silver_async(request_id, batch_size=SILVER_BATCH_SIZE, source=None):
+    """
+    Drain the request's bronze backlog into silver (see run_silver()).
+
+    Parameters
+    ----------
+    source : async iterable of list of str, optional
+        Streaming mode: chunks of bronze meta.external_id values, as
+        yielded by iter_ingest_keyword_async().
+
+    Returns
+    -------
+    dict or None
+        Same summary as run_silver(), or None if the request ID is invalid.
+    """
+    try:
+        rid = int(request_id) if request_id else 0
+        if not rid:
+            print("[SILVER] CRITICAL: No Request ID provided. Aborting.")
+            return None
+    except (TypeError, ValueError):
+        print(f"[SILVER] CRITICAL: Invalid Request ID format: {request_id}")
+        return None
+
+    bronze_col, _, _ = get_mongo_collections()
+    query_filter = pending_filter(rid)
+
+    prepared_q = AsyncStageQueue("prepared", SILVER_QUEUE_DEPTH)
+    scored_q = AsyncStageQueue("scored", SILVER_QUEUE_DEPTH)
+    stage_times = {"fetch": 0.0, "prepare": 0.0, "infer": 0.0, "write": 0.0}
+    totals = {"batches": 0, "docs": 0, "texts": 0, "posts": 0, "comments": 0}
+
+    drain_started = time.perf_counter()
+    tasks = [
+        asyncio.ensure_future(_fetch_stage(bronze_col, query_filter, source, batch_size, prepared_q, stage_times)),
+        asyncio.ensure_future(_infer_stage(prepared_q, scored_q, stage_times)),
+        asyncio.ensure_future(_write_stage(scored_q, rid, bronze_col, totals, stage_times)),
+    ]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        # One stage failed (or we were cancelled): stop the others
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+    return _summarize(totals, stage_times, (prepared_q, scored_q), drain_started)
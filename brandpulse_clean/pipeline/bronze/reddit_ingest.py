@@ -9,11 +9,31 @@ Source: ETL_2/bronze_reddit_ingest.py
 
 ARCHITECTURAL FIXES:
     1. All module-level DB connections removed.
-       get_mongo_collections() and get_pg_connection() are called
+       get_mongo_collections() and pg_connection() are called
        inside the functions that need them.
     2. PRAW Reddit client is lazy-initialised on first call via
        _get_reddit_client() to avoid credential loading on import.
     3. Hardcoded status strings replaced with PipelineStatus enum.
+    4. Comment trees are fetched concurrently. ingest_keyword() filters
+       the search results first, then fetches the comments of every
+       accepted post on a thread pool (REDDIT_COMMENT_WORKERS), with one
+       PRAW client per thread and a shared RateLimiter holding all clients
+       to REDDIT_REQUESTS_PER_MINUTE. Results are re-assembled in search
+       order into the same bronze document shape.
+    5. Every Reddit client is built through sources.reddit_client(), so
+       REDDIT_SOURCE=record|replay captures or replays API responses
+       (pipeline/bronze/sources.py) without changing this module.
+    6. ingest_keyword() accepts ``date_windows``: search results created
+       outside them are dropped before their comments are fetched. The
+       orchestrator passes the date gaps left after reusing earlier
+       requests' silver results (pipeline/silver/reddit_reuse.py).
+    7. iter_ingest_keyword() is the streaming form of ingest_keyword():
+       with ``chunk_size`` it writes every ``chunk_size`` documents as soon
+       as their comment trees arrive and yields their external IDs, so
+       run_silver() can score them while the rest are still being fetched.
+       ingest_keyword() drains it with a single write at the end, as before.
+       Closing it early marks the request FAILED and its ingestion job
+       "aborted".
 
 All logic, limits, and filter conditions are preserved exactly:
     - Reddit search limit: 15
@@ -22,6 +42,10 @@ All logic, limits, and filter conditions are preserved exactly:
     - NSFW, non-English, media, and relevance filters: unchanged
 """
 
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timezone
 
 import praw
@@ -29,11 +53,21 @@ import psycopg2
 from psycopg2.extras import RealDictCursor
 from pymongo import UpdateOne
 from langdetect import detect, LangDetectException
-
-from config.settings import REDDIT_CLIENT_ID, REDDIT_CLIENT_SECRET, REDDIT_USER_AGENT
+import bson
+
+from config.settings import (
+    REDDIT_CLIENT_ID,
+    REDDIT_CLIENT_SECRET,
+    REDDIT_COMMENT_WORKERS,
+    REDDIT_REQUESTS_PER_MINUTE,
+    REDDIT_USER_AGENT,
+)
 from database.mongo import get_mongo_collections
-from database.postgres import get_pg_connection
+from database.postgres import pg_connection
 from models.enums import PipelineStatus
+from pipeline.bronze import sources
+from utils import metrics
+from utils.rate_limit import RateLimiter
 
 
 # ---------------------------------------------------------------------------
@@ -42,18 +76,52 @@ from models.enums import PipelineStatus
 _reddit_client = None
 
 
+def _new_reddit_client():
+    """Build a client for REDDIT_SOURCE (live praw.Reddit, recorder or replay)."""
+    return sources.reddit_client(lambda: praw.Reddit(
+        client_id=REDDIT_CLIENT_ID,
+        client_secret=REDDIT_CLIENT_SECRET,
+        user_agent=REDDIT_USER_AGENT,
+    ))
+
+
 def _get_reddit_client():
-    """Return a shared praw.Reddit instance, created on first call."""
+    """Return a shared Reddit client, created on first call."""
     global _reddit_client
     if _reddit_client is None:
-        _reddit_client = praw.Reddit(
-            client_id=REDDIT_CLIENT_ID,
-            client_secret=REDDIT_CLIENT_SECRET,
-            user_agent=REDDIT_USER_AGENT,
-        )
+        _reddit_client = _new_reddit_client()
     return _reddit_client
 
 
+# ---------------------------------------------------------------------------
+# Comment-fetch clients — PRAW objects are not thread-safe, so every
+# concurrent fetch borrows its own praw.Reddit from this pool.
+# ---------------------------------------------------------------------------
+_comment_clients = queue.SimpleQueue()
+_rate_limiter = None
+
+
+def _get_rate_limiter():
+    """Return the process-wide Reddit request budget, created on first call."""
+    global _rate_limiter
+    if _rate_limiter is None:
+        _rate_limiter = RateLimiter(REDDIT_REQUESTS_PER_MINUTE)
+    return _rate_limiter
+
+
+@contextmanager
+def _borrow_comment_client():
+    """Lend a praw.Reddit to one thread, creating it if the pool is empty."""
+    try:
+        client = _comment_clients.get_nowait()
+    except queue.Empty:
+        client = _new_reddit_client()
+    try:
+        yield client
+    finally:
+        _comment_clients.put(client)
+
+
 # ---------------------------------------------------------------------------
 # UTILS
 # ---------------------------------------------------------------------------
@@ -82,54 +150,47 @@ def is_english(text: str) -> bool:
 # POSTGRES HELPERS
 # ---------------------------------------------------------------------------
 def fetch_keywords():
-    pg = get_pg_connection()
-    try:
-        with pg.cursor(cursor_factory=RealDictCursor) as cur:
-            cur.execute("""
-                SELECT global_keyword_id, keyword
-                FROM global_keywords
-                WHERE bronze_processed = FALSE
-            """)
-            return cur.fetchall()
-    finally:
-        pg.close()
+    with pg_connection() as pg, pg.cursor(cursor_factory=RealDictCursor) as cur:
+        cur.execute("""
+            SELECT global_keyword_id, keyword
+            FROM global_keywords
+            WHERE bronze_processed = FALSE
+        """)
+        return cur.fetchall()
+
+
+MARK_PROCESSED_SQL = """
+    UPDATE global_keywords
+    SET bronze_processed = TRUE
+    WHERE global_keyword_id = %s
+"""
+
+MARK_STATUS_SQL = """
+    UPDATE global_keywords
+    SET status = %s,
+        last_run_at = NOW()
+    WHERE global_keyword_id = %s
+"""
 
 
 def mark_keyword_processed(keyword_id):
-    pg = get_pg_connection()
-    try:
-        with pg.cursor() as cur:
-            cur.execute("""
-                UPDATE global_keywords
-                SET bronze_processed = TRUE
-                WHERE global_keyword_id = %s
-            """, (keyword_id,))
+    with pg_connection() as pg, pg.cursor() as cur:
+        cur.execute(MARK_PROCESSED_SQL, (keyword_id,))
         pg.commit()
-    finally:
-        pg.close()
 
 
 def mark_keyword_status(keyword_id, status):
-    pg = get_pg_connection()
-    try:
-        with pg.cursor() as cur:
-            cur.execute("""
-                UPDATE global_keywords
-                SET status = %s,
-                    last_run_at = NOW()
-                WHERE global_keyword_id = %s
-            """, (status, keyword_id))
+    with pg_connection() as pg, pg.cursor() as cur:
+        cur.execute(MARK_STATUS_SQL, (status, keyword_id))
         pg.commit()
-    finally:
-        pg.close()
 
 
 # ---------------------------------------------------------------------------
 # EXTRACTION
 # ---------------------------------------------------------------------------
-def extract_submission(submission):
-    # This forces PRAW to actually fetch the data
-    post_data = {
+def extract_post(submission):
+    """Post fields of a search result (already loaded, no extra request)."""
+    return {
         "title": submission.title,
         "selftext": submission.selftext,
         "author": str(submission.author),
@@ -138,6 +199,9 @@ def extract_submission(submission):
         "url": submission.url
     }
 
+
+def extract_comments(submission):
+    """Fetch the top comments of ``submission`` (one HTTP round trip)."""
     comments_data = []
     submission.comments.replace_more(limit=0)  # Get top comments only for speed
     for comment in submission.comments.list()[:10]:
@@ -147,14 +211,141 @@ def extract_submission(submission):
             "score": comment.score,
             "created_utc": comment.created_utc
         })
+    return comments_data
+
+
+def in_date_windows(created_utc, date_windows):
+    """True if the UTC day of ``created_utc`` falls in one of the inclusive (start, end) windows."""
+    day = datetime.fromtimestamp(created_utc, tz=timezone.utc).date()
+    return any(start <= day <= end for start, end in date_windows)
+
+
+def reject_reason(submission, keyword, date_windows=None):
+    """
+    Why a search result is not ingested, or None to keep it.
+
+    Returns
+    -------
+    str or None
+        "nsfw", "covered", "non_english", "media" or "irrelevant".
+    """
+    # FILTER: Skip NSFW (Already in query, but double check)
+    if submission.over_18:
+        return "nsfw"
+
+    # FILTER: Skip dates already covered by reused silver results
+    if date_windows is not None and not in_date_windows(submission.created_utc, date_windows):
+        return "covered"
+
+    # FILTER: Skip Non-English
+    if not is_english(submission.title + " " + submission.selftext):
+        return "non_english"
+
+    # FILTER: Strict Media Check (No videos, images, or GIFs)
+    # Check 1: is_video flag
+    if getattr(submission, 'is_video', False):
+        return "media"
+
+    # Check 2: URL file extensions
+    url_lower = submission.url.lower() if submission.url else ""
+    if url_lower.endswith(('.jpg', '.jpeg', '.png', '.gif', '.mp4', '.mov', '.webp')):
+        return "media"
+
+    # Check 3: Post hint (often indicates embedded media)
+    post_hint = getattr(submission, 'post_hint', '')
+    if post_hint in ['image', 'hosted:video', 'rich:video']:
+        return "media"
+
+    # FILTER: Strict Relevance Check
+    # Reddit's search is fuzzy. We ensure the keyword is actually in the title or body.
+    full_text = (submission.title + " " + submission.selftext).lower()
+    if keyword.lower() not in full_text:
+        return "irrelevant"
+
+    return None
+
+
+def bronze_upsert(keyword, keyword_id, submission, post_raw, comments_raw):
+    """
+    The bronze upsert for one post.
 
-    return post_data, comments_data
+    Returns
+    -------
+    tuple : (UpdateOne, base_doc)
+    """
+    # Base document for new inserts (without global_keyword_id and silver_processed)
+    base_doc = {
+        "platform": "reddit",
+        "keyword": keyword,
+        "fetched_at": datetime.now(timezone.utc),
+        "raw_post": post_raw,
+        "raw_comments": comments_raw,
+        "meta": {
+            "external_id": submission.name,
+            "subreddit": submission.subreddit.display_name,
+            "api_endpoint": "reddit.search",
+            "response_status": 200
+        }
+    }
+
+    operation = UpdateOne(
+        {
+            "platform": "reddit",
+            "meta.external_id": submission.name,
+            "keyword": keyword
+        },
+        {
+            "$setOnInsert": base_doc,
+            # CRITICAL FIX: Always update these fields to link doc to current request
+            "$set": {
+                "global_keyword_id": keyword_id,
+                "silver_processed": False
+            }
+        },
+        upsert=True
+    )
+    return operation, base_doc
+
+
+def extract_submission(submission):
+    # This forces PRAW to actually fetch the data
+    return extract_post(submission), extract_comments(submission)
+
+
+def fetch_comments(submission_id):
+    """
+    Thread-pool task: fetch one comment tree on a borrowed client,
+    within the shared rate limit.
+    """
+    _get_rate_limiter().acquire()
+    with _borrow_comment_client() as client:
+        return extract_comments(client.submission(id=submission_id))
 
 
 # ---------------------------------------------------------------------------
 # INGESTION
 # ---------------------------------------------------------------------------
-def ingest_keyword(row_or_keyword, request_id=None):
+def ingest_keyword(row_or_keyword, request_id=None, date_windows=None):
+    for _ in iter_ingest_keyword(row_or_keyword, request_id, date_windows=date_windows):
+        pass
+
+
+def iter_ingest_keyword(row_or_keyword, request_id=None, date_windows=None, chunk_size=None):
+    """
+    Ingest one keyword, yielding each written chunk.
+
+    Parameters
+    ----------
+    chunk_size : int, optional
+        Write to MongoDB every ``chunk_size`` documents. By default all
+        documents are written at once after the last comment tree.
+
+    Yields
+    ------
+    list of str
+        meta.external_id of every document in the chunk just written
+        (inserted or re-linked to this request).
+    """
     if isinstance(row_or_keyword, dict):
         keyword_id = int(row_or_keyword["global_keyword_id"])  # Ensure integer type
         keyword = row_or_keyword["keyword"]
@@ -180,15 +371,41 @@ def ingest_keyword(row_or_keyword, request_id=None):
     }).inserted_id
 
     operations = []
+    chunk_ids = []
     processed = 0
     skipped_non_english = 0
     skipped_nsfw = 0
+    skipped_covered = 0
     errors = 0
     inserted = 0
+    job_status = "completed"
 
     print(f"[BRONZE] Ingesting keyword: {keyword}")
 
+    def write_chunk():
+        """bulk_write the pending operations; returns the number of new documents."""
+        with metrics.timed("bronze.write"):
+            result = bronze_col.bulk_write(operations, ordered=False)
+        metrics.count("bronze.write", len(operations))
+        new_docs = result.upserted_count + result.inserted_count
+        metrics.count("bronze.docs", new_docs)
+        operations.clear()
+        return new_docs
+
+    def record_error(submission, e):
+        errors_col.insert_one({
+            "platform": "reddit",
+            "keyword": keyword,
+            "external_id": getattr(submission, "name", None),
+            "error": str(e),
+            "occurred_at": datetime.now(timezone.utc)
+        })
+
     try:
+        # PASS 1: filter search results; collect posts whose comments we need
+        accepted = []
+        search_started = time.perf_counter()
+        _get_rate_limiter().acquire()
         #  Reduced limit from 50 to 15 for faster processing
         for submission in reddit.subreddit("all").search(
                 query=f'"{keyword}" nsfw:no',  # Exact phrase match with quotes
@@ -197,89 +414,58 @@ def ingest_keyword(row_or_keyword, request_id=None):
                 time_filter="month"  # Month instead of day for more data availability
         ):
             try:
-                # FILTER: Skip NSFW (Already in query, but double check)
-                if submission.over_18:
+                reason = reject_reason(submission, keyword, date_windows)
+                if reason == "nsfw":
                     skipped_nsfw += 1
-                    continue
-
-                # FILTER: Skip Non-English
-                if not is_english(submission.title + " " + submission.selftext):
+                elif reason == "covered":
+                    skipped_covered += 1
+                elif reason == "non_english":
                     skipped_non_english += 1
+                if reason is not None:
                     continue
 
-                # FILTER: Strict Media Check (No videos, images, or GIFs)
-                # Check 1: is_video flag
-                if getattr(submission, 'is_video', False):
-                    continue
-
-                # Check 2: URL file extensions
-                url_lower = submission.url.lower() if submission.url else ""
-                if url_lower.endswith(('.jpg', '.jpeg', '.png', '.gif', '.mp4', '.mov', '.webp')):
-                    continue
-
-                # Check 3: Post hint (often indicates embedded media)
-                post_hint = getattr(submission, 'post_hint', '')
-                if post_hint in ['image', 'hosted:video', 'rich:video']:
-                    continue
-
-                # FILTER: Strict Relevance Check
-                # Reddit's search is fuzzy. We ensure the keyword is actually in the title or body.
-                full_text = (submission.title + " " + submission.selftext).lower()
-                if keyword.lower() not in full_text:
-                    continue
-
-                post_raw, comments_raw = extract_submission(submission)
-
-                # Base document for new inserts (without global_keyword_id and silver_processed)
-                base_doc = {
-                    "platform": "reddit",
-                    "keyword": keyword,
-                    "fetched_at": datetime.now(timezone.utc),
-                    "raw_post": post_raw,
-                    "raw_comments": comments_raw,
-                    "meta": {
-                        "external_id": submission.name,
-                        "subreddit": submission.subreddit.display_name,
-                        "api_endpoint": "reddit.search",
-                        "response_status": 200
-                    }
-                }
-
-                operations.append(
-                    UpdateOne(
-                        {
-                            "platform": "reddit",
-                            "meta.external_id": submission.name,
-                            "keyword": keyword
-                        },
-                        {
-                            "$setOnInsert": base_doc,
-                            # CRITICAL FIX: Always update these fields to link doc to current request
-                            "$set": {
-                                "global_keyword_id": keyword_id,
-                                "silver_processed": False
-                            }
-                        },
-                        upsert=True
-                    )
-                )
-                processed += 1
+                accepted.append((submission, extract_post(submission)))
 
             except Exception as e:
                 errors += 1
-                errors_col.insert_one({
-                    "platform": "reddit",
-                    "keyword": keyword,
-                    "external_id": getattr(submission, "name", None),
-                    "error": str(e),
-                    "occurred_at": datetime.now(timezone.utc)
-                })
+                record_error(submission, e)
+
+        metrics.add_time("bronze.search", time.perf_counter() - search_started)
+        metrics.count("bronze.search", len(accepted))
+
+        # PASS 2: fetch comment trees concurrently, then rebuild documents in search order
+        comments_started = time.perf_counter()
+        comments_fetched = 0
+        with ThreadPoolExecutor(max_workers=REDDIT_COMMENT_WORKERS, thread_name_prefix="reddit-comments") as pool:
+            futures = [pool.submit(fetch_comments, submission.id) for submission, _ in accepted]
+
+            for (submission, post_raw), future in zip(accepted, futures):
+                try:
+                    comments_raw = future.result()
+                    comments_fetched += len(comments_raw)
+
+                    operation, base_doc = bronze_upsert(keyword, keyword_id, submission, post_raw, comments_raw)
+                    operations.append(operation)
+                    chunk_ids.append(submission.name)
+                    processed += 1
+                    metrics.count("bronze.write.bytes", len(bson.encode(base_doc)))
+
+                    if chunk_size and len(operations) >= chunk_size:
+                        inserted += write_chunk()
+                        yield list(chunk_ids)
+                        chunk_ids.clear()
+
+                except Exception as e:
+                    errors += 1
+                    record_error(submission, e)
+        metrics.add_time("bronze.comments", time.perf_counter() - comments_started)
+        metrics.count("bronze.comments", comments_fetched)
 
         # Finalize the write
-        inserted = 0
         if operations:
-            result = bronze_col.bulk_write(operations, ordered=False)
-            inserted = result.upserted_count + result.inserted_count
+            inserted += write_chunk()
+            yield list(chunk_ids)
+            chunk_ids.clear()
 
         # 2. SUCCESS STATE: Mark as processed and done
         if inserted > 0:
@@ -289,6 +475,13 @@ def ingest_keyword(row_or_keyword, request_id=None):
             # If search returned 0 results, we mark as IDLE so it can be retried
             mark_keyword_status(keyword_id, PipelineStatus.IDLE.value)
 
+    except GeneratorExit:
+        # 4. ABORTED STATE: the consumer stopped before ingestion finished
+        job_status = "aborted"
+        mark_keyword_status(keyword_id, PipelineStatus.FAILED.value)
+        print(f"[BRONZE] Ingestion of {keyword} stopped by its consumer")
+        raise
+
     except Exception as e:
         # 3. FAILURE STATE: Ensure the UI knows the pipe broke
         mark_keyword_status(keyword_id, PipelineStatus.FAILED.value)
@@ -300,21 +493,23 @@ def ingest_keyword(row_or_keyword, request_id=None):
         })
         print(f"[BRONZE] Critical failure for {keyword}: {e}")
 
-    # Job logging remains the same
-    jobs_col.update_one(
-        {"_id": job_id},
-        {"$set": {
-            "finished_at": datetime.now(timezone.utc),
-            "status": "completed",
-            "stats": {
-                "processed": processed,
-                "inserted": inserted,
-                "skipped_nsfw": skipped_nsfw,
-                "skipped_non_english": skipped_non_english,
-                "errors": errors
-            }
-        }}
-    )
+    finally:
+        # Job logging runs even when the generator is closed early
+        jobs_col.update_one(
+            {"_id": job_id},
+            {"$set": {
+                "finished_at": datetime.now(timezone.utc),
+                "status": job_status,
+                "stats": {
+                    "processed": processed,
+                    "inserted": inserted,
+                    "skipped_nsfw": skipped_nsfw,
+                    "skipped_non_english": skipped_non_english,
+                    "skipped_covered": skipped_covered,
+                    "errors": errors
+                }
+            }}
+        )
     print(f"[BRONZE] Completed {keyword} | Inserted: {inserted}")
 
 
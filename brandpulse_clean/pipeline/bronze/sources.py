@@ -0,0 +1,360 @@
+"""
+BrandPulse Clean – Bronze Source Clients (live / record / replay)
+=================================================================
+Lets bronze ingestion run without network access, so its throughput can
+be measured deterministically in CI or on a benchmark host.
+
+Source: New. Selected by REDDIT_SOURCE (config/settings.py):
+
+    live   – praw.Reddit, unchanged behaviour (default)
+    record – praw.Reddit wrapped so every search listing and comment tree
+             the ingest reads is also saved as a fixture
+    replay – ReplayReddit serves the fixtures; no credentials, no network
+
+reddit_ingest.py builds every client through reddit_client(), so the same
+ingest code runs in all three modes.
+
+FIXTURES:
+    One gzip-compressed JSON file per API response under
+    SOURCE_FIXTURE_DIR/reddit/<kind>/<sha1 of request key>.json.gz, where
+    kind is "search" (key: subreddit, query, sort, time_filter, limit) or
+    "comments" (key: submission id). Files are written atomically, so
+    concurrent comment fetches can record at the same time. Only the
+    fields bronze reads are stored (SUBMISSION_FIELDS / COMMENT_FIELDS).
+
+REPLAY:
+    Every replayed response waits SOURCE_REPLAY_LATENCY_MS ±
+    SOURCE_REPLAY_JITTER_MS (jitter seeded by the request key, so runs are
+    repeatable). ReplayReddit.auth.limits reports a simulated quota of
+    SOURCE_REPLAY_RATE_LIMIT requests per SOURCE_REPLAY_RATE_WINDOW_S,
+    shaped like PRAW's (which comes from Reddit's X-Ratelimit-* headers).
+    The shared RateLimiter in reddit_ingest.py still applies; raise
+    REDDIT_REQUESTS_PER_MINUTE to benchmark past the live quota.
+
+Usage:
+    REDDIT_SOURCE=record python main.py "iphone 15" 42 reddit   # capture once
+    REDDIT_SOURCE=replay python main.py "iphone 15" 42 reddit   # replay offline
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+from config.settings import (
+    REDDIT_SOURCE,
+    SOURCE_FIXTURE_DIR,
+    SOURCE_REPLAY_JITTER_MS,
+    SOURCE_REPLAY_LATENCY_MS,
+    SOURCE_REPLAY_RATE_LIMIT,
+    SOURCE_REPLAY_RATE_WINDOW_S,
+)
+
+SOURCE_MODES = ("live", "record", "replay")
+
+# Attributes bronze reads from a search result / comment
+SUBMISSION_FIELDS = (
+    "id", "name", "title", "selftext", "author", "score", "created_utc",
+    "url", "over_18", "is_video", "post_hint", "subreddit",
+)
+COMMENT_FIELDS = ("body", "author", "score", "created_utc")
+
+
+# ---------------------------------------------------------------------------
+# FIXTURE STORE
+# ---------------------------------------------------------------------------
+class FixtureStore:
+    """Gzip JSON fixtures addressed by (kind, request key)."""
+
+    def __init__(self, root):
+        self.root = Path(root)
+
+    def path(self, kind: str, key: str) -> Path:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return self.root / kind / f"{digest}.json.gz"
+
+    def save(self, kind: str, key: str, payload):
+        path = self.path(kind, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as gz:
+                gz.write(json.dumps({"key": key, "payload": payload}).encode("utf-8"))
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def load(self, kind: str, key: str):
+        path = self.path(kind, key)
+        try:
+            with gzip.open(path, "rb") as gz:
+                return json.loads(gz.read().decode("utf-8"))["payload"]
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"No recorded {kind} fixture for {key!r} ({path}). "
+                f"Capture it first with REDDIT_SOURCE=record."
+            ) from None
+
+
+def _search_key(subreddit, query, sort, time_filter, limit) -> str:
+    return json.dumps([subreddit, query, sort, time_filter, limit])
+
+
+def _record_fields(obj, fields) -> dict:
+    """Loaded attributes of a PRAW object (vars() avoids PRAW's lazy fetch)."""
+    data = vars(obj)
+    record = {}
+    for field in fields:
+        if field not in data:
+            continue
+        value = data[field]
+        if field == "subreddit":
+            value = getattr(value, "display_name", None) or str(value)
+        elif field == "author":
+            value = str(value)
+        record[field] = value
+    return record
+
+
+# ---------------------------------------------------------------------------
+# RECORDING (wraps a live praw.Reddit)
+# ---------------------------------------------------------------------------
+class _RecordingCommentForest:
+    def __init__(self, forest, store, submission_id):
+        self._forest = forest
+        self._store = store
+        self._submission_id = submission_id
+
+    def replace_more(self, limit=32, threshold=0):
+        return self._forest.replace_more(limit=limit, threshold=threshold)
+
+    def list(self):
+        comments = self._forest.list()
+        self._store.save(
+            "reddit/comments", self._submission_id,
+            [_record_fields(c, COMMENT_FIELDS) for c in comments],
+        )
+        return comments
+
+
+class _RecordingSubmission:
+    def __init__(self, submission, store, submission_id):
+        self._submission = submission
+        self._store = store
+        self._submission_id = submission_id
+
+    @property
+    def comments(self):
+        return _RecordingCommentForest(self._submission.comments, self._store, self._submission_id)
+
+    def __getattr__(self, name):
+        return getattr(self._submission, name)
+
+
+class _RecordingSubreddit:
+    def __init__(self, subreddit, store, name):
+        self._subreddit = subreddit
+        self._store = store
+        self._name = name
+
+    def search(self, query, sort="relevance", syntax="lucene", time_filter="all", **generator_kwargs):
+        records = []
+        for submission in self._subreddit.search(
+                query, sort=sort, syntax=syntax, time_filter=time_filter, **generator_kwargs
+        ):
+            records.append(_record_fields(submission, SUBMISSION_FIELDS))
+            yield submission
+        key = _search_key(self._name, query, sort, time_filter, generator_kwargs.get("limit"))
+        self._store.save("reddit/search", key, records)
+
+    def __getattr__(self, name):
+        return getattr(self._subreddit, name)
+
+
+class RecordingReddit:
+    """praw.Reddit proxy that saves the responses bronze reads as fixtures."""
+
+    def __init__(self, reddit, store):
+        self._reddit = reddit
+        self._store = store
+
+    def subreddit(self, display_name):
+        return _RecordingSubreddit(self._reddit.subreddit(display_name), self._store, display_name)
+
+    def submission(self, id=None, url=None):
+        submission = self._reddit.submission(id=id, url=url)
+        return _RecordingSubmission(submission, self._store, id or submission.id)
+
+    def __getattr__(self, name):
+        return getattr(self._reddit, name)
+
+
+# ---------------------------------------------------------------------------
+# REPLAY
+# ---------------------------------------------------------------------------
+class ReplayQuota:
+    """Simulated per-window request quota shared by all replay clients."""
+
+    def __init__(self, limit: int, window_s: float):
+        self.limit = limit
+        self.window_s = window_s
+        self._lock = threading.Lock()
+        self._window_start = time.time()
+        self._used = 0
+
+    def consume(self) -> dict:
+        """Count one request; return the limits as they would be reported after it."""
+        with self._lock:
+            now = time.time()
+            if now - self._window_start >= self.window_s:
+                self._window_start = now
+                self._used = 0
+            self._used += 1
+            return self._limits(now)
+
+    def limits(self) -> dict:
+        with self._lock:
+            return self._limits(time.time())
+
+    def _limits(self, now) -> dict:
+        return {
+            "remaining": float(max(0, self.limit - self._used)),
+            "used": self._used,
+            "reset_timestamp": self._window_start + self.window_s,
+        }
+
+
+def replay_delay(key: str, latency_ms: float, jitter_ms: float):
+    """Sleep the injected latency for one replayed request."""
+    delay_ms = latency_ms
+    if jitter_ms:
+        delay_ms += random.Random(key).uniform(-jitter_ms, jitter_ms)
+    if delay_ms > 0:
+        time.sleep(delay_ms / 1000.0)
+
+
+class _ReplayCommentForest:
+    def __init__(self, comments):
+        self._comments = comments
+
+    def replace_more(self, limit=32, threshold=0):
+        return []
+
+    def list(self):
+        return list(self._comments)
+
+
+class _ReplaySubmission:
+    def __init__(self, client, record=None, submission_id=None):
+        self._client = client
+        self._comments = None
+        if record is not None:
+            for field, value in record.items():
+                setattr(self, field, value)
+            self.subreddit = SimpleNamespace(display_name=record.get("subreddit"))
+        if submission_id is not None:
+            self.id = submission_id
+
+    @property
+    def comments(self):
+        # PRAW fetches the comment tree on first access; so does replay
+        if self._comments is None:
+            records = self._client._fetch("reddit/comments", self.id)
+            self._comments = _ReplayCommentForest([SimpleNamespace(**r) for r in records])
+        return self._comments
+
+
+class _ReplaySubreddit:
+    def __init__(self, client, name):
+        self._client = client
+        self.display_name = name
+
+    def search(self, query, sort="relevance", syntax="lucene", time_filter="all", **generator_kwargs):
+        key = _search_key(self.display_name, query, sort, time_filter, generator_kwargs.get("limit"))
+        for record in self._client._fetch("reddit/search", key):
+            yield _ReplaySubmission(self._client, record=record)
+
+
+class ReplayReddit:
+    """
+    Offline stand-in for praw.Reddit serving recorded fixtures.
+
+    Supports the calls bronze makes: subreddit(name).search(...),
+    submission(id=...).comments and auth.limits.
+    """
+
+    def __init__(self, store, quota, latency_ms=0.0, jitter_ms=0.0):
+        self._store = store
+        self._quota = quota
+        self._latency_ms = latency_ms
+        self._jitter_ms = jitter_ms
+        self.auth = SimpleNamespace(limits={})
+
+    def _fetch(self, kind, key):
+        payload = self._store.load(kind, key)
+        replay_delay(key, self._latency_ms, self._jitter_ms)
+        self.auth.limits = self._quota.consume()
+        return payload
+
+    def subreddit(self, display_name):
+        return _ReplaySubreddit(self, display_name)
+
+    def submission(self, id=None, url=None):
+        if id is None:
+            raise ValueError("ReplayReddit.submission() needs an id")
+        return _ReplaySubmission(self, submission_id=id)
+
+
+# ---------------------------------------------------------------------------
+# FACTORY
+# ---------------------------------------------------------------------------
+_replay_quota = None
+_quota_lock = threading.Lock()
+
+
+def _get_replay_quota():
+    """Return the process-wide simulated quota, created on first call."""
+    global _replay_quota
+    with _quota_lock:
+        if _replay_quota is None:
+            _replay_quota = ReplayQuota(SOURCE_REPLAY_RATE_LIMIT, SOURCE_REPLAY_RATE_WINDOW_S)
+        return _replay_quota
+
+
+def reddit_client(live_factory):
+    """
+    Build a Reddit client for the configured REDDIT_SOURCE.
+
+    Parameters
+    ----------
+    live_factory : callable
+        Returns a new praw.Reddit. Not called in replay mode.
+
+    Raises
+    ------
+    ValueError
+        If REDDIT_SOURCE is not one of SOURCE_MODES.
+    """
+    if REDDIT_SOURCE not in SOURCE_MODES:
+        raise ValueError(
+            f"Unknown REDDIT_SOURCE '{REDDIT_SOURCE}'. Expected one of {', '.join(SOURCE_MODES)}."
+        )
+
+    store = FixtureStore(SOURCE_FIXTURE_DIR)
+    if REDDIT_SOURCE == "replay":
+        return ReplayReddit(
+            store, _get_replay_quota(),
+            latency_ms=SOURCE_REPLAY_LATENCY_MS, jitter_ms=SOURCE_REPLAY_JITTER_MS,
+        )
+
+    client = live_factory()
+    if REDDIT_SOURCE == "record":
+        return RecordingReddit(client, store)
+    return client
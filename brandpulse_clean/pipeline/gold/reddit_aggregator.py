@@ -7,83 +7,181 @@ fact_sentiment_events table.
 Source: ETL_2/gold_layer.py (Reddit branch only, lines 141-169)
 
 ARCHITECTURAL FIX:
-    Module-level psycopg2.connect() replaced with get_pg_connection()
-    called inside run_reddit_gold().
+    Module-level psycopg2.connect() replaced with pg_connection()
+    used inside run_reddit_gold().
+
+INCREMENTAL LOADING (WATERMARKS):
+    The original marked every loaded silver row with
+    `UPDATE ... SET gold_processed = TRUE`. That rewrote each silver post
+    and comment summary, re-scanned silver_reddit_posts by
+    global_keyword_id on every pass, and left dead tuples for vacuum.
+
+    Each content type now keeps a per-request high-water mark in
+    gold_watermarks (last loaded silver_post_id / silver_comment_id).
+    Every load is one data-modifying CTE:
+        src  – silver rows of the request above the watermark (read once)
+        ins  – INSERT ... SELECT FROM src into fact_sentiment_events
+        roll – add the inserted facts to gold_daily_sentiment_rollup
+        mark – advance the watermark to MAX(id) in src
+    Source rows and watermark come from the same snapshot, so a row is
+    never skipped or loaded twice. gold_processed is no longer written.
+    build_fact_load_sql() wraps each content type's src / ins bodies in
+    the shared watermark, roll and mark clauses.
+
+DAILY ROLLUP:
+    gold_daily_sentiment_rollup holds (request, date_id, platform,
+    content_type, sentiment) → item_count, score_sum. It is incremented
+    from the facts each load actually inserted (RETURNING of ins, so
+    ON CONFLICT skips are not double counted). Dashboard summaries read
+    it through pipeline/gold/rollup_queries.py or the equivalent SQL in
+    routes/, scanning one row per day instead of every silver row.
+
+PRECOMPUTED DIMENSION KEYS:
+    Silver rows carry date_id / time_id (comment_date_id /
+    comment_time_id), written by the silver writer via utils/dim_keys.py.
+    dim_date and dim_time are joined on their primary keys instead of
+    DATE(created_at_utc) and EXTRACT(HOUR/MINUTE ...) per row, and the
+    request date range is an integer range on the stored key. This also
+    fixes the post join, which referenced a non-existent
+    dim_date.date_actual column. Rows still missing keys are filled by
+    pipeline/silver/dim_key_backfill.py before each load.
 
 SQL STATEMENTS:
-    INSERT_POST_SENTIMENT_SQL and INSERT_COMMENT_SENTIMENT_SQL are
-    copied EXACTLY from the original — zero SQL changes. All
-    hardcoded dimension IDs (model=1, platform=1, content_type=1|2),
-    COALESCE fallbacks, and the ON CONFLICT constraint name are
-    preserved verbatim.
+    The fact rows are otherwise built as in the original: all hardcoded
+    dimension IDs (model=1, platform=1, content_type=1|2), COALESCE
+    fallbacks and the ON CONFLICT constraint name are preserved verbatim.
 
 """
 
-from database.postgres import get_pg_connection
+from database.postgres import pg_connection
+from pipeline.silver.dim_key_backfill import backfill_request
+from utils import metrics
 
 # =====================================================
-# SQL STATEMENTS (SET-BASED) — EXACT COPIES
+# SQL STATEMENTS (SET-BASED, WATERMARK-DRIVEN)
 # =====================================================
 
-# INSERT POSTS into fact table (content_type_id = 1)
-# Filters by dates from global_keywords if specified
-INSERT_POST_SENTIMENT_SQL = """
-INSERT INTO fact_sentiment_events (
-    silver_content_id, model_id, platform_id, content_type_id,
-    sentiment_id, date_id, time_id, sentiment_score, request_id
+def build_fact_load_sql(source_sql, fact_sql, platform_id, content_type_id, id_column):
+    """
+    Build one watermark-driven fact load (src → ins → roll → mark).
+
+    Parameters
+    ----------
+    source_sql : str
+        SELECT of the request's silver rows, ending in a WHERE clause; the
+        watermark condition on ``id_column`` is appended to it.
+    fact_sql : str
+        INSERT INTO fact_sentiment_events ... SELECT ... FROM src, without
+        its ON CONFLICT / RETURNING clauses.
+    platform_id, content_type_id : int
+        Key of the request's gold_watermarks row.
+    id_column : str
+        Qualified silver id column (e.g. ``sp.silver_post_id``) the
+        watermark tracks.
+
+    Returns
+    -------
+    str
+        One statement returning (facts inserted, source rows read).
+    """
+    column = id_column.split(".")[-1]
+    return f"""
+WITH src AS (
+    {source_sql.strip()}
+    AND {id_column} > COALESCE((
+        SELECT last_silver_id FROM gold_watermarks
+        WHERE request_id = %(request_id)s AND platform_id = {platform_id} AND content_type_id = {content_type_id}
+    ), 0)
+),
+ins AS (
+    {fact_sql.strip()}
+    ON CONFLICT ON CONSTRAINT fact_sentiment_events_unique_content DO NOTHING
+    RETURNING request_id, date_id, platform_id, content_type_id, sentiment_id, sentiment_score
+),
+roll AS (
+    INSERT INTO gold_daily_sentiment_rollup (
+        request_id, date_id, platform_id, content_type_id, sentiment_id, item_count, score_sum
+    )
+    SELECT request_id, date_id, platform_id, content_type_id, sentiment_id, COUNT(*), SUM(sentiment_score)
+    FROM ins
+    GROUP BY request_id, date_id, platform_id, content_type_id, sentiment_id
+    ON CONFLICT (request_id, date_id, platform_id, content_type_id, sentiment_id) DO UPDATE
+    SET item_count = gold_daily_sentiment_rollup.item_count + EXCLUDED.item_count,
+        score_sum = gold_daily_sentiment_rollup.score_sum + EXCLUDED.score_sum
+),
+mark AS (
+    INSERT INTO gold_watermarks (request_id, platform_id, content_type_id, last_silver_id)
+    SELECT %(request_id)s, {platform_id}, {content_type_id}, MAX({column}) FROM src
+    HAVING MAX({column}) IS NOT NULL
+    ON CONFLICT (request_id, platform_id, content_type_id) DO UPDATE
+    SET last_silver_id = GREATEST(gold_watermarks.last_silver_id, EXCLUDED.last_silver_id),
+        updated_at = NOW()
 )
-SELECT
-    sp.silver_post_id, 
-    1, -- Model: RoBERTa
-    1, -- Platform: Reddit
-    1, -- Content Type: Post
-    ds.sentiment_id, 
-    COALESCE(dd.date_id, 20251231),
-    COALESCE(dt.time_id, 1200),
-    sp.post_sentiment_score, 
-    %s
-FROM silver_reddit_posts sp
-JOIN global_keywords gk ON gk.global_keyword_id = sp.global_keyword_id
-JOIN dim_sentiment ds ON ds.sentiment_label = sp.post_sentiment_label
-LEFT JOIN dim_date dd ON dd.date_actual = DATE(sp.created_at_utc)
-LEFT JOIN dim_time dt ON dt.time_id = (EXTRACT(HOUR FROM sp.created_at_utc) * 100 + EXTRACT(MINUTE FROM sp.created_at_utc))
-WHERE sp.global_keyword_id = %s
-AND sp.gold_processed = FALSE
-AND (gk.start_date IS NULL OR DATE(sp.created_at_utc) >= gk.start_date)
-AND (gk.end_date IS NULL OR DATE(sp.created_at_utc) <= gk.end_date)
-ON CONFLICT ON CONSTRAINT fact_sentiment_events_unique_content DO NOTHING;
+SELECT (SELECT COUNT(*) FROM ins), (SELECT COUNT(*) FROM src);
 """
 
+
+# INSERT POSTS into fact table (content_type_id = 1)
+# Filters by dates from global_keywords if specified
+INSERT_POST_SENTIMENT_SQL = build_fact_load_sql("""
+    SELECT sp.*
+    FROM silver_reddit_posts sp
+    WHERE sp.global_keyword_id = %(request_id)s
+""", """
+    INSERT INTO fact_sentiment_events (
+        silver_content_id, model_id, platform_id, content_type_id,
+        sentiment_id, date_id, time_id, sentiment_score, request_id
+    )
+    SELECT
+        sp.silver_post_id,
+        1, -- Model: RoBERTa
+        1, -- Platform: Reddit
+        1, -- Content Type: Post
+        ds.sentiment_id,
+        COALESCE(dd.date_id, 20251231),
+        COALESCE(dt.time_id, 1200),
+        sp.post_sentiment_score,
+        %(request_id)s
+    FROM src sp
+    JOIN global_keywords gk ON gk.global_keyword_id = sp.global_keyword_id
+    JOIN dim_sentiment ds ON ds.sentiment_label = sp.post_sentiment_label
+    LEFT JOIN dim_date dd ON dd.date_id = sp.date_id
+    LEFT JOIN dim_time dt ON dt.time_id = sp.time_id
+    WHERE (gk.start_date IS NULL OR sp.date_id >= TO_CHAR(gk.start_date, 'YYYYMMDD')::INT)
+    AND (gk.end_date IS NULL OR sp.date_id <= TO_CHAR(gk.end_date, 'YYYYMMDD')::INT)
+""", platform_id=1, content_type_id=1, id_column="sp.silver_post_id")
+
 # INSERT COMMENTS into fact table (content_type_id = 2)
 # Uses negative silver_comment_id to avoid collision with post IDs
 # Filters by dates from global_keywords if specified
-INSERT_COMMENT_SENTIMENT_SQL = """
-INSERT INTO fact_sentiment_events (
-    silver_content_id, model_id, platform_id, content_type_id,
-    sentiment_id, date_id, time_id, sentiment_score, request_id
-)
-SELECT
-    -sc.silver_comment_id,  -- Negative to distinguish from posts
-    1, -- Model: RoBERTa
-    1, -- Platform: Reddit
-    2, -- Content Type: Comment
-    ds.sentiment_id, 
-    COALESCE(dd.date_id, 20251231),
-    COALESCE(dt.time_id, 1200),
-    sc.comment_sentiment_score, 
-    %s
-FROM silver_reddit_comments sc
-JOIN silver_reddit_posts sp ON sc.silver_post_id = sp.silver_post_id
-JOIN global_keywords gk ON gk.global_keyword_id = sp.global_keyword_id
-JOIN dim_sentiment ds ON ds.sentiment_label = sc.comment_sentiment_label
-LEFT JOIN dim_date dd ON dd.calendar_date = DATE(sc.comment_created_at_utc)
-LEFT JOIN dim_time dt ON dt.time_id = (EXTRACT(HOUR FROM sc.comment_created_at_utc) * 100 + EXTRACT(MINUTE FROM sc.comment_created_at_utc))
-WHERE sp.global_keyword_id = %s
-AND sp.gold_processed = FALSE
-AND (gk.start_date IS NULL OR DATE(sc.comment_created_at_utc) >= gk.start_date)
-AND (gk.end_date IS NULL OR DATE(sc.comment_created_at_utc) <= gk.end_date)
-ON CONFLICT ON CONSTRAINT fact_sentiment_events_unique_content DO NOTHING;
-"""
+INSERT_COMMENT_SENTIMENT_SQL = build_fact_load_sql("""
+    SELECT sc.*, sp.global_keyword_id
+    FROM silver_reddit_comments sc
+    JOIN silver_reddit_posts sp ON sc.silver_post_id = sp.silver_post_id
+    WHERE sp.global_keyword_id = %(request_id)s
+""", """
+    INSERT INTO fact_sentiment_events (
+        silver_content_id, model_id, platform_id, content_type_id,
+        sentiment_id, date_id, time_id, sentiment_score, request_id
+    )
+    SELECT
+        -sc.silver_comment_id,  -- Negative to distinguish from posts
+        1, -- Model: RoBERTa
+        1, -- Platform: Reddit
+        2, -- Content Type: Comment
+        ds.sentiment_id,
+        COALESCE(dd.date_id, 20251231),
+        COALESCE(dt.time_id, 1200),
+        sc.comment_sentiment_score,
+        %(request_id)s
+    FROM src sc
+    JOIN global_keywords gk ON gk.global_keyword_id = sc.global_keyword_id
+    JOIN dim_sentiment ds ON ds.sentiment_label = sc.comment_sentiment_label
+    LEFT JOIN dim_date dd ON dd.date_id = sc.comment_date_id
+    LEFT JOIN dim_time dt ON dt.time_id = sc.comment_time_id
+    WHERE (gk.start_date IS NULL OR sc.comment_date_id >= TO_CHAR(gk.start_date, 'YYYYMMDD')::INT)
+    AND (gk.end_date IS NULL OR sc.comment_date_id <= TO_CHAR(gk.end_date, 'YYYYMMDD')::INT)
+""", platform_id=1, content_type_id=2, id_column="sc.silver_comment_id")
 
 
 # =====================================================
@@ -93,52 +191,39 @@ ON CONFLICT ON CONSTRAINT fact_sentiment_events_unique_content DO NOTHING;
 def run_reddit_gold(keyword, request_id):
     """
     Aggregate Silver Reddit data into Gold fact tables.
-    
+
     Executes in a single transaction:
-    1. Insert post sentiments into fact_sentiment_events
-    2. Insert comment sentiments into fact_sentiment_events
-    3. Mark silver_reddit_posts as gold_processed
-    4. Mark silver_reddit_comment_sentiment_summary as gold_processed
-    
-    On any failure the entire transaction is rolled back.
+    0. Fill date/time keys on any silver rows of the request missing them
+    1. Insert post sentiments above the post watermark, advance it
+    2. Insert comment sentiments above the comment watermark, advance it
+
+    On any failure the entire transaction is rolled back, including the
+    watermark moves.
     """
-    conn = get_pg_connection()
-    conn.autocommit = False
-    try:
+    params = {"request_id": int(request_id)}
+    # On failure nothing is committed; returning the connection rolls back
+    with pg_connection() as conn:
+        conn.autocommit = False
         with conn.cursor() as cur:
+            # 0. Rows written before silver stored dimension keys
+            backfilled = backfill_request(cur, request_id)
+            if backfilled:
+                print(f"[GOLD] Backfilled date/time keys on {backfilled} silver rows.")
+
             # 1. Insert POSTS into fact table
-            cur.execute(INSERT_POST_SENTIMENT_SQL, (request_id, request_id))
-            posts_inserted = cur.rowcount
-            print(f"[GOLD] Inserted {posts_inserted} post sentiment rows.")
+            with metrics.timed("gold.posts"):
+                cur.execute(INSERT_POST_SENTIMENT_SQL, params)
+            posts_inserted, posts_read = cur.fetchone()
+            metrics.count("gold.posts", posts_inserted)
+            print(f"[GOLD] Inserted {posts_inserted} post sentiment rows ({posts_read} new silver posts).")
 
             # 2. Insert COMMENTS into fact table
-            cur.execute(INSERT_COMMENT_SENTIMENT_SQL, (request_id, request_id))
-            comments_inserted = cur.rowcount
-            print(f"[GOLD] Inserted {comments_inserted} comment sentiment rows.")
-
-            # 3. Mark Silver posts as gold_processed
-            cur.execute("""
-                UPDATE silver_reddit_posts 
-                SET gold_processed = TRUE 
-                WHERE global_keyword_id = %s AND gold_processed = FALSE
-            """, (request_id,))
-            print(f"[GOLD] Marked {cur.rowcount} silver posts as gold_processed.")
-
-            # 4. Mark comment summaries as gold_processed
-            cur.execute("""
-                UPDATE silver_reddit_comment_sentiment_summary css
-                SET gold_processed = TRUE
-                FROM silver_reddit_posts sp
-                WHERE css.silver_post_id = sp.silver_post_id
-                AND sp.global_keyword_id = %s
-                AND css.gold_processed = FALSE
-            """, (request_id,))
-            print(f"[GOLD] Marked {cur.rowcount} comment summaries as gold_processed.")
+            with metrics.timed("gold.comments"):
+                cur.execute(INSERT_COMMENT_SENTIMENT_SQL, params)
+            comments_inserted, comments_read = cur.fetchone()
+            metrics.count("gold.comments", comments_inserted)
+            metrics.count("gold.facts", posts_inserted + comments_inserted)
+            print(f"[GOLD] Inserted {comments_inserted} comment sentiment rows ({comments_read} new silver comments).")
 
         conn.commit()
         print(f"[GOLD] Transaction committed for reddit.")
-    except Exception as e:
-        conn.rollback()
-        raise e
-    finally:
-        conn.close()
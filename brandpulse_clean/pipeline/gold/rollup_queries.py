@@ -0,0 +1,185 @@
+"""
+BrandPulse Clean – Gold Rollup Queries
+======================================
+Dashboard summaries answered from gold_daily_sentiment_rollup instead
+of re-counting silver_reddit_posts / silver_reddit_comments.
+
+Source: New. Mirrors the summaries computed per page load by
+routes/data.js (/results/:requestId), routes/dashboard.js
+(/summary/:keyword) and saveAnalysisToHistory() in routes/pipeline.js.
+
+The rollup is kept current by run_reddit_gold(). Applying
+database/schema.sql fills it once for requests loaded before the rollup
+existed; backfill_rollup() rebuilds it from fact_sentiment_events, e.g.
+after facts were edited by hand:
+
+    python -m pipeline.gold.rollup_queries backfill [request_id]
+
+Run the backfill while no gold load for the same request is in flight;
+it replaces the rollup rows rather than incrementing them.
+"""
+
+import sys
+
+from database.postgres import pg_connection
+from models.enums import ContentType
+
+# =====================================================
+# SQL STATEMENTS
+# =====================================================
+
+# Label counts and score sums for one request, one row per
+# (content type, sentiment) in dim_sentiment order
+REQUEST_SUMMARY_SQL = """
+SELECT r.content_type_id, ds.sentiment_label, SUM(r.item_count)::BIGINT, SUM(r.score_sum)
+FROM gold_daily_sentiment_rollup r
+JOIN dim_sentiment ds ON ds.sentiment_id = r.sentiment_id
+WHERE r.request_id = %s
+GROUP BY r.content_type_id, ds.sentiment_label, ds.sentiment_order
+ORDER BY r.content_type_id, ds.sentiment_order
+"""
+
+# Post label counts for every request of a keyword
+KEYWORD_SUMMARY_SQL = """
+SELECT ds.sentiment_label, SUM(r.item_count)::BIGINT
+FROM gold_daily_sentiment_rollup r
+JOIN global_keywords gk ON gk.global_keyword_id = r.request_id
+JOIN dim_sentiment ds ON ds.sentiment_id = r.sentiment_id
+WHERE gk.keyword = %s AND r.content_type_id = %s
+GROUP BY ds.sentiment_label, ds.sentiment_order
+ORDER BY ds.sentiment_order
+"""
+
+# Daily series for one request (for trend charts)
+REQUEST_DAILY_SQL = """
+SELECT r.date_id, r.content_type_id, ds.sentiment_label, r.item_count, r.score_sum
+FROM gold_daily_sentiment_rollup r
+JOIN dim_sentiment ds ON ds.sentiment_id = r.sentiment_id
+WHERE r.request_id = %s
+ORDER BY r.date_id, r.content_type_id, ds.sentiment_order
+"""
+
+BACKFILL_DELETE_SQL = """
+DELETE FROM gold_daily_sentiment_rollup
+WHERE (%(request_id)s::INT IS NULL OR request_id = %(request_id)s::INT)
+"""
+
+BACKFILL_INSERT_SQL = """
+INSERT INTO gold_daily_sentiment_rollup (
+    request_id, date_id, platform_id, content_type_id, sentiment_id, item_count, score_sum
+)
+SELECT request_id, date_id, platform_id, content_type_id, sentiment_id,
+       COUNT(*), COALESCE(SUM(sentiment_score), 0)
+FROM fact_sentiment_events
+WHERE request_id IS NOT NULL
+AND (%(request_id)s::INT IS NULL OR request_id = %(request_id)s::INT)
+GROUP BY request_id, date_id, platform_id, content_type_id, sentiment_id
+"""
+
+
+def _fetch(sql, params):
+    with pg_connection() as conn, conn.cursor() as cur:
+        cur.execute(sql, params)
+        return cur.fetchall()
+
+
+def get_request_summary(request_id) -> dict:
+    """
+    Sentiment breakdown of one request, as returned by /results/:requestId.
+
+    Returns
+    -------
+    dict
+        ``posts`` and ``comments``: lists of {"name", "value"} in
+        dim_sentiment order; ``totals``: posts/comments/total counts;
+        ``avg_scores``: mean sentiment score per content type (None if
+        no items).
+    """
+    rows = _fetch(REQUEST_SUMMARY_SQL, (int(request_id),))
+
+    groups = {ContentType.POST.dim_id: "posts", ContentType.COMMENT.dim_id: "comments"}
+    summary = {"posts": [], "comments": []}
+    score_sums = {"posts": 0.0, "comments": 0.0}
+    for content_type_id, label, count, score_sum in rows:
+        key = groups.get(content_type_id)
+        if key is None:
+            continue
+        summary[key].append({"name": label, "value": int(count)})
+        score_sums[key] += float(score_sum or 0)
+
+    totals = {key: sum(r["value"] for r in summary[key]) for key in groups.values()}
+    summary["totals"] = {**totals, "total": totals["posts"] + totals["comments"]}
+    summary["avg_scores"] = {
+        key: (score_sums[key] / totals[key] if totals[key] else None) for key in groups.values()
+    }
+    return summary
+
+
+def get_keyword_summary(keyword, content_type=ContentType.POST) -> list:
+    """
+    Label counts across all requests for ``keyword``, as returned by
+    /summary/:keyword.
+
+    Returns
+    -------
+    list
+        [{"name": "Positive", "value": 45}, ...]
+    """
+    rows = _fetch(KEYWORD_SUMMARY_SQL, (keyword, content_type.dim_id))
+    return [{"name": label, "value": int(count)} for label, count in rows]
+
+
+def get_daily_series(request_id) -> list:
+    """
+    Per-day counts for one request.
+
+    Returns
+    -------
+    list
+        [{"date_id", "content_type_id", "sentiment", "count", "avg_score"}, ...]
+    """
+    rows = _fetch(REQUEST_DAILY_SQL, (int(request_id),))
+    return [
+        {
+            "date_id": date_id,
+            "content_type_id": content_type_id,
+            "sentiment": label,
+            "count": int(count),
+            "avg_score": float(score_sum) / count if count else None,
+        }
+        for date_id, content_type_id, label, count, score_sum in rows
+    ]
+
+
+def backfill_rollup(request_id=None) -> int:
+    """
+    Rebuild the rollup from fact_sentiment_events.
+
+    Parameters
+    ----------
+    request_id : int, optional
+        Rebuild only this request; all requests when omitted.
+
+    Returns
+    -------
+    int
+        Number of rollup rows written.
+    """
+    params = {"request_id": int(request_id) if request_id is not None else None}
+    # Uncommitted work is rolled back when the connection is returned
+    with pg_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(BACKFILL_DELETE_SQL, params)
+            cur.execute(BACKFILL_INSERT_SQL, params)
+            written = cur.rowcount
+        conn.commit()
+        return written
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2 or sys.argv[1] != "backfill":
+        print("Usage: python -m pipeline.gold.rollup_queries backfill [request_id]")
+        sys.exit(1)
+
+    rid = sys.argv[2] if len(sys.argv) > 2 else None
+    print(f"[GOLD] Rebuilt {backfill_rollup(rid)} rollup rows.")
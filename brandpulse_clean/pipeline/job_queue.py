@@ -0,0 +1,282 @@
+"""
+BrandPulse Clean – Postgres Job Queue Worker
+============================================
+Polls the pipeline_jobs table and runs pipeline requests on a fixed pool
+of worker threads.
+
+Source: New. Replaces the per-request `spawn(python main.py ...)` in
+routes/pipeline.js when PIPELINE_DISPATCH=queue. The backend only
+INSERTs a pipeline_jobs row; it no longer starts processes.
+
+WHY:
+    spawn() starts one Python process (and one model load) per request,
+    with no upper bound under bursty traffic, and only on the host that
+    received the HTTP call. utils/cleanup.js then has to guess which
+    PROCESSING rows are dead after 10 minutes.
+
+HOW IT WORKS:
+    1. Claim   – each worker thread claims the oldest queued job with
+                 SELECT ... FOR UPDATE SKIP LOCKED inside an UPDATE, so
+                 concurrent workers (threads or hosts) never take the
+                 same job and never wait on each other's row locks.
+    2. Run     – run_pipeline() executes as before and still writes
+                 COMPLETED/FAILED into global_keywords.
+    3. Heartbeat – while a job runs, a background thread refreshes
+                 pipeline_jobs.heartbeat_at and global_keywords.last_run_at
+                 every JOB_HEARTBEAT_SECONDS, so live jobs are never
+                 mistaken for stuck ones.
+    4. Reclaim – running jobs whose heartbeat is older than
+                 JOB_STALE_SECONDS (crashed or killed worker) go back to
+                 'queued', or to 'failed' after JOB_MAX_ATTEMPTS attempts.
+
+Scale out by starting more queue-worker processes, on this or any other
+host pointing at the same database. One process shares a single loaded
+model between its PIPELINE_QUEUE_WORKERS threads.
+"""
+
+import os
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from config.settings import (
+    JOB_HEARTBEAT_SECONDS,
+    JOB_MAX_ATTEMPTS,
+    JOB_POLL_SECONDS,
+    JOB_STALE_SECONDS,
+    PIPELINE_QUEUE_WORKERS,
+)
+from database.postgres import close_pool, get_pool_stats, pg_connection
+from models.enums import PipelineStatus
+from pipeline.orchestrator import run_pipeline, update_status_by_id
+from pipeline.silver.inference_pool import close_inference_pool
+from pipeline.worker import warm_up
+from utils.logging import get_logger
+
+logger = get_logger("QUEUE")
+
+# ---------------------------------------------------------------------------
+# SQL
+# ---------------------------------------------------------------------------
+ENQUEUE_JOB_SQL = """
+INSERT INTO pipeline_jobs (global_keyword_id, keyword, platform)
+VALUES (%s, %s, %s)
+ON CONFLICT (global_keyword_id) WHERE status IN ('queued', 'running') DO NOTHING
+RETURNING job_id
+"""
+
+CLAIM_JOB_SQL = """
+UPDATE pipeline_jobs
+SET status = 'running',
+    attempts = attempts + 1,
+    worker_id = %s,
+    claimed_at = NOW(),
+    heartbeat_at = NOW()
+WHERE job_id = (
+    SELECT job_id
+    FROM pipeline_jobs
+    WHERE status = 'queued'
+    ORDER BY enqueued_at
+    FOR UPDATE SKIP LOCKED
+    LIMIT 1
+)
+RETURNING job_id, global_keyword_id, keyword, platform, attempts
+"""
+
+HEARTBEAT_SQL = """
+WITH job AS (
+    UPDATE pipeline_jobs
+    SET heartbeat_at = NOW()
+    WHERE job_id = %s AND status = 'running' AND worker_id = %s
+    RETURNING global_keyword_id
+)
+UPDATE global_keywords gk
+SET last_run_at = NOW()
+FROM job
+WHERE gk.global_keyword_id = job.global_keyword_id
+"""
+
+FINISH_JOB_SQL = """
+UPDATE pipeline_jobs
+SET status = %s, finished_at = NOW(), error = %s
+WHERE job_id = %s AND worker_id = %s
+"""
+
+RECLAIM_STALE_SQL = """
+UPDATE pipeline_jobs
+SET status = CASE WHEN attempts >= %s THEN 'failed' ELSE 'queued' END,
+    worker_id = NULL,
+    finished_at = CASE WHEN attempts >= %s THEN NOW() ELSE NULL END,
+    error = 'Worker heartbeat lost'
+WHERE job_id IN (
+    SELECT job_id
+    FROM pipeline_jobs
+    WHERE status = 'running'
+      AND heartbeat_at < NOW() - make_interval(secs => %s)
+    FOR UPDATE SKIP LOCKED
+)
+RETURNING job_id, global_keyword_id, status
+"""
+
+
+# ---------------------------------------------------------------------------
+# PRODUCER SIDE
+# ---------------------------------------------------------------------------
+def enqueue_job(request_id, keyword, platform="reddit"):
+    """
+    Queue a pipeline run for ``request_id``.
+
+    Mirrors the INSERT done by routes/pipeline.js, for scripts and
+    manual re-runs.
+
+    Returns
+    -------
+    int or None
+        The new job_id, or None if the request already has a queued or
+        running job.
+    """
+    with pg_connection() as conn, conn.cursor() as cur:
+        cur.execute(ENQUEUE_JOB_SQL, (int(request_id), keyword, platform))
+        row = cur.fetchone()
+        conn.commit()
+    return row[0] if row else None
+
+
+# ---------------------------------------------------------------------------
+# CONSUMER SIDE
+# ---------------------------------------------------------------------------
+def _claim_job(worker_id):
+    """Claim the oldest queued job, or return None if the queue is empty."""
+    with pg_connection() as conn, conn.cursor() as cur:
+        cur.execute(CLAIM_JOB_SQL, (worker_id,))
+        row = cur.fetchone()
+        conn.commit()
+
+    if row is None:
+        return None
+    job_id, request_id, keyword, platform, attempts = row
+    return {
+        "job_id": job_id,
+        "request_id": request_id,
+        "keyword": keyword,
+        "platform": platform,
+        "attempts": attempts,
+    }
+
+
+def _finish_job(job_id, worker_id, status, error=None):
+    with pg_connection() as conn, conn.cursor() as cur:
+        cur.execute(FINISH_JOB_SQL, (status, error, job_id, worker_id))
+        conn.commit()
+
+
+def _heartbeat(job_id, worker_id, done):
+    """Refresh the job's heartbeat until ``done`` is set."""
+    with pg_connection(autocommit=True) as conn:
+        while not done.wait(JOB_HEARTBEAT_SECONDS):
+            try:
+                with conn.cursor() as cur:
+                    cur.execute(HEARTBEAT_SQL, (job_id, worker_id))
+            except Exception as e:
+                logger.warning("Heartbeat failed for job %s: %s", job_id, e)
+
+
+def reclaim_stale_jobs():
+    """
+    Re-queue (or fail) running jobs whose worker stopped heartbeating.
+
+    Returns
+    -------
+    int
+        Number of jobs reclaimed.
+    """
+    with pg_connection() as conn, conn.cursor() as cur:
+        cur.execute(RECLAIM_STALE_SQL, (JOB_MAX_ATTEMPTS, JOB_MAX_ATTEMPTS, JOB_STALE_SECONDS))
+        rows = cur.fetchall()
+        conn.commit()
+
+    for job_id, request_id, status in rows:
+        logger.warning("Reclaimed stale job %s (request %s) -> %s", job_id, request_id, status)
+        if status == "failed":
+            update_status_by_id(request_id, PipelineStatus.FAILED.value)
+    return len(rows)
+
+
+def _run_job(job, worker_id):
+    """Execute one claimed job with a heartbeat running alongside it."""
+    logger.info(
+        "%s running job %s (request %s, attempt %s)",
+        worker_id, job["job_id"], job["request_id"], job["attempts"],
+    )
+    done = threading.Event()
+    beat = threading.Thread(
+        target=_heartbeat, args=(job["job_id"], worker_id, done),
+        name=f"{worker_id}-heartbeat", daemon=True,
+    )
+    beat.start()
+    try:
+        run_pipeline(job["keyword"], job["request_id"], job["platform"])
+    except Exception as e:
+        # run_pipeline() has already marked global_keywords FAILED
+        status, error = "failed", str(e)
+    else:
+        status, error = "done", None
+    finally:
+        done.set()
+        beat.join()
+    _finish_job(job["job_id"], worker_id, status, error)
+
+
+def _worker_loop(worker_id, stop):
+    """Claim and run jobs until ``stop`` is set."""
+    while not stop.is_set():
+        try:
+            job = _claim_job(worker_id)
+        except Exception as e:
+            logger.error("%s could not claim a job: %s", worker_id, e)
+            job = None
+
+        if job is None:
+            stop.wait(JOB_POLL_SECONDS)
+            continue
+        try:
+            _run_job(job, worker_id)
+        except Exception:
+            # Keep the slot alive; the stale-job check reclaims the job
+            logger.exception("%s could not finish job %s", worker_id, job["job_id"])
+
+
+def run_queue_worker(concurrency=PIPELINE_QUEUE_WORKERS):
+    """
+    Warm up, then process pipeline_jobs with ``concurrency`` threads
+    until interrupted.
+
+    Parameters
+    ----------
+    concurrency : int
+        Number of jobs this process runs at the same time
+        (default: PIPELINE_QUEUE_WORKERS).
+    """
+    warm_up()
+
+    prefix = f"{socket.gethostname()}:{os.getpid()}"
+    stop = threading.Event()
+    logger.info("Queue worker %s started with %d slots.", prefix, concurrency)
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="job") as pool:
+        for slot in range(concurrency):
+            pool.submit(_worker_loop, f"{prefix}:{slot}", stop)
+        try:
+            while True:
+                try:
+                    reclaim_stale_jobs()
+                except Exception as e:
+                    logger.error("Stale job check failed: %s", e)
+                logger.debug("PostgreSQL pool: %s", get_pool_stats())
+                time.sleep(JOB_STALE_SECONDS / 2)
+        except KeyboardInterrupt:
+            logger.info("Shutting down after running jobs finish.")
+            stop.set()
+    close_pool()
+    close_inference_pool()
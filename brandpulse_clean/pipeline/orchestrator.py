@@ -8,11 +8,29 @@ Source: ETL_2/brandpulse_master.py
 
 ARCHITECTURAL FIXES:
     1. Module-level psycopg2.connect() removed from update_status_by_id().
-       Now calls get_pg_connection() from database/postgres.py.
+       Now uses pg_connection() from database/postgres.py.
     2. All Twitter imports and if/else platform branching removed.
        Replaced with registry-based dispatch via get_pipeline().
     3. Hardcoded status strings ('COMPLETED', 'FAILED') replaced with
        PipelineStatus enum values.
+    4. Every run is recorded in pipeline_runs (previously never written):
+       one row per run_pipeline() call, per-stage status/counts as the
+       stages finish, and the utils.metrics summary (stage durations,
+       items/sec, bytes, batch sizes) in pipeline_runs.metrics.
+    5. Identical concurrent requests (same keyword, platform and date
+       range) are coalesced (pipeline/single_flight.py): one leader runs
+       Bronze and Silver, followers copy its silver results and run only
+       Gold. Disable with PIPELINE_SINGLE_FLIGHT=false.
+    6. Silver results of earlier requests for the same keyword, model and
+       dates are reused (pipeline/silver/reddit_reuse.py); Bronze only
+       ingests the uncovered date gaps and is skipped when there are
+       none. Disable with SILVER_REUSE=false.
+    7. Bronze and Silver run as one stream for platforms that support it
+       (pipeline.stream): Silver scores each chunk as soon as Bronze
+       writes it. Disable with PIPELINE_STREAMING=false.
+    8. Connections come from the process-wide pool in database/postgres.py;
+       its counters (checkouts, waits, hold times) are stored with each
+       run's metrics as "pg_pool".
 
 COMPATIBILITY NOTE:
     update_status_by_id() is preserved exactly as written in the original.
@@ -21,27 +39,97 @@ COMPATIBILITY NOTE:
     run_pipeline() signature is preserved: (keyword, request_id, platform='reddit')
 """
 
-from database.postgres import get_pg_connection
+import json
+import uuid
+
+from psycopg2.extras import Json
+
+from config.settings import PIPELINE_SINGLE_FLIGHT, PIPELINE_STREAMING, SILVER_REUSE
+from database.postgres import get_pool_stats, pg_connection
 from models.enums import PipelineStatus
 from pipeline.registry import get_pipeline
+from pipeline.single_flight import Flight
+from utils import metrics
+
+
+UPDATE_STATUS_SQL = "UPDATE global_keywords SET status = %s, last_run_at = NOW() WHERE global_keyword_id = %s"
 
 
 def update_status_by_id(request_id, status):
     """Signals the current state to the MERN backend using the Request ID."""
     try:
-        conn = get_pg_connection()
-        with conn.cursor() as cur:
+        with pg_connection() as conn, conn.cursor() as cur:
             # We use global_keyword_id to ensure we update the specific user request
-            cur.execute(
-                "UPDATE global_keywords SET status = %s, last_run_at = NOW() WHERE global_keyword_id = %s",
-                (status, request_id)
-            )
-        conn.commit()
-        conn.close()
+            cur.execute(UPDATE_STATUS_SQL, (status, request_id))
+            conn.commit()
     except Exception as e:
         print(f"[ORCHESTRATOR ERROR]: Failed to update status to {status} for ID {request_id}: {e}")
 
 
+# ---------------------------------------------------------------------------
+# RUN LOG (pipeline_runs) — failures are printed, never raised, so the
+# bookkeeping cannot fail a pipeline run.
+# ---------------------------------------------------------------------------
+_STAGE_COUNT_COLUMNS = {
+    "bronze": ("bronze_status", "bronze_doc_count", "bronze_completed_at", "bronze.docs"),
+    "silver": ("silver_status", "silver_post_count", "silver_completed_at", "silver.posts"),
+    "gold": ("gold_status", "gold_fact_count", "gold_completed_at", "gold.facts"),
+}
+
+
+START_RUN_SQL = """
+INSERT INTO pipeline_runs (
+    run_id, keyword, keyword_normalized, request_id, platform, status,
+    bronze_status, silver_status, gold_status, started_at
+) VALUES (%s, %s, %s, %s, %s, 'STARTED', 'PENDING', 'PENDING', 'PENDING', NOW())
+"""
+
+
+def complete_stage_sql(stage):
+    """UPDATE marking one stage COMPLETED; params (item_count, run_id)."""
+    status_col, count_col, completed_col, _ = _STAGE_COUNT_COLUMNS[stage]
+    return f"""
+        UPDATE pipeline_runs
+        SET {status_col} = 'COMPLETED', {count_col} = %s, {completed_col} = NOW()
+        WHERE run_id = %s
+        """
+
+
+def finish_run_sql(stage=None):
+    """UPDATE closing a run; params (status, error, metrics, run_id)."""
+    stage_sql = f", {_STAGE_COUNT_COLUMNS[stage][0]} = 'FAILED'" if stage else ""
+    return f"""
+        UPDATE pipeline_runs
+        SET status = %s, error_message = %s, metrics = %s, completed_at = NOW(){stage_sql}
+        WHERE run_id = %s
+        """
+
+
+def _execute_run_log(sql, params):
+    try:
+        with pg_connection() as conn, conn.cursor() as cur:
+            cur.execute(sql, params)
+            conn.commit()
+    except Exception as e:
+        print(f"[ORCHESTRATOR ERROR]: Failed to write pipeline_runs: {e}")
+
+
+def start_run_record(run_id, keyword, request_id, platform):
+    """Insert the pipeline_runs row for a starting run."""
+    _execute_run_log(START_RUN_SQL, (run_id, keyword, keyword.strip().lower(), request_id, platform))
+
+
+def complete_stage_record(run_id, stage, run_metrics):
+    """Mark one stage COMPLETED with its item count."""
+    counter = _STAGE_COUNT_COLUMNS[stage][3]
+    _execute_run_log(complete_stage_sql(stage), (run_metrics.counters.get(counter, 0), run_id))
+
+
+def finish_run_record(run_id, status, summary, stage=None, error=None):
+    """Close the run with its final status, metrics and (on failure) the failed stage."""
+    _execute_run_log(finish_run_sql(stage), (status, error, Json(summary), run_id))
+
+
 def run_pipeline(keyword, request_id, platform='reddit'):
     """
     Main pipeline orchestrator. Executes Bronze → Silver → Gold
@@ -58,27 +146,117 @@ def run_pipeline(keyword, request_id, platform='reddit'):
     """
     print(f"--- STARTING PIPELINE FOR: {keyword} (Request ID: {request_id}, Platform: {platform}) ---")
 
+    run_metrics, token = metrics.start_run()
+    run_id = str(uuid.uuid4())
+    start_run_record(run_id, keyword, request_id, platform)
+    stage = None
+    flight = None
+
     try:
         pipeline = get_pipeline(platform)
 
-        # 1. BRONZE: Fetch from platform
-        print(f"[STEP 1/3] Ingesting raw {platform} data into MongoDB...")
-        pipeline.ingest(keyword, request_id)
+        # 0. SINGLE FLIGHT: wait for an identical in-flight request, if any
+        leader_rid = None
+        if PIPELINE_SINGLE_FLIGHT and hasattr(pipeline, "fan_out"):
+            flight = Flight(keyword, request_id, platform)
+            try:
+                with metrics.timed("flight.wait"):
+                    leader_rid = flight.join()
+            except Exception as e:
+                # Coalescing is an optimisation; never fail the request over it
+                print(f"[ORCHESTRATOR ERROR]: Single-flight unavailable, running alone: {e}")
+                flight.close()
+                flight = None
+
+        if leader_rid is not None:
+            # 1-2. Reuse the leader's silver results
+            print(f"[STEP 1-2/3] Request {leader_rid} already analysed '{keyword}'; reusing its results...")
+            metrics.annotate("coalesced_with", leader_rid)
+            complete_stage_record(run_id, "bronze", run_metrics)
+            stage = "silver"
+            with metrics.timed(stage):
+                posts, _ = pipeline.fan_out(leader_rid, request_id)
+            metrics.count("silver.posts", posts)
+            complete_stage_record(run_id, stage, run_metrics)
+        else:
+            # 0. REUSE: copy earlier results for this keyword and dates
+            date_windows = None
+            if SILVER_REUSE and hasattr(pipeline, "reuse"):
+                try:
+                    with metrics.timed("silver.reuse"):
+                        reused_posts, _, date_windows = pipeline.reuse(request_id)
+                    metrics.count("silver.reuse", reused_posts)
+                    metrics.count("silver.posts", reused_posts)
+                except Exception as e:
+                    # Reuse is an optimisation; fall back to a full run
+                    print(f"[ORCHESTRATOR ERROR]: Silver reuse failed, ingesting everything: {e}")
+                    date_windows = None
 
-        # 2. SILVER: Analyze with RoBERTa AI
-        print(f"[STEP 2/3] Cleaning text and running sentiment analysis for {platform}...")
-        pipeline.process(request_id)
+            if PIPELINE_STREAMING and hasattr(pipeline, "stream") and date_windows != []:
+                # 1-2. BRONZE → SILVER: score chunks while ingestion continues
+                print(f"[STEP 1-2/3] Streaming raw {platform} data into sentiment analysis...")
+                stage = "silver"
+                with metrics.timed("stream"):
+                    if date_windows is None:
+                        pipeline.stream(keyword, request_id)
+                    else:
+                        pipeline.stream(keyword, request_id, date_windows=date_windows)
+                complete_stage_record(run_id, "bronze", run_metrics)
+                complete_stage_record(run_id, stage, run_metrics)
+            else:
+                # 1. BRONZE: Fetch from platform
+                stage = "bronze"
+                if date_windows == []:
+                    print(f"[STEP 1/3] Earlier requests cover every requested date; skipping {platform} ingestion...")
+                else:
+                    print(f"[STEP 1/3] Ingesting raw {platform} data into MongoDB...")
+                    with metrics.timed(stage):
+                        if date_windows is None:
+                            pipeline.ingest(keyword, request_id)
+                        else:
+                            pipeline.ingest(keyword, request_id, date_windows=date_windows)
+                complete_stage_record(run_id, stage, run_metrics)
+
+                # 2. SILVER: Analyze with RoBERTa AI
+                print(f"[STEP 2/3] Cleaning text and running sentiment analysis for {platform}...")
+                stage = "silver"
+                with metrics.timed(stage):
+                    pipeline.process(request_id)
+                complete_stage_record(run_id, stage, run_metrics)
+
+            # Followers only need silver; release them before Gold
+            if flight is not None:
+                flight.finish(PipelineStatus.COMPLETED.value)
 
         # 3. GOLD: Aggregate into Fact Tables
         print("[STEP 3/3] Aggregating results for the Dashboard...")
-        pipeline.aggregate(keyword, request_id)
+        stage = "gold"
+        with metrics.timed(stage):
+            pipeline.aggregate(keyword, request_id)
+        complete_stage_record(run_id, stage, run_metrics)
+        stage = None
 
         # SUCCESS SIGNAL: Updates the specific request record to COMPLETED
         update_status_by_id(request_id, PipelineStatus.COMPLETED.value)
+        run_metrics.annotate("pg_pool", get_pool_stats())
+        summary = run_metrics.summary()
+        finish_run_record(run_id, PipelineStatus.COMPLETED.value, summary)
+        print(f"[ORCHESTRATOR] Run {run_id} metrics: {json.dumps(summary)}")
         print(f"--- PIPELINE COMPLETED SUCCESSFULLY FOR: {keyword} ({platform}) ---")
 
     except Exception as e:
         # FAILURE SIGNAL: Updates the specific request record to FAILED
         print(f"--- PIPELINE FAILED AT ERROR: {str(e)} ---")
         update_status_by_id(request_id, PipelineStatus.FAILED.value)
+        if flight is not None:
+            flight.finish(PipelineStatus.FAILED.value)
+        run_metrics.annotate("pg_pool", get_pool_stats())
+        summary = run_metrics.summary()
+        finish_run_record(run_id, PipelineStatus.FAILED.value, summary, stage=stage, error=str(e))
+        print(f"[ORCHESTRATOR] Run {run_id} metrics: {json.dumps(summary)}")
         raise e
+
+    finally:
+        if flight is not None:
+            flight.close()
+        metrics.end_run(token)
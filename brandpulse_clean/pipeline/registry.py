@@ -14,19 +14,35 @@ ARCHITECTURAL FIX:
     requires zero changes.
 """
 
+from config.settings import BRONZE_STREAM_CHUNK_SIZE
 from pipeline.bronze.reddit_ingest import ingest_keyword as ingest_reddit
+from pipeline.bronze.reddit_ingest import iter_ingest_keyword as iter_ingest_reddit
 from pipeline.silver.reddit_processor import run_silver as process_reddit
+from pipeline.silver.reddit_fanout import copy_request_results as copy_reddit_results
+from pipeline.silver.reddit_reuse import reuse_prior_results as reuse_reddit_results
 from pipeline.gold.aggregator import run_gold_etl
 
 
 class RedditPipeline:
     """Standardized interface for executing Reddit ETL stages."""
     
-    def ingest(self, keyword, request_id):
-        ingest_reddit(keyword, request_id)
+    def ingest(self, keyword, request_id, date_windows=None):
+        ingest_reddit(keyword, request_id, date_windows=date_windows)
         
     def process(self, request_id):
         process_reddit(request_id)
+
+    def stream(self, keyword, request_id, date_windows=None):
+        chunks = iter_ingest_reddit(
+            keyword, request_id, date_windows=date_windows, chunk_size=BRONZE_STREAM_CHUNK_SIZE
+        )
+        process_reddit(request_id, source=chunks)
+
+    def fan_out(self, source_request_id, request_id):
+        return copy_reddit_results(source_request_id, request_id)
+
+    def reuse(self, request_id):
+        return reuse_reddit_results(request_id)
         
     def aggregate(self, keyword, request_id):
         run_gold_etl(keyword, request_id, platform='reddit')
@@ -0,0 +1,416 @@
+"""
+BrandPulse Clean – Sentiment Cascade
+====================================
+Confidence-gated lexicon stage ahead of the transformer: texts whose
+polarity is obvious ("love it, best purchase ever") are labelled by a
+word-weight scorer, and only the uncertain rest is sent to the model.
+
+Source: New. Called by sentiment.score_with_cache() when
+SENTIMENT_CASCADE is on. Calibrate before enabling:
+
+    python main.py --calibrate-cascade --thresholds 0.7,0.8,0.9
+
+HOW IT SCORES:
+    Each token adds its lexicon weight (positive or negative). A negator
+    ("not", "never", "don't", ...) flips and weakens the next three
+    tokens' weights, an intensifier ("very", "really", ...) scales the
+    next one, and a contrast word ("but", "however", ...) halves
+    everything before it.
+
+        confidence = |pos - neg| / (pos + neg + CASCADE_PRIOR)
+
+    CASCADE_PRIOR keeps a single weak word from ever being confident, and
+    mixed texts score low because their weights cancel out. A text is
+    settled when confidence >= SENTIMENT_CASCADE_THRESHOLD; its "score" is
+    that confidence. The cascade never settles Neutral, questions or
+    "/s"-marked sarcasm: those always go to the model.
+
+ORDER:
+    result cache → cascade → model. Only model results are written to
+    the cache, which is keyed by SENTIMENT_MODEL. Silver posts scored
+    with the cascade on record scorer_name() rather than SENTIMENT_MODEL
+    as model_name, so reddit_reuse never copies them into a request that
+    runs the plain model (or a different threshold).
+
+CALIBRATION:
+    calibrate() replays the lexicon over posts and comments that the plain
+    model already scored into silver. For each keyword and threshold, it
+    reports the share of texts the cascade would settle (the inference
+    saved) and how often its label matches the model's.
+"""
+
+import argparse
+import json
+import re
+import sys
+import threading
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from config.settings import (
+    SENTIMENT_CASCADE,
+    SENTIMENT_CASCADE_LEXICON,
+    SENTIMENT_CASCADE_THRESHOLD,
+    SENTIMENT_MODEL,
+)
+
+# Smoothing term of the confidence formula (in lexicon-weight units)
+CASCADE_PRIOR = 1.0
+
+# Tokens after a negator whose weight is flipped, and how much is kept
+NEGATION_SCOPE = 3
+NEGATION_FACTOR = 0.75
+
+# Weight kept by everything before a contrast word
+CONTRAST_FACTOR = 0.5
+
+_TOKEN_PATTERN = re.compile(r"[a-z]+(?:'[a-z]+)?")
+
+# ---------------------------------------------------------------------------
+# Built-in lexicon (weights 1-3); SENTIMENT_CASCADE_LEXICON replaces it
+# ---------------------------------------------------------------------------
+_POSITIVE = {
+    "love": 3.0, "loved": 3.0, "loving": 2.5, "loves": 3.0, "amazing": 3.0,
+    "awesome": 3.0, "excellent": 3.0, "fantastic": 3.0, "perfect": 3.0,
+    "outstanding": 3.0, "incredible": 2.5, "best": 3.0, "brilliant": 2.5,
+    "superb": 3.0, "wonderful": 3.0, "great": 2.0, "good": 1.5, "nice": 1.5,
+    "happy": 2.0, "glad": 1.5, "impressed": 2.0, "impressive": 2.0,
+    "recommend": 2.0, "recommended": 2.0, "reliable": 1.5, "fast": 1.0,
+    "smooth": 1.5, "beautiful": 2.0, "solid": 1.5, "favorite": 2.0,
+    "favourite": 2.0, "enjoy": 2.0, "enjoyed": 2.0, "worth": 1.5,
+    "pleased": 2.0, "satisfied": 2.0, "thanks": 1.0, "thank": 1.0,
+    "helpful": 1.5, "easy": 1.0, "win": 1.5, "quality": 1.0, "works": 1.0,
+}
+
+_NEGATIVE = {
+    "hate": -3.0, "hated": -3.0, "hates": -3.0, "terrible": -3.0,
+    "awful": -3.0, "horrible": -3.0, "worst": -3.0, "garbage": -3.0,
+    "trash": -3.0, "useless": -2.5, "scam": -3.0, "disgusting": -3.0,
+    "pathetic": -2.5, "disappointed": -2.5, "disappointing": -2.5,
+    "bad": -2.0, "poor": -2.0, "broken": -2.0, "broke": -1.5, "sucks": -2.5,
+    "crap": -2.5, "annoying": -2.0, "angry": -2.0, "furious": -3.0,
+    "refund": -1.5, "slow": -1.0, "buggy": -2.0, "bug": -1.0, "bugs": -1.0,
+    "crash": -1.5, "crashes": -1.5, "crashed": -1.5, "fail": -2.0,
+    "failed": -2.0, "fails": -2.0, "waste": -2.5, "overpriced": -2.0,
+    "rude": -2.0, "avoid": -2.0, "problem": -1.0, "problems": -1.0,
+    "issue": -1.0, "issues": -1.0, "regret": -2.5, "ripoff": -3.0,
+}
+
+_NEGATORS = frozenset({
+    "not", "no", "never", "nothing", "nobody", "none", "neither", "nor",
+    "without", "hardly", "cannot", "dont", "don't", "doesn't", "didn't",
+    "isn't", "wasn't", "aren't", "weren't", "won't", "can't", "couldn't",
+    "wouldn't", "shouldn't", "haven't", "hasn't", "ain't",
+})
+
+_INTENSIFIERS = {
+    "very": 1.5, "really": 1.5, "so": 1.3, "super": 1.5, "extremely": 1.8,
+    "absolutely": 1.8, "totally": 1.5, "incredibly": 1.8, "truly": 1.4,
+    "highly": 1.5, "most": 1.3, "completely": 1.5,
+}
+
+_CONTRAST = frozenset({"but", "however", "although", "though", "yet"})
+
+
+# ---------------------------------------------------------------------------
+# Lazy lexicon — loaded on first use
+# ---------------------------------------------------------------------------
+_lexicon = None
+
+
+def _get_lexicon() -> dict:
+    """
+    Return the word → weight map: the JSON object at
+    SENTIMENT_CASCADE_LEXICON if set, else the built-in lexicon.
+    """
+    global _lexicon
+    if _lexicon is None:
+        if SENTIMENT_CASCADE_LEXICON:
+            with open(SENTIMENT_CASCADE_LEXICON, encoding="utf-8") as f:
+                _lexicon = {word.lower(): float(weight) for word, weight in json.load(f).items()}
+        else:
+            _lexicon = {**_POSITIVE, **_NEGATIVE}
+    return _lexicon
+
+
+def scorer_name(threshold: float = SENTIMENT_CASCADE_THRESHOLD) -> str:
+    """
+    The model_name silver rows record: SENTIMENT_MODEL, plus the lexicon
+    and threshold when the cascade is on.
+    """
+    if not SENTIMENT_CASCADE:
+        return SENTIMENT_MODEL
+    lexicon = Path(SENTIMENT_CASCADE_LEXICON).stem if SENTIMENT_CASCADE_LEXICON else "lexicon"
+    return f"{SENTIMENT_MODEL}+{lexicon}@{threshold:g}"
+
+
+def polarity(text: str):
+    """
+    Lexicon polarity of one text.
+
+    Returns
+    -------
+    tuple : (label, confidence)
+        ``label`` is "Positive" or "Negative", or None when the text has
+        no lexicon words or must go to the model (questions, "/s").
+    """
+    lowered = text.lower()
+    if "?" in lowered or "/s" in lowered:
+        return None, 0.0
+
+    lexicon = _get_lexicon()
+    pos = neg = 0.0
+    negate = 0
+    boost = 1.0
+    for token in _TOKEN_PATTERN.findall(lowered):
+        if token in _CONTRAST:
+            pos *= CONTRAST_FACTOR
+            neg *= CONTRAST_FACTOR
+            negate, boost = 0, 1.0
+            continue
+        if token in _NEGATORS:
+            negate = NEGATION_SCOPE
+            continue
+        if token in _INTENSIFIERS:
+            boost = _INTENSIFIERS[token]
+            continue
+
+        weight = lexicon.get(token)
+        if weight:
+            weight *= boost
+            if negate:
+                weight = -weight * NEGATION_FACTOR
+            if weight > 0:
+                pos += weight
+            else:
+                neg -= weight
+        boost = 1.0
+        negate = max(negate - 1, 0)
+
+    evidence = pos + neg
+    if not evidence:
+        return None, 0.0
+    label = "Positive" if pos > neg else "Negative"
+    return label, abs(pos - neg) / (evidence + CASCADE_PRIOR)
+
+
+# ---------------------------------------------------------------------------
+# Process-wide counters (reported like the result cache's)
+# ---------------------------------------------------------------------------
+_stats = {"settled": 0, "deferred": 0}
+_stats_lock = threading.Lock()
+
+
+def get_cascade_stats() -> dict:
+    """Return settled/deferred counters of the cascade ({} when disabled)."""
+    if not SENTIMENT_CASCADE:
+        return {}
+    with _stats_lock:
+        total = _stats["settled"] + _stats["deferred"]
+        return {**_stats, "settled_ratio": round(_stats["settled"] / total, 4) if total else 0.0}
+
+
+def settle(texts: List[str], threshold: float = SENTIMENT_CASCADE_THRESHOLD) -> List[Optional[dict]]:
+    """
+    Label the texts the lexicon is confident about.
+
+    Returns
+    -------
+    List[Optional[dict]]
+        Per text, {"label", "score"} like run_sentiment_batch(), or None
+        where the model has to decide.
+    """
+    results = []
+    for text in texts:
+        label, confidence = polarity(text)
+        if label is not None and confidence >= threshold:
+            results.append({"label": label, "score": round(confidence, 4)})
+        else:
+            results.append(None)
+
+    settled = sum(r is not None for r in results)
+    with _stats_lock:
+        _stats["settled"] += settled
+        _stats["deferred"] += len(results) - settled
+    return results
+
+
+def cascade_score(texts: List[str], score) -> Tuple[List[dict], List[str], List[dict]]:
+    """
+    Settle what the lexicon can and score the rest with ``score`` (a
+    callable with the signature of sentiment._score_texts()).
+
+    Returns
+    -------
+    tuple : (results, model_texts, model_results)
+        All results in input order, plus the texts the model scored and
+        its results for them (the only ones worth caching).
+    """
+    results = settle(texts) if SENTIMENT_CASCADE else [None] * len(texts)
+    model_indices = [i for i, r in enumerate(results) if r is None]
+    model_texts = [texts[i] for i in model_indices]
+    model_results = score(model_texts) if model_texts else []
+    for i, r in zip(model_indices, model_results):
+        results[i] = r
+    return results, model_texts, model_results
+
+
+# ---------------------------------------------------------------------------
+# CALIBRATION
+# ---------------------------------------------------------------------------
+# Posts (scored as "title. body", see reddit_processor._prepare_batch) and
+# comments that SENTIMENT_MODEL alone scored, up to %(limit)s distinct texts
+# per keyword in a stable pseudo-random order.
+CALIBRATION_SAMPLE_SQL = """
+WITH samples AS (
+    SELECT LOWER(TRIM(sp.keyword)) AS keyword,
+           BTRIM(COALESCE(sp.title_clean, '') || '. ' || COALESCE(sp.body_clean, '')) AS text,
+           sp.post_sentiment_label AS label
+    FROM silver_reddit_posts sp
+    WHERE sp.model_name = %(model)s
+    UNION
+    SELECT LOWER(TRIM(sp.keyword)), c.comment_body_clean, c.comment_sentiment_label
+    FROM silver_reddit_comments c
+    JOIN silver_reddit_posts sp ON sp.silver_post_id = c.silver_post_id
+    WHERE sp.model_name = %(model)s
+), numbered AS (
+    SELECT keyword, text, label,
+           ROW_NUMBER() OVER (PARTITION BY keyword ORDER BY MD5(text)) AS n
+    FROM samples
+    WHERE text <> '' AND label IS NOT NULL
+      AND (%(keywords)s::text[] IS NULL OR keyword = ANY(%(keywords)s::text[]))
+)
+SELECT keyword, text, label FROM numbered
+WHERE n <= %(limit)s
+ORDER BY keyword
+"""
+
+
+def _fetch_samples(keywords=None, limit=2000, model_name=SENTIMENT_MODEL):
+    """Return {keyword: [(text, model_label), ...]} from silver."""
+    from database.postgres import pg_connection
+
+    with pg_connection() as conn, conn.cursor() as cur:
+        cur.execute(CALIBRATION_SAMPLE_SQL, {
+            "model": model_name,
+            "keywords": [k.strip().lower() for k in keywords] if keywords else None,
+            "limit": limit,
+        })
+        samples = {}
+        for keyword, text, label in cur.fetchall():
+            samples.setdefault(keyword, []).append((text, label))
+        return samples
+
+
+def _evaluate(scored, thresholds):
+    """Per threshold: texts, settled, settled_ratio, agreement on settled."""
+    rows = {}
+    for threshold in thresholds:
+        settled = agree = 0
+        for label, confidence, model_label in scored:
+            if label is not None and confidence >= threshold:
+                settled += 1
+                agree += label == model_label
+        rows[threshold] = {
+            "texts": len(scored),
+            "settled": settled,
+            "settled_ratio": round(settled / len(scored), 4) if scored else 0.0,
+            "agreement": round(agree / settled, 4) if settled else None,
+            # Labels that differ from a model-only run, over all texts
+            "label_changes": round((settled - agree) / len(scored), 4) if scored else 0.0,
+        }
+    return rows
+
+
+def calibrate(samples: dict, thresholds) -> dict:
+    """
+    Replay the lexicon over model-labelled texts.
+
+    Parameters
+    ----------
+    samples : dict
+        {keyword: [(text, model_label), ...]}, as from _fetch_samples().
+    thresholds : iterable of float
+        Confidence thresholds to evaluate.
+
+    Returns
+    -------
+    dict
+        {"keywords": {keyword: {threshold: row}}, "overall": {threshold: row}}
+        with the row fields of _evaluate().
+    """
+    thresholds = sorted(thresholds)
+    report = {"keywords": {}, "overall": {}}
+    everything = []
+    for keyword, pairs in sorted(samples.items()):
+        scored = [(*polarity(text), model_label) for text, model_label in pairs]
+        everything.extend(scored)
+        report["keywords"][keyword] = _evaluate(scored, thresholds)
+    report["overall"] = _evaluate(everything, thresholds)
+    return report
+
+
+def recommend_threshold(overall: dict, min_agreement: float):
+    """Lowest threshold whose agreement on settled texts meets ``min_agreement``."""
+    for threshold, row in sorted(overall.items()):
+        if row["agreement"] is not None and row["agreement"] >= min_agreement:
+            return threshold
+    return None
+
+
+def format_report(report: dict, min_agreement: float) -> str:
+    """Render calibrate() output as a table per keyword plus the overall rows."""
+    lines = [
+        "",
+        "SENTIMENT CASCADE CALIBRATION",
+        "=============================",
+        f"  {'keyword':<24} {'thresh':>6} {'texts':>7} {'settled':>8} {'saved':>7} {'agree':>7} {'changed':>8}",
+    ]
+    sections = [*report["keywords"].items(), ("(overall)", report["overall"])]
+    for keyword, rows in sections:
+        for threshold, row in rows.items():
+            agreement = "n/a" if row["agreement"] is None else f"{row['agreement']:.1%}"
+            lines.append(
+                f"  {keyword[:24]:<24} {threshold:>6g} {row['texts']:>7} {row['settled']:>8} "
+                f"{row['settled_ratio']:>7.1%} {agreement:>7} {row['label_changes']:>8.2%}"
+            )
+    best = recommend_threshold(report["overall"], min_agreement)
+    lines.append("")
+    if best is None:
+        lines.append(f"No threshold reaches {min_agreement:.0%} agreement; keep SENTIMENT_CASCADE=false.")
+    else:
+        lines.append(
+            f"Lowest threshold with >= {min_agreement:.0%} agreement: "
+            f"SENTIMENT_CASCADE_THRESHOLD={best:g} "
+            f"(saves {report['overall'][best]['settled_ratio']:.1%} of inference)."
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """CLI: --calibrate-cascade. Exit code 1 if silver holds no model-scored texts."""
+    parser = argparse.ArgumentParser(prog="python main.py --calibrate-cascade", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--keywords", help="comma-separated keywords (default: all)")
+    parser.add_argument("--limit", type=int, default=2000, help="texts sampled per keyword")
+    parser.add_argument("--thresholds", default="0.6,0.7,0.8,0.9", help="comma-separated thresholds")
+    parser.add_argument("--min-agreement", type=float, default=0.95, help="agreement the recommendation needs")
+    parser.add_argument("--json", help="also write the report to this file")
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    keywords = [k for k in args.keywords.split(",") if k.strip()] if args.keywords else None
+    samples = _fetch_samples(keywords, args.limit)
+    if not samples:
+        print(f"[CASCADE] No silver texts scored by {SENTIMENT_MODEL} to calibrate against.")
+        return 1
+
+    report = calibrate(samples, [float(t) for t in args.thresholds.split(",") if t.strip()])
+    print(format_report(report, args.min_agreement))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True, default=str)
+            f.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
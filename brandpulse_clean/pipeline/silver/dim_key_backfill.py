@@ -0,0 +1,130 @@
+"""
+BrandPulse Clean – Silver Dimension Key Backfill
+================================================
+Fills date_id / time_id on silver rows written before silver started
+storing them (see utils/dim_keys.py).
+
+Source: New.
+
+    python -m pipeline.silver.dim_key_backfill [request_id]
+
+Without a request ID every silver table is backfilled in committed
+batches of BACKFILL_BATCH_SIZE rows. run_reddit_gold() also calls
+backfill_request() inside its transaction, so rows from older writers
+are never skipped by the gold watermark; once the one-off backfill has
+run, that call touches no rows.
+
+Keys are computed in UTC (SET LOCAL TIME ZONE 'UTC'), like
+utils/dim_keys.py.
+"""
+
+import sys
+
+from database.postgres import pg_connection
+
+BACKFILL_BATCH_SIZE = 5000
+
+# (table, key column, timestamp column, date_id column, time_id column)
+_TARGETS = (
+    ("silver_reddit_posts", "silver_post_id", "created_at_utc", "date_id", "time_id"),
+    ("silver_reddit_comments", "silver_comment_id", "comment_created_at_utc", "comment_date_id", "comment_time_id"),
+    ("silver_twitter_tweets", "silver_tweet_id", "tweet_created_at", "tweet_date_id", "tweet_time_id"),
+)
+
+_SET_KEYS = """
+    {date_col} = TO_CHAR({ts_col}, 'YYYYMMDD')::INT,
+    {time_col} = (EXTRACT(HOUR FROM {ts_col}) * 100 + EXTRACT(MINUTE FROM {ts_col}))::INT
+"""
+
+BATCH_UPDATE_SQL = """
+UPDATE {table} SET """ + _SET_KEYS + """
+WHERE {key_col} IN (
+    SELECT {key_col} FROM {table}
+    WHERE {date_col} IS NULL AND {ts_col} IS NOT NULL
+    LIMIT %s
+)
+"""
+
+# Per-request variants used by the gold load
+REQUEST_POSTS_SQL = """
+UPDATE silver_reddit_posts SET """ + _SET_KEYS.format(
+    date_col="date_id", time_col="time_id", ts_col="created_at_utc"
+) + """
+WHERE global_keyword_id = %(request_id)s
+AND date_id IS NULL AND created_at_utc IS NOT NULL
+"""
+
+REQUEST_COMMENTS_SQL = """
+UPDATE silver_reddit_comments sc SET """ + _SET_KEYS.format(
+    date_col="comment_date_id", time_col="comment_time_id", ts_col="sc.comment_created_at_utc"
+) + """
+FROM silver_reddit_posts sp
+WHERE sc.silver_post_id = sp.silver_post_id
+AND sp.global_keyword_id = %(request_id)s
+AND sc.comment_date_id IS NULL AND sc.comment_created_at_utc IS NOT NULL
+"""
+
+
+def backfill_request(cur, request_id) -> int:
+    """
+    Fill missing Reddit keys for one request inside the caller's
+    transaction.
+
+    Returns
+    -------
+    int
+        Number of rows updated.
+    """
+    cur.execute("SET LOCAL TIME ZONE 'UTC'")
+    params = {"request_id": int(request_id)}
+    cur.execute(REQUEST_POSTS_SQL, params)
+    updated = cur.rowcount
+    cur.execute(REQUEST_COMMENTS_SQL, params)
+    return updated + cur.rowcount
+
+
+def backfill_all(batch_size=BACKFILL_BATCH_SIZE) -> dict:
+    """
+    Fill missing keys in every silver table, committing per batch.
+
+    Returns
+    -------
+    dict
+        Rows updated per table. Tables that do not exist are skipped.
+    """
+    updated = {}
+    with pg_connection() as conn:
+        for table, key_col, ts_col, date_col, time_col in _TARGETS:
+            with conn.cursor() as cur:
+                cur.execute("SELECT to_regclass(%s)", (table,))
+                if cur.fetchone()[0] is None:
+                    continue
+
+            sql = BATCH_UPDATE_SQL.format(
+                table=table, key_col=key_col, ts_col=ts_col,
+                date_col=date_col, time_col=time_col,
+            )
+            updated[table] = 0
+            while True:
+                with conn.cursor() as cur:
+                    cur.execute("SET LOCAL TIME ZONE 'UTC'")
+                    cur.execute(sql, (batch_size,))
+                    count = cur.rowcount
+                conn.commit()
+                updated[table] += count
+                if count < batch_size:
+                    break
+                print(f"[SILVER] Backfilled {updated[table]} rows in {table}...")
+    return updated
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        with pg_connection() as conn:
+            with conn.cursor() as cur:
+                total = backfill_request(cur, sys.argv[1])
+            conn.commit()
+        print(f"[SILVER] Backfilled {total} rows for request {sys.argv[1]}.")
+    else:
+        for table, count in backfill_all().items():
+            print(f"[SILVER] Backfilled {count} rows in {table}.")
@@ -0,0 +1,335 @@
+"""
+BrandPulse Clean – Multi-Process Inference Pool
+===============================================
+Scores sentiment batches on forked worker processes that share one
+loaded model copy-on-write.
+
+Source: New. Drop-in alternative to run_sentiment_batch(), used by
+run_silver() and the asyncio silver stage:
+
+    from pipeline.silver.inference_pool import run_sentiment_batch_pooled
+    results = run_sentiment_batch_pooled(texts)   # same input and output
+
+With INFERENCE_WORKERS=0 (default) it is run_sentiment_batch().
+
+WHY:
+    Silver batches are small (a few hundred texts, 128-token cap), so a
+    forward pass is dominated by per-operator overhead that more torch
+    intra-op threads barely shrink. Independent processes with one or
+    two threads each scale much closer to linearly with cores.
+
+HOW IT WORKS:
+    1. Load     – the parent loads SENTIMENT_MODEL once and calls
+                  gc.freeze(), so reference-count updates in the children
+                  do not dirty (and copy) the pages holding the weights.
+    2. Fork     – INFERENCE_WORKERS children are forked and share those
+                  pages copy-on-write. Each runs torch with
+                  INFERENCE_THREADS_PER_WORKER intra-op threads and one
+                  inter-op thread and, with INFERENCE_PIN_CORES, is pinned
+                  to its own cores.
+    3. Dispatch – a call is cut into chunks of at least
+                  INFERENCE_MIN_CHUNK texts on one shared task queue; the
+                  next idle worker takes the next chunk and scores it with
+                  _score_texts() (length buckets as before).
+    4. Collect  – a collector thread routes each chunk's results to the
+                  calling thread by call id, and the call reassembles them
+                  in input order. Several threads may call at once.
+
+The result cache stays in the parent: only cache misses reach the
+workers (sentiment.score_with_cache). If a worker dies, pending calls
+fail with RuntimeError and the next call forks a new pool.
+
+FORK SAFETY:
+    Only the torch backend is supported; onnxruntime sessions do not
+    survive fork. The parent must not have run a forward pass before the
+    fork (torch's OpenMP thread pool does not survive it either), so
+    workers start the pool at warm-up, before any inference and before
+    their job threads.
+"""
+
+import gc
+import itertools
+import math
+import multiprocessing
+import os
+import queue
+import signal
+import threading
+from typing import List
+
+import torch
+
+from config.settings import (
+    INFERENCE_MIN_CHUNK,
+    INFERENCE_PIN_CORES,
+    INFERENCE_THREADS_PER_WORKER,
+    INFERENCE_WORKERS,
+    SENTIMENT_BACKEND,
+)
+from pipeline.silver import sentiment
+from utils.logging import get_logger
+
+logger = get_logger("INFERENCE")
+
+# Tells a worker to exit
+_STOP = None
+
+# How often the collector checks that every worker is still alive
+_WATCH_SECONDS = 1.0
+
+
+def core_sets(workers, threads_per_worker):
+    """
+    Split this process's CPUs into one core set per worker.
+
+    Worker i gets ``threads_per_worker`` consecutive CPUs, wrapping around
+    when there are more threads than CPUs.
+    """
+    available = sorted(os.sched_getaffinity(0))
+    return [
+        {available[(i * threads_per_worker + t) % len(available)] for t in range(threads_per_worker)}
+        for i in range(workers)
+    ]
+
+
+def _worker_main(threads, cores, tasks, results):
+    """Worker process: score chunks until told to stop."""
+    # Ctrl-C reaches the whole process group; the parent shuts workers down
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    # The parent held this lock while forking; the child's copy is still locked
+    sentiment._inference_lock = threading.Lock()
+    if cores:
+        os.sched_setaffinity(0, cores)
+    torch.set_num_threads(threads)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        pass  # already fixed by the parent
+
+    while True:
+        task = tasks.get()
+        if task is _STOP:
+            return
+        call_id, chunk_index, texts = task
+        try:
+            results.put((call_id, chunk_index, sentiment._score_texts(texts), None))
+        except Exception as e:
+            results.put((call_id, chunk_index, None, f"{type(e).__name__}: {e}"))
+
+
+class _Call:
+    """Chunks of one score() call, filled in by the collector thread."""
+
+    def __init__(self, chunk_count):
+        self.parts = [None] * chunk_count
+        self.remaining = chunk_count
+        self.error = None
+        self.done = threading.Event()
+
+    def deliver(self, chunk_index, scored, error):
+        if error is not None:
+            self.error = self.error or error
+        else:
+            self.parts[chunk_index] = scored
+        self.remaining -= 1
+        if self.remaining == 0 or error is not None:
+            self.done.set()
+
+    def fail(self, error):
+        self.error = self.error or error
+        self.done.set()
+
+
+class InferencePool:
+    """
+    Forked sentiment workers sharing the parent's loaded model.
+
+    Parameters
+    ----------
+    workers : int
+        Number of worker processes.
+    threads_per_worker : int
+        torch intra-op threads per worker.
+    pin_cores : bool
+        Pin each worker to its own ``threads_per_worker`` CPUs.
+    min_chunk : int
+        Smallest number of texts sent to one worker; smaller calls use
+        fewer workers instead of paying one round trip per text.
+
+    Raises
+    ------
+    ValueError
+        If SENTIMENT_BACKEND is not "torch".
+    """
+
+    def __init__(self, workers, threads_per_worker=1, pin_cores=False, min_chunk=INFERENCE_MIN_CHUNK):
+        if SENTIMENT_BACKEND != "torch":
+            raise ValueError(
+                f"The inference pool needs SENTIMENT_BACKEND=torch (got '{SENTIMENT_BACKEND}'); "
+                "onnxruntime sessions cannot be shared across fork."
+            )
+        self.workers = max(1, int(workers))
+        self.threads_per_worker = max(1, int(threads_per_worker))
+        self.min_chunk = max(1, int(min_chunk))
+        self.pid = os.getpid()
+        self.broken = None
+        self._closed = False
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._ids = itertools.count()
+
+        ctx = multiprocessing.get_context("fork")
+        self._tasks = ctx.Queue()
+        self._results = ctx.Queue()
+
+        # 1. Load once in the parent, then keep the weights' pages clean
+        sentiment._get_sentiment_pipeline()
+        gc.collect()
+        gc.freeze()
+
+        # 2. Fork; no forward pass may be in flight while we do
+        cores = core_sets(self.workers, self.threads_per_worker) if pin_cores else [None] * self.workers
+        with sentiment._inference_lock:
+            self._procs = [
+                ctx.Process(
+                    target=_worker_main,
+                    args=(self.threads_per_worker, cores[i], self._tasks, self._results),
+                    name=f"inference-{i}",
+                    daemon=True,
+                )
+                for i in range(self.workers)
+            ]
+            for proc in self._procs:
+                proc.start()
+
+        self._collector = threading.Thread(target=self._collect, name="inference-collector", daemon=True)
+        self._collector.start()
+        logger.info(
+            "Inference pool started: %d workers x %d threads%s.",
+            self.workers, self.threads_per_worker, " (pinned)" if pin_cores else "",
+        )
+
+    # -- collector thread ---------------------------------------------------
+    def _collect(self):
+        while not self._closed:
+            try:
+                call_id, chunk_index, scored, error = self._results.get(timeout=_WATCH_SECONDS)
+            except queue.Empty:
+                dead = [p.name for p in self._procs if not p.is_alive()]
+                if dead and not self._closed:
+                    self._fail_all(RuntimeError(f"Inference worker(s) exited: {', '.join(dead)}"))
+                    return
+                continue
+            with self._lock:
+                call = self._pending.get(call_id)
+            if call is not None:
+                call.deliver(chunk_index, scored, error)
+
+    def _fail_all(self, error):
+        self.broken = error
+        logger.error("%s", error)
+        with self._lock:
+            calls = list(self._pending.values())
+        for call in calls:
+            call.fail(str(error))
+
+    # -- public -------------------------------------------------------------
+    def score(self, texts: List[str]) -> List[dict]:
+        """
+        Score ``texts`` across the workers; same output as _score_texts().
+
+        Raises
+        ------
+        RuntimeError
+            If a worker failed or exited.
+        """
+        if not texts:
+            return []
+        if self.broken is not None:
+            raise RuntimeError(str(self.broken))
+
+        size = max(self.min_chunk, math.ceil(len(texts) / self.workers))
+        chunks = [texts[i:i + size] for i in range(0, len(texts), size)]
+        call = _Call(len(chunks))
+        call_id = next(self._ids)
+        with self._lock:
+            self._pending[call_id] = call
+        try:
+            for chunk_index, chunk in enumerate(chunks):
+                self._tasks.put((call_id, chunk_index, chunk))
+            call.done.wait()
+        finally:
+            with self._lock:
+                self._pending.pop(call_id, None)
+
+        if call.error is not None:
+            raise RuntimeError(f"Inference worker failed: {call.error}")
+        return [result for part in call.parts for result in part]
+
+    def close(self, timeout=10.0):
+        """Stop the workers (terminating any that do not exit in ``timeout``)."""
+        if self._closed:
+            return
+        self._closed = True
+        for _ in self._procs:
+            self._tasks.put(_STOP)
+        for proc in self._procs:
+            proc.join(timeout)
+            if proc.is_alive():
+                proc.terminate()
+                proc.join()
+        self._collector.join()
+        self.broken = RuntimeError("Inference pool closed")
+        with self._lock:
+            calls = list(self._pending.values())
+        for call in calls:
+            call.fail(str(self.broken))
+
+
+# ---------------------------------------------------------------------------
+# Lazy process-wide pool
+# ---------------------------------------------------------------------------
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_inference_pool():
+    """
+    Return the process-wide InferencePool, forking it on first call (and
+    again after a worker died).
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is not None and (_pool.broken is not None or _pool.pid != os.getpid()):
+            if _pool.pid == os.getpid():
+                logger.warning("Restarting inference pool after: %s", _pool.broken)
+                _pool.close()
+            _pool = None
+        if _pool is None:
+            _pool = InferencePool(
+                INFERENCE_WORKERS,
+                threads_per_worker=INFERENCE_THREADS_PER_WORKER,
+                pin_cores=INFERENCE_PIN_CORES,
+            )
+        return _pool
+
+
+def close_inference_pool():
+    """Stop the process-wide pool, if one was started."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None and _pool.pid == os.getpid():
+            _pool.close()
+        _pool = None
+
+
+def run_sentiment_batch_pooled(texts: List[str]) -> List[dict]:
+    """
+    run_sentiment_batch() on the inference pool.
+
+    Takes and returns exactly what run_sentiment_batch() does, with the
+    same result cache. With INFERENCE_WORKERS=0 it is run_sentiment_batch().
+    """
+    if INFERENCE_WORKERS <= 0:
+        return sentiment.run_sentiment_batch(texts)
+    return sentiment.score_with_cache(texts, lambda misses: get_inference_pool().score(misses))
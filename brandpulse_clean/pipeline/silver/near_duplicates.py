@@ -0,0 +1,227 @@
+"""
+BrandPulse Clean – Silver Near-Duplicate Index
+==============================================
+Scores each group of near-identical texts once: cross-posts, bot replies
+and quoted comments reuse the sentiment of the first copy seen (the
+representative) instead of going through the model again.
+
+Source: New. Used by run_silver() and the asyncio silver stage when
+SILVER_DEDUP is on:
+
+    from pipeline.silver.near_duplicates import run_sentiment_batch_deduped
+    results = run_sentiment_batch_deduped(texts, keyword)
+
+HOW IT WORKS:
+    1. Sign     – texts of at least SILVER_DEDUP_MIN_CHARS characters get a
+                  MinHash signature (utils/text_processing/minhash.py).
+                  Shorter texts are always scored.
+    2. Lookup   – one query loads this keyword's stored representatives
+                  that share an LSH band with the batch
+                  (silver_near_duplicates in MongoDB).
+    3. Group    – in batch order, a text whose signature similarity to a
+                  stored or earlier representative reaches
+                  SILVER_DEDUP_THRESHOLD becomes its near-duplicate;
+                  otherwise it becomes a representative itself.
+    4. Score    – only representatives are scored, through
+                  run_sentiment_batch_pooled() (cache, cascade, pool).
+    5. Persist  – the batch's new representatives are stored with their
+                  signature, bands and sentiment, so later batches and
+                  requests for the keyword match against them.
+
+A near-duplicate's result carries "duplicate_of", the text_hash() of its
+representative, which silver writes to near_duplicate_of on posts and
+comments. Stored representatives are keyed by keyword and
+cascade.scorer_name(), so a different model (or cascade setting) starts
+a fresh index.
+"""
+
+import threading
+from datetime import datetime, timezone
+from typing import List
+
+from bson.binary import Binary
+import numpy as np
+from pymongo import UpdateOne
+
+from config.settings import (
+    SILVER_DEDUP,
+    SILVER_DEDUP_BANDS,
+    SILVER_DEDUP_MIN_CHARS,
+    SILVER_DEDUP_NUM_PERM,
+    SILVER_DEDUP_THRESHOLD,
+)
+from database.mongo import get_near_duplicate_collection
+from pipeline.silver.cascade import scorer_name
+from pipeline.silver.inference_pool import run_sentiment_batch_pooled
+from pipeline.silver.sentiment_cache import text_hash
+from utils.text_processing.minhash import LSHIndex, MinHasher
+
+# Fields read back from silver_near_duplicates
+_REPRESENTATIVE_PROJECTION = {"_id": 0, "text_hash": 1, "signature": 1, "bands": 1, "label": 1, "score": 1}
+
+# ---------------------------------------------------------------------------
+# Lazy hasher — hash coefficients drawn on first use
+# ---------------------------------------------------------------------------
+_hasher = None
+
+
+def _get_hasher():
+    """Return the shared MinHasher (SILVER_DEDUP_NUM_PERM functions, fixed seed)."""
+    global _hasher
+    if _hasher is None:
+        _hasher = MinHasher(SILVER_DEDUP_NUM_PERM)
+    return _hasher
+
+
+# ---------------------------------------------------------------------------
+# Process-wide counters (reported like the result cache's)
+# ---------------------------------------------------------------------------
+_stats = {"texts": 0, "scored": 0, "batch_duplicates": 0, "stored_duplicates": 0}
+_stats_lock = threading.Lock()
+
+
+def get_near_duplicate_stats() -> dict:
+    """Return the near-duplicate counters ({} when SILVER_DEDUP is off)."""
+    if not SILVER_DEDUP:
+        return {}
+    with _stats_lock:
+        saved = _stats["batch_duplicates"] + _stats["stored_duplicates"]
+        return {**_stats, "saved_ratio": round(saved / _stats["texts"], 4) if _stats["texts"] else 0.0}
+
+
+# ---------------------------------------------------------------------------
+# PERSISTENCE
+# ---------------------------------------------------------------------------
+def _load_representatives(collection, keyword, model_name, band_keys):
+    """Stored representatives of ``keyword`` sharing at least one of ``band_keys``."""
+    if not band_keys:
+        return []
+    return list(collection.find(
+        {"keyword": keyword, "model_name": model_name, "bands": {"$in": list(band_keys)}},
+        _REPRESENTATIVE_PROJECTION,
+    ))
+
+
+def _store_representatives(collection, keyword, model_name, entries):
+    """Upsert (hash, signature, bands, result) entries; concurrent writers are harmless."""
+    if not entries:
+        return
+    now = datetime.now(timezone.utc)
+    collection.bulk_write([
+        UpdateOne(
+            {"keyword": keyword, "model_name": model_name, "text_hash": rep_hash},
+            {"$setOnInsert": {
+                "signature": Binary(signature.tobytes()),
+                "bands": bands,
+                "label": result["label"],
+                "score": result["score"],
+                "created_at": now,
+            }},
+            upsert=True,
+        )
+        for rep_hash, signature, bands, result in entries
+    ], ordered=False)
+
+
+# ---------------------------------------------------------------------------
+# PUBLIC
+# ---------------------------------------------------------------------------
+def score_near_duplicates(texts: List[str], keyword: str, score) -> List[dict]:
+    """
+    Score ``texts`` with ``score``, once per near-duplicate group.
+
+    Parameters
+    ----------
+    texts : List[str]
+        Cleaned texts of one silver batch.
+    keyword : str
+        The request's keyword; representatives are stored per keyword.
+    score : callable
+        Takes and returns what run_sentiment_batch() does.
+
+    Returns
+    -------
+    List[dict]
+        One result per text, in order. Near-duplicates get a copy of their
+        representative's result with "duplicate_of" set.
+    """
+    if not SILVER_DEDUP or not texts:
+        return score(texts)
+
+    keyword = (keyword or "").strip().lower()
+    model_name = scorer_name()
+    hasher = _get_hasher()
+    index = LSHIndex(SILVER_DEDUP_NUM_PERM, SILVER_DEDUP_BANDS)
+
+    signatures = [
+        hasher.signature(text) if len(text) >= SILVER_DEDUP_MIN_CHARS else None
+        for text in texts
+    ]
+    band_keys = [index.band_keys(sig) if sig is not None else None for sig in signatures]
+
+    # 1. Representatives stored by earlier batches / requests
+    collection = get_near_duplicate_collection()
+    stored = {}
+    wanted = {key for keys in band_keys if keys for key in keys}
+    for doc in _load_representatives(collection, keyword, model_name, wanted):
+        signature = np.frombuffer(doc["signature"], dtype=np.uint32)
+        if len(signature) != SILVER_DEDUP_NUM_PERM:
+            continue
+        index.add(doc["text_hash"], signature, doc["bands"])
+        stored[doc["text_hash"]] = {"label": doc["label"], "score": doc["score"]}
+
+    # 2. Group the batch in order; the first copy seen represents the rest
+    duplicate_of = [None] * len(texts)
+    representatives = {}  # text_hash → index of the representative text
+    to_score = []
+    for i, signature in enumerate(signatures):
+        if signature is None:
+            to_score.append(i)
+            continue
+        match = index.query(signature, SILVER_DEDUP_THRESHOLD, band_keys[i])
+        if match is not None:
+            duplicate_of[i] = match[0]
+            continue
+        rep_hash = text_hash(texts[i])
+        index.add(rep_hash, signature, band_keys[i])
+        representatives[rep_hash] = i
+        to_score.append(i)
+
+    # 3. Score representatives (and unsigned texts) only
+    results = [None] * len(texts)
+    scored = score([texts[i] for i in to_score]) if to_score else []
+    for i, result in zip(to_score, scored):
+        results[i] = result
+
+    batch_duplicates = stored_duplicates = 0
+    for i, rep_hash in enumerate(duplicate_of):
+        if rep_hash is None:
+            continue
+        if rep_hash in representatives:
+            source = results[representatives[rep_hash]]
+            batch_duplicates += 1
+        else:
+            source = stored[rep_hash]
+            stored_duplicates += 1
+        results[i] = {"label": source["label"], "score": source["score"], "duplicate_of": rep_hash}
+
+    # 4. Persist this batch's representatives for later batches / requests
+    _store_representatives(collection, keyword, model_name, [
+        (rep_hash, signatures[i], band_keys[i], results[i])
+        for rep_hash, i in representatives.items()
+    ])
+
+    with _stats_lock:
+        _stats["texts"] += len(texts)
+        _stats["scored"] += len(to_score)
+        _stats["batch_duplicates"] += batch_duplicates
+        _stats["stored_duplicates"] += stored_duplicates
+    return results
+
+
+def run_sentiment_batch_deduped(texts: List[str], keyword: str) -> List[dict]:
+    """
+    run_sentiment_batch_pooled() that scores each near-duplicate group
+    once. With SILVER_DEDUP off it is run_sentiment_batch_pooled().
+    """
+    return score_near_duplicates(texts, keyword, run_sentiment_batch_pooled)
@@ -0,0 +1,238 @@
+"""
+BrandPulse Clean – ONNX Runtime Sentiment Backend
+=================================================
+CPU-optimized alternative to the eager PyTorch HuggingFace pipeline,
+selected with SENTIMENT_BACKEND=onnx.
+
+Source: New. Our workers have no GPU, so _get_sentiment_pipeline()
+always ran eager PyTorch on device=-1.
+
+HOW IT WORKS:
+    1. export_onnx() exports SENTIMENT_MODEL to ONNX once and caches the
+       artifact (plus tokenizer and config) under ONNX_CACHE_DIR.
+    2. OnnxSentimentClassifier serves it through onnxruntime with all
+       graph optimizations enabled; the optimized graph is cached next
+       to the export so later processes skip the optimization pass.
+    3. The classifier is called like the HF pipeline,
+       ``clf(texts, batch_size=n)``, and returns the same
+       ``{"label": "LABEL_x", "score": p}`` dicts, so LABEL_MAP and
+       run_sentiment_batch() work unchanged.
+
+PARITY CHECK:
+    python -m pipeline.silver.onnx_backend [texts_file]
+
+    Scores the texts (one per line, or a built-in sample) with both
+    backends, reports label agreement, the largest score difference and
+    texts/sec for each, and exits with code 1 if any label differs.
+
+Requires the optional `onnx` and `onnxruntime` packages.
+"""
+
+import os
+import sys
+import time
+from typing import List
+
+import numpy as np
+
+from config.settings import ONNX_CACHE_DIR, SENTIMENT_MODEL
+from pipeline.silver.sentiment import (
+    MAX_LENGTH,
+    _build_torch_pipeline,
+    _score_texts,
+)
+
+
+def _artifact_dir(model_name: str) -> str:
+    """Cache directory for one model's exported artifacts."""
+    return os.path.join(ONNX_CACHE_DIR, model_name.replace("/", "__"))
+
+
+def export_onnx(model_name: str = SENTIMENT_MODEL) -> str:
+    """
+    Export ``model_name`` to ONNX unless a cached export already exists.
+
+    Returns
+    -------
+    str
+        Path to the exported ``model.onnx``.
+    """
+    out_dir = _artifact_dir(model_name)
+    model_path = os.path.join(out_dir, "model.onnx")
+    if os.path.exists(model_path):
+        return model_path
+
+    import torch
+    from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+    os.makedirs(out_dir, exist_ok=True)
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = AutoModelForSequenceClassification.from_pretrained(model_name)
+    model.eval()
+
+    sample = tokenizer(
+        ["BrandPulse export sample", "a second, slightly longer sample text"],
+        truncation=True, max_length=MAX_LENGTH, padding=True, return_tensors="pt",
+    )
+    tmp_path = model_path + ".tmp"
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            (sample["input_ids"], sample["attention_mask"]),
+            tmp_path,
+            input_names=["input_ids", "attention_mask"],
+            output_names=["logits"],
+            dynamic_axes={
+                "input_ids": {0: "batch", 1: "sequence"},
+                "attention_mask": {0: "batch", 1: "sequence"},
+                "logits": {0: "batch"},
+            },
+            opset_version=14,
+        )
+
+    tokenizer.save_pretrained(out_dir)
+    model.config.save_pretrained(out_dir)
+    # Rename last so a crashed export is never mistaken for a cached one
+    os.replace(tmp_path, model_path)
+    return model_path
+
+
+class OnnxSentimentClassifier:
+    """
+    onnxruntime-backed stand-in for the HF "sentiment-analysis" pipeline.
+
+    Exposes ``tokenizer`` (used by run_sentiment_batch for length
+    bucketing) and is callable with a list of texts.
+    """
+
+    def __init__(self, model_name: str = SENTIMENT_MODEL):
+        try:
+            import onnxruntime as ort
+        except ImportError as e:
+            raise RuntimeError(
+                "SENTIMENT_BACKEND=onnx requires the 'onnxruntime' package. "
+                "Install it with: pip install onnx onnxruntime"
+            ) from e
+        from transformers import AutoConfig, AutoTokenizer
+
+        model_path = export_onnx(model_name)
+        out_dir = os.path.dirname(model_path)
+        optimized_path = os.path.join(out_dir, "model.optimized.onnx")
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if os.path.exists(optimized_path):
+            model_path = optimized_path
+        else:
+            options.optimized_model_filepath = optimized_path
+
+        self.session = ort.InferenceSession(
+            model_path, sess_options=options, providers=["CPUExecutionProvider"],
+        )
+        self.tokenizer = AutoTokenizer.from_pretrained(out_dir)
+        self.id2label = AutoConfig.from_pretrained(out_dir).id2label
+        self._input_names = [i.name for i in self.session.get_inputs()]
+
+    def __call__(self, texts: List[str], batch_size: int = None) -> List[dict]:
+        if not texts:
+            return []
+        batch_size = batch_size or len(texts)
+
+        results = []
+        for start in range(0, len(texts), batch_size):
+            encoded = self.tokenizer(
+                texts[start:start + batch_size],
+                truncation=True, max_length=MAX_LENGTH, padding=True, return_tensors="np",
+            )
+            feeds = {name: encoded[name].astype(np.int64) for name in self._input_names}
+            logits = self.session.run(["logits"], feeds)[0]
+
+            # Numerically stable softmax, same as the HF pipeline
+            shifted = logits - logits.max(axis=-1, keepdims=True)
+            probs = np.exp(shifted)
+            probs /= probs.sum(axis=-1, keepdims=True)
+
+            for row in probs:
+                best = int(row.argmax())
+                results.append({"label": self.id2label[best], "score": float(row[best])})
+        return results
+
+
+# ---------------------------------------------------------------------------
+# PARITY CHECK & THROUGHPUT COMPARISON
+# ---------------------------------------------------------------------------
+_SAMPLE_TEXTS = [
+    "I love this phone, best purchase I've made all year.",
+    "The battery died after two days. Really disappointed with the support team.",
+    "Does anyone know if the update is out in Europe yet?",
+    "Honestly it's fine. Nothing special but it does the job.",
+    "Worst customer service ever, waited three hours and nobody answered.",
+    "The new model looks great but the price is way too high for what you get.",
+    "Shipping was fast and the packaging was nice.",
+    "Not sure how I feel about the redesign, it takes some getting used to.",
+]
+
+
+def compare_backends(texts: List[str], repeats: int = 3) -> dict:
+    """
+    Score ``texts`` with the torch pipeline and the ONNX classifier.
+
+    Returns
+    -------
+    dict
+        label_agreement, mismatches, max_score_diff and texts_per_sec for
+        each backend (best of ``repeats`` timed runs after one warm-up).
+    """
+    backends = {
+        "torch": _build_torch_pipeline(),
+        "onnx": OnnxSentimentClassifier(SENTIMENT_MODEL),
+    }
+
+    outputs = {}
+    throughput = {}
+    for name, scorer in backends.items():
+        outputs[name] = _score_texts(texts, scorer)  # warm-up + reference output
+        best = float("inf")
+        for _ in range(repeats):
+            started = time.perf_counter()
+            _score_texts(texts, scorer)
+            best = min(best, time.perf_counter() - started)
+        throughput[name] = round(len(texts) / max(best, 1e-9), 2)
+
+    mismatches = [
+        {"text": t, "torch": a["label"], "onnx": b["label"]}
+        for t, a, b in zip(texts, outputs["torch"], outputs["onnx"])
+        if a["label"] != b["label"]
+    ]
+    max_score_diff = max(
+        (abs(a["score"] - b["score"]) for a, b in zip(outputs["torch"], outputs["onnx"])),
+        default=0.0,
+    )
+
+    return {
+        "texts": len(texts),
+        "label_agreement": round(1 - len(mismatches) / len(texts), 4) if texts else 1.0,
+        "mismatches": mismatches,
+        "max_score_diff": round(max_score_diff, 4),
+        "texts_per_sec": throughput,
+        "speedup": round(throughput["onnx"] / throughput["torch"], 2) if throughput["torch"] else None,
+    }
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], encoding="utf-8") as f:
+            sample = [line.strip() for line in f if line.strip()]
+    else:
+        sample = _SAMPLE_TEXTS
+
+    report = compare_backends(sample)
+    print(f"Texts compared:   {report['texts']}")
+    print(f"Label agreement:  {report['label_agreement']:.2%}")
+    print(f"Max score diff:   {report['max_score_diff']}")
+    print(f"Throughput (t/s): torch={report['texts_per_sec']['torch']} "
+          f"onnx={report['texts_per_sec']['onnx']} (x{report['speedup']})")
+    for m in report["mismatches"]:
+        print(f"  MISMATCH torch={m['torch']} onnx={m['onnx']}: {m['text'][:80]}")
+
+    sys.exit(1 if report["mismatches"] else 0)
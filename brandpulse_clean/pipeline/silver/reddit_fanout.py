@@ -0,0 +1,114 @@
+"""
+BrandPulse Clean – Silver Reddit Fan-Out
+========================================
+Copies one request's silver Reddit results (posts, comments, comment
+summaries) to another request ID without re-ingesting or re-scoring.
+
+Source: New. Used for coalesced requests (pipeline/single_flight.py):
+followers receive the leader's silver rows, then run Gold on their own
+request ID as usual.
+
+Copied posts get original_bronze_id '<bronze id>:r<request_id>' (the
+bronze part of a copied row's id is kept, so copies of copies stay short).
+silver_reddit_posts is unique on original_bronze_id, so the copy cannot
+collide with the source row, and copying to the same request twice is a
+no-op. Everything is one statement, so the copy is atomic.
+
+build_copy_sql() is shared with pipeline/silver/reddit_reuse.py, which
+copies from earlier requests selected by keyword, model and date.
+"""
+
+from database.postgres import pg_connection
+from pipeline.silver.reddit_writer import COMMENT_COLUMNS, POST_COLUMNS
+
+_COPY_BRONZE_ID = "SPLIT_PART(src.original_bronze_id, ':', 1) || ':r' || %(target)s::TEXT"
+
+# Columns rewritten for the target request; all others are copied as-is
+_POST_OVERRIDES = {
+    "original_bronze_id": _COPY_BRONZE_ID,
+    "global_keyword_id": "%(target)s",
+    "processed_at_utc": "NOW()",
+}
+
+
+def build_copy_sql(source_sql):
+    """
+    Build the copy statement for the silver posts selected by ``source_sql``.
+
+    Parameters
+    ----------
+    source_sql : str
+        SELECT returning whole silver_reddit_posts rows (``SELECT sp.*``),
+        with any parameters as %(name)s. ``%(target)s`` is the target
+        request ID.
+
+    Returns
+    -------
+    str
+        One statement returning (posts, comments, summaries) copied.
+    """
+    return f"""
+WITH src AS (
+    {source_sql}
+),
+posts AS (
+    INSERT INTO silver_reddit_posts ({", ".join(POST_COLUMNS)})
+    SELECT {", ".join(_POST_OVERRIDES.get(c, "src." + c) for c in POST_COLUMNS)}
+    FROM src
+    ON CONFLICT (original_bronze_id) DO NOTHING
+    RETURNING silver_post_id, original_bronze_id
+),
+pairs AS (
+    SELECT src.silver_post_id AS source_id, posts.silver_post_id AS target_id
+    FROM posts
+    JOIN src ON posts.original_bronze_id = {_COPY_BRONZE_ID}
+),
+comments AS (
+    INSERT INTO silver_reddit_comments ({", ".join(COMMENT_COLUMNS)})
+    SELECT {", ".join("pairs.target_id" if c == "silver_post_id" else "c." + c for c in COMMENT_COLUMNS)}
+    FROM pairs
+    JOIN silver_reddit_comments c ON c.silver_post_id = pairs.source_id
+    ON CONFLICT DO NOTHING
+    RETURNING 1
+),
+summaries AS (
+    INSERT INTO silver_reddit_comment_sentiment_summary (silver_post_id, aggregated_label, aggregated_score)
+    SELECT pairs.target_id, s.aggregated_label, s.aggregated_score
+    FROM pairs
+    JOIN silver_reddit_comment_sentiment_summary s ON s.silver_post_id = pairs.source_id
+    ON CONFLICT (silver_post_id) DO NOTHING
+    RETURNING 1
+)
+SELECT (SELECT COUNT(*) FROM posts), (SELECT COUNT(*) FROM comments), (SELECT COUNT(*) FROM summaries);
+"""
+
+
+COPY_RESULTS_SQL = build_copy_sql(
+    "SELECT * FROM silver_reddit_posts WHERE global_keyword_id = %(source)s"
+)
+
+MARK_INGESTED_SQL = """
+UPDATE global_keywords SET bronze_processed = TRUE WHERE global_keyword_id = %(target)s
+"""
+
+
+def copy_request_results(source_request_id, target_request_id):
+    """
+    Copy the silver Reddit rows of ``source_request_id`` to ``target_request_id``.
+
+    Returns
+    -------
+    tuple : (posts_copied, comments_copied)
+    """
+    params = {"source": int(source_request_id), "target": int(target_request_id)}
+    # Uncommitted work is rolled back when the connection is returned
+    with pg_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(COPY_RESULTS_SQL, params)
+            posts, comments, _ = cur.fetchone()
+            # The target request needs no ingestion of its own (run_bronze)
+            cur.execute(MARK_INGESTED_SQL, params)
+        conn.commit()
+
+    print(f"[SILVER] Copied {posts} posts and {comments} comments from request {source_request_id}.")
+    return posts, comments
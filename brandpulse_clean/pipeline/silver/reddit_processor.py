@@ -8,9 +8,41 @@ Source: ETL_2/silver_layer.py
 
 ARCHITECTURAL FIXES:
     1. Module-level DB connections replaced with get_mongo_collections()
-       and get_pg_connection() called inside the function.
+       and pg_connection() called inside the function.
     2. Sentiment inference pipeline imported from pipeline/silver/sentiment.py.
     3. Reddit-specific text utilities imported from utils/text_processing/reddit.py.
+    4. Posts, comments and summaries are written with one bulk statement
+       per table per batch (pipeline/silver/reddit_writer.py) instead of
+       one INSERT per row.
+    5. Fetch/clean, inference and persistence run as concurrent stages
+       joined by bounded queues (utils/stage_queue.py).
+    6. Posts and comments are written with their dim_date / dim_time keys
+       (date_id/time_id, comment_date_id/comment_time_id) precomputed by
+       utils/dim_keys.py, so gold joins the dimensions by primary key.
+    7. Posts record the SENTIMENT_MODEL that scored them (model_name), so
+       later requests can reuse them (pipeline/silver/reddit_reuse.py).
+    8. Streaming mode: run_silver(source=...) takes bronze chunks as
+       ingestion writes them (iter_ingest_keyword(chunk_size=...)), so
+       inference starts while Reddit is still being fetched.
+    9. Pending documents are selected with silver_processed: false
+       (previously $ne: True, which no index can serve).
+   10. Bronze is read through one projected, server-batched cursor
+       (BRONZE_PROJECTION) instead of a full-document query per batch,
+       and batches carry only ids and cleaned values, not raw documents.
+       That is what lets SILVER_BATCH_SIZE default well above the former
+       50-document cap.
+   11. Batches are scored with run_sentiment_batch_pooled() (by way of
+       run_sentiment_batch_deduped(), see 13), which uses the forked
+       multi-process inference pool when INFERENCE_WORKERS is set
+       (pipeline/silver/inference_pool.py) and run_sentiment_batch()
+       otherwise.
+   12. With SENTIMENT_CASCADE, confident texts are labelled by the lexicon
+       cascade (pipeline/silver/cascade.py) instead of the model, and
+       posts record cascade.scorer_name() as model_name.
+   13. With SILVER_DEDUP, near-duplicate texts reuse the sentiment of
+       their representative instead of being scored
+       (pipeline/silver/near_duplicates.py) and are tagged with it in
+       near_duplicate_of.
 
 BUG FIX:
     Handles two comment formats in bronze_raw_reddit_data using
@@ -19,21 +51,33 @@ BUG FIX:
       Format B: comment["body"]
 
 KNOWN BUGS FLAGGED (DO NOT FIX):
-    - pipeline_runs and silver_errors PostgreSQL tables exist but are never written to.
+    - silver_errors PostgreSQL table exists but is never written to.
+      (pipeline_runs is now written by run_pipeline(); the silver stage
+      timings recorded here end up in pipeline_runs.metrics.)
     - analysis_history.dominant_sentiment has inconsistent casing: 'Neutral' vs 'neutral'.
     - ml_models collection shows cardiffnlp model but code uses bertweet.
 """
 
+import threading
+import time
 from datetime import datetime, timezone
 from utils.logging import get_logger
 
 logger = get_logger("SILVER")
 
+from config.settings import SILVER_BATCH_SIZE, SILVER_QUEUE_DEPTH
 from database.mongo import get_mongo_collections
-from database.postgres import get_pg_connection
+from database.mongo_indexes import pending_filter
+from database.postgres import pg_connection
+from utils import metrics
+from utils.dim_keys import dim_keys
+from utils.stage_queue import END, StageQueue, StageThread
 from utils.text_processing.base import hash_author, aggregate_sentiment
 from utils.text_processing.reddit import clean_reddit_text, is_eligible_comment
-from pipeline.silver.sentiment import run_sentiment_batch
+from pipeline.silver.cascade import get_cascade_stats, scorer_name
+from pipeline.silver.near_duplicates import get_near_duplicate_stats, run_sentiment_batch_deduped
+from pipeline.silver.sentiment import get_cache_stats
+from pipeline.silver.reddit_writer import write_comment_summaries, write_comments, write_posts
 
 
 def detect_comment_format(comment: dict) -> dict:
@@ -47,52 +91,50 @@ def detect_comment_format(comment: dict) -> dict:
     return comment
 
 
-def run_silver(request_id, batch_size=50):
+# Bronze fields silver reads; everything else (meta beyond the external
+# ID, fetched_at, unused post fields) stays on the server.
+BRONZE_PROJECTION = {
+    "_id": 1,
+    "keyword": 1,
+    "meta.external_id": 1,
+    **{f"raw_post.{f}": 1 for f in (
+        "name", "title", "selftext", "author", "score", "upvote_ratio",
+        "num_comments", "subreddit_name_prefixed", "url", "created_utc",
+    )},
+    # Both comment formats (see detect_comment_format)
+    **{f"raw_comments.{p}{f}": 1 for p in ("", "data.") for f in (
+        "id", "body", "author", "score", "created_utc",
+    )},
+}
+
+
+class _Batch:
+    """One bronze batch as it moves through the silver stages."""
+
+    def __init__(self, number, doc_count, texts, doc_mapping, started):
+        self.number = number
+        self.doc_count = doc_count
+        self.texts = texts
+        self.doc_mapping = doc_mapping
+        self.started = started
+        self.scores = []
+
+
+def _prepare_batch(raw_docs):
     """
-    Main Silver Layer process: Cleans data, runs RoBERTa sentiment,
-    and persists to PostgreSQL with Transactional Integrity.
+    Clean one batch of bronze documents and collect the texts to score.
+
+    Returns
+    -------
+    tuple : (all_texts_to_score, doc_mapping, noise_ids)
+        Texts in scoring order (each post followed by its eligible
+        comments); per document, only the ids and cleaned values needed
+        to persist it (the raw document is not kept); and the _ids of
+        documents skipped as noise, for the caller to mark processed.
     """
-    pg_conn = get_pg_connection()
-    cursor_pg = pg_conn.cursor()
-    processed_mongo_ids = []  # Track successful Postgres writes
-
-    bronze_col, _, _ = get_mongo_collections()
-
-    # 1. ROBUST REQUEST ID HANDLING
-    try:
-        # Force integer conversion to prevent 'NoneType' or string indexing errors
-        rid = int(request_id) if request_id else 0  # Replaced None with 0 for clean validation
-        if not rid:
-            print("[SILVER] CRITICAL: No Request ID provided. Aborting.")
-            cursor_pg.close()
-            pg_conn.close()
-            return
-    except (TypeError, ValueError):
-        print(f"[SILVER] CRITICAL: Invalid Request ID format: {request_id}")
-        cursor_pg.close()
-        pg_conn.close()
-        return
-
-    # 2. FETCH UNPROCESSED DOCUMENTS - OPTIMIZED: Filter by request_id
-    query_filter = {
-        "silver_processed": {"$ne": True},
-        "global_keyword_id": rid  # Only process docs for THIS request
-    }
-    unprocessed_count = bronze_col.count_documents(query_filter)
-    logger.debug("Silver Query Filter: %s", query_filter)
-    logger.debug("Total Unprocessed in Bronze for Request %s: %s", rid, unprocessed_count)
-
-    # Use a small limit to prevent OOM (Out of Memory) crashes on 8GB RAM
-    raw_docs = list(bronze_col.find(query_filter).limit(batch_size))
-
-    if not raw_docs:
-        print("[SILVER] No new data to process.")
-        cursor_pg.close()
-        pg_conn.close()
-        return
-
     all_texts_to_score = []
     doc_mapping = []
+    noise_ids = []
 
     # 3. PREPARATION PHASE: EXTRACT AND CLEAN
     for raw_doc in raw_docs:
@@ -111,142 +153,160 @@ def run_silver(request_id, batch_size=50):
 
             # Filtering logic to save CPU time on noise
             if len(post_text.split()) < 5 and not eligible_comments:
-                bronze_col.update_one(
-                    {"_id": raw_doc["_id"]},
-                    {"$set": {"silver_processed": True, "skipped_reason": "noise"}}
-                )
+                noise_ids.append(raw_doc["_id"])
                 continue
 
+            post_id_val = post.get("name") or raw_doc.get("meta", {}).get("external_id")
+            if not post_id_val:
+                post_id_val = f"unknown_{raw_doc['_id']}"
+
+            comments = []
+            for i, c in enumerate(eligible_comments):
+                comments.append((
+                    c.get("id") or f"{post_id_val}_comment_{i}",
+                    clean_reddit_text(c.get("body", "")),
+                    hash_author(c.get("author")),
+                    c.get("score", 0),
+                    datetime.fromtimestamp(c.get("created_utc", 0), tz=timezone.utc),
+                ))
+
             all_texts_to_score.append(post_text)
-            all_texts_to_score.extend([clean_reddit_text(c.get("body", "")) for c in eligible_comments])
+            all_texts_to_score.extend(comment[1] for comment in comments)
 
             doc_mapping.append({
-                "raw_doc": raw_doc,
-                "post_text": post_text,
+                "bronze_id": raw_doc["_id"],
+                "keyword": raw_doc.get("keyword"),
+                "post_id": post_id_val,
                 "title_clean": title,
                 "body_clean": body,
-                "eligible_comments": eligible_comments,
-                "comment_count": len(eligible_comments),
-                "keyword": raw_doc.get("keyword")
+                "author_hash": hash_author(post.get("author")),
+                "subreddit": post.get("subreddit_name_prefixed"),
+                "url": post.get("url"),
+                "score": post.get("score", 0),
+                "upvote_ratio": post.get("upvote_ratio", 0),
+                "num_comments": post.get("num_comments", 0),
+                "created_at": datetime.fromtimestamp(post.get("created_utc", 0), tz=timezone.utc),
+                "comments": comments,  # (comment_id, body_clean, author_hash, score, created_at)
             })
         except Exception as e:
             continue
 
-    if not all_texts_to_score:
-        cursor_pg.close()
-        pg_conn.close()
-        return
+    return all_texts_to_score, doc_mapping, noise_ids
 
-    # 4. INFERENCE PHASE: BATCH SENTIMENT
-    try:
-        all_scores = run_sentiment_batch(all_texts_to_score)
-    except Exception as e:
-        print(f"[SILVER] Inference Crash: {e}")
-        cursor_pg.close()
-        pg_conn.close()
-        raise e
-
-    # 5. PERSISTENCE PHASE: TRANSACTIONAL WRITE
-    current_score_idx = 0
-    total_comments_inserted = 0
-    try:
-        for item in doc_mapping:
-            raw_doc = item["raw_doc"]
-            post_id_val = raw_doc.get("raw_post", {}).get("name") or raw_doc.get("meta", {}).get("external_id")
-            if not post_id_val:
-                post_id_val = f"unknown_{raw_doc['_id']}"
-            post = raw_doc.get("raw_post", {})
 
-            # Safety check to prevent Index errors
-            if current_score_idx >= len(all_scores):
-                break
+def _mark_noise(bronze_col, noise_ids):
+    """Mark documents skipped as noise processed, so they are not fetched again."""
+    if noise_ids:
+        bronze_col.update_many(
+            {"_id": {"$in": noise_ids}},
+            {"$set": {"silver_processed": True, "skipped_reason": "noise"}}
+        )
 
-            post_sentiment = all_scores[current_score_idx]
-            current_score_idx += 1
 
-            comment_sentiments = all_scores[current_score_idx: current_score_idx + item["comment_count"]]
-            current_score_idx += item["comment_count"]
+def _post_rows(doc_mapping, all_scores, rid):
+    """
+    Build the post rows of one scored batch.
 
-            agg_label, agg_score = aggregate_sentiment(comment_sentiments)
+    Returns
+    -------
+    tuple : (post_rows, scored_items)
+        Rows ordered as POST_COLUMNS, and (item, comment_sentiments)
+        per row for _child_rows().
+    """
+    current_score_idx = 0
+    model_name = scorer_name()
+    post_rows = []
+    scored_items = []
+    for item in doc_mapping:
+        # Safety check to prevent Index errors
+        if current_score_idx >= len(all_scores):
+            break
+
+        post_sentiment = all_scores[current_score_idx]
+        current_score_idx += 1
+
+        comment_count = len(item["comments"])
+        comment_sentiments = all_scores[current_score_idx: current_score_idx + comment_count]
+        current_score_idx += comment_count
+
+        # Post row (Strict 20 Parameter Tuple, ordered as POST_COLUMNS)
+        post_rows.append((
+            str(item["bronze_id"]), "reddit", item["keyword"], rid,
+            item["post_id"],
+            item["title_clean"], item["body_clean"], item["author_hash"],
+            item["subreddit"], item["url"], item["score"],
+            item["upvote_ratio"], item["num_comments"],
+            post_sentiment["label"], post_sentiment["score"],
+            item["created_at"],
+            datetime.now(timezone.utc),
+            *dim_keys(item["created_at"]),
+            model_name,
+            post_sentiment.get("duplicate_of"),
+        ))
+        scored_items.append((item, comment_sentiments))
+    return post_rows, scored_items
+
+
+def _child_rows(scored_items, silver_post_ids):
+    """
+    Build comment and summary rows once the posts have silver_post_ids.
 
-            # Insert Post (Strict 17 Parameter Tuple)
-            cursor_pg.execute(
-                """
-                INSERT INTO silver_reddit_posts (
-                    original_bronze_id, platform, keyword, global_keyword_id,
-                    post_id, title_clean, body_clean, author_hash,
-                    subreddit_name, post_url, post_score, upvote_ratio, 
-                    total_comments, post_sentiment_label, post_sentiment_score,
-                    created_at_utc, processed_at_utc
-                )
-                VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
-                ON CONFLICT (original_bronze_id) DO UPDATE
-                SET original_bronze_id = EXCLUDED.original_bronze_id
-                RETURNING silver_post_id
-                """,
-                (
-                    str(raw_doc["_id"]), "reddit", item["keyword"], rid,
-                    post_id_val,
-                    item["title_clean"], item["body_clean"], hash_author(post.get("author")),
-                    post.get("subreddit_name_prefixed"), post.get("url"), post.get("score", 0),
-                    post.get("upvote_ratio", 0), post.get("num_comments", 0),
-                    post_sentiment["label"], post_sentiment["score"],
-                    datetime.fromtimestamp(post.get("created_utc", 0), tz=timezone.utc),
-                    datetime.now(timezone.utc)
-                )
-            )
+    Returns
+    -------
+    tuple : (comment_rows, summary_rows, bronze_ids)
+        Rows ordered as COMMENT_COLUMNS / SUMMARY_COLUMNS, and the bronze
+        _ids whose post was written.
+    """
+    comment_rows = []
+    summary_rows = []
+    bronze_ids = []
+    for item, comment_sentiments in scored_items:
+        silver_post_id = silver_post_ids.get(str(item["bronze_id"]))
+        if silver_post_id is None:
+            continue
 
-            res = cursor_pg.fetchone()
-            if not res: continue
-            silver_post_id = res[0]
-
-            # ========== NEW: INSERT COMMENTS ==========
-            for i, comment in enumerate(item["eligible_comments"]):
-                if i >= len(comment_sentiments):
-                    break
-
-                comment_sentiment = comment_sentiments[i]
-                comment_id = comment.get("id") or f"{post_id_val}_comment_{i}"
-
-                cursor_pg.execute(
-                    """
-                    INSERT INTO silver_reddit_comments (
-                        silver_post_id, comment_id, comment_body_clean, author_hash,
-                        comment_score, comment_created_at_utc,
-                        comment_sentiment_label, comment_sentiment_score
-                    )
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT DO NOTHING
-                    """,
-                    (
-                        silver_post_id,
-                        comment_id,
-                        clean_reddit_text(comment.get("body", "")),
-                        hash_author(comment.get("author")),
-                        comment.get("score", 0),
-                        datetime.fromtimestamp(comment.get("created_utc", 0), tz=timezone.utc),
-                        comment_sentiment["label"],
-                        comment_sentiment["score"]
-                    )
-                )
-                total_comments_inserted += 1
+        for comment, comment_sentiment in zip(item["comments"], comment_sentiments):
+            comment_id, body_clean, author_hash, score, comment_created_at = comment
+            comment_rows.append((
+                silver_post_id,
+                comment_id,
+                body_clean,
+                author_hash,
+                score,
+                comment_created_at,
+                comment_sentiment["label"],
+                comment_sentiment["score"],
+                *dim_keys(comment_created_at),
+                comment_sentiment.get("duplicate_of"),
+            ))
+
+        agg_label, agg_score = aggregate_sentiment(comment_sentiments)
+        summary_rows.append((silver_post_id, agg_label, agg_score))
+
+        # Success: Track ID for MongoDB update later
+        bronze_ids.append(item["bronze_id"])
+    return comment_rows, summary_rows, bronze_ids
+
+
+def _persist_batch(doc_mapping, all_scores, rid, bronze_col, pg_conn, cursor_pg):
+    """
+    Persist one scored batch in a single Postgres transaction, then mark
+    the committed documents as silver_processed in MongoDB.
 
-            # ========== NEW: INSERT COMMENT SENTIMENT SUMMARY ==========
-            cursor_pg.execute(
-                """
-                INSERT INTO silver_reddit_comment_sentiment_summary (
-                    silver_post_id, aggregated_label, aggregated_score
-                )
-                VALUES (%s, %s, %s)
-                ON CONFLICT (silver_post_id) DO UPDATE SET
-                    aggregated_label = EXCLUDED.aggregated_label,
-                    aggregated_score = EXCLUDED.aggregated_score
-                """,
-                (silver_post_id, agg_label, agg_score)
-            )
+    Returns
+    -------
+    tuple : (posts_committed, comments_inserted)
+    """
+    # 5. PERSISTENCE PHASE: TRANSACTIONAL BULK WRITE
+    # Build every row first, then write each table with one bulk statement
+    post_rows, scored_items = _post_rows(doc_mapping, all_scores, rid)
 
-            # Success: Track ID for MongoDB update later
-            processed_mongo_ids.append(raw_doc["_id"])
+    total_comments_inserted = 0
+    try:
+        silver_post_ids = write_posts(cursor_pg, post_rows)
+        comment_rows, summary_rows, processed_mongo_ids = _child_rows(scored_items, silver_post_ids)
+        total_comments_inserted = write_comments(cursor_pg, comment_rows)
+        write_comment_summaries(cursor_pg, summary_rows)
 
         # 6. ATOMIC COMMIT
         pg_conn.commit()
@@ -264,6 +324,284 @@ def run_silver(request_id, batch_size=50):
         print(f"CRITICAL PERSISTENCE ERROR: {e}")
         raise e  # Re-raise for brandpulse_master
 
+    return len(processed_mongo_ids), total_comments_inserted
+
+
+# ---------------------------------------------------------------------------
+# STAGES
+# ---------------------------------------------------------------------------
+def _emit_batch(raw_docs, number, started, bronze_col, out_q, stage_times):
+    """Clean one fetched batch and queue it. Returns False if the pipeline stopped."""
+    fetched = time.perf_counter()
+    stage_times["fetch"] += fetched - started
+    texts, doc_mapping, noise_ids = _prepare_batch(raw_docs)
+    _mark_noise(bronze_col, noise_ids)
+    stage_times["prepare"] += time.perf_counter() - fetched
+    return out_q.put(_Batch(number, len(raw_docs), texts, doc_mapping, started))
+
+
+def _read_bronze(bronze_col, query_filter, batch_size, out_q, stage_times, batch_number=0):
+    """
+    Read matching bronze documents in _id order through one projected
+    cursor (the server returns ``batch_size`` documents per round trip)
+    and queue them in batches of ``batch_size``. Returns the last batch
+    number.
+    """
+    cursor = bronze_col.find(query_filter, BRONZE_PROJECTION).sort("_id", 1).batch_size(batch_size)
+    try:
+        raw_docs = []
+        started = time.perf_counter()
+        for raw_doc in cursor:
+            raw_docs.append(raw_doc)
+            if len(raw_docs) < batch_size:
+                continue
+            batch_number += 1
+            if not _emit_batch(raw_docs, batch_number, started, bronze_col, out_q, stage_times):
+                return batch_number
+            raw_docs = []
+            started = time.perf_counter()
+
+        if raw_docs and not out_q.stop.is_set():
+            batch_number += 1
+            _emit_batch(raw_docs, batch_number, started, bronze_col, out_q, stage_times)
+        else:
+            stage_times["fetch"] += time.perf_counter() - started
+    finally:
+        cursor.close()
+    return batch_number
+
+
+def _fetch_stage(bronze_col, query_filter, batch_size, out_q, stage_times):
+    """Producer thread: page bronze by _id, clean each batch, hand it on."""
+    try:
+        _read_bronze(bronze_col, query_filter, batch_size, out_q, stage_times)
+    finally:
+        out_q.close()
+
+
+def _stream_stage(bronze_col, query_filter, source, batch_size, out_q, stage_times):
+    """
+    Producer thread (streaming mode): pull each chunk of external IDs from
+    ``source`` as ingestion writes it, then sweep any other pending
+    documents of the request. Iterating ``source`` runs the ingestion
+    itself on this thread.
+    """
+    streamed_ids = []
+    batch_number = 0
+    try:
+        for external_ids in source:
+            if out_q.stop.is_set():
+                return
+            started = time.perf_counter()
+            chunk_filter = dict(query_filter, **{"meta.external_id": {"$in": list(external_ids)}})
+            raw_docs = list(bronze_col.find(chunk_filter, BRONZE_PROJECTION).sort("_id", 1))
+            for i in range(0, len(raw_docs), batch_size):
+                batch_docs = raw_docs[i:i + batch_size]
+                streamed_ids.extend(doc["_id"] for doc in batch_docs)
+                batch_number += 1
+                if not _emit_batch(batch_docs, batch_number, started, bronze_col, out_q, stage_times):
+                    return
+                started = time.perf_counter()
+
+        # Pending documents that did not come through the stream (e.g. left
+        # over from an earlier failed run of this request)
+        sweep_filter = dict(query_filter, _id={"$nin": streamed_ids})
+        _read_bronze(bronze_col, sweep_filter, batch_size, out_q, stage_times, batch_number)
     finally:
-        cursor_pg.close()
-        pg_conn.close()
+        out_q.close()
+
+
+def _write_stage(in_q, rid, bronze_col, totals, stage_times):
+    """Consumer thread: commit scored batches on its own Postgres connection."""
+    with pg_connection() as pg_conn, pg_conn.cursor() as cursor_pg:
+        while True:
+            batch = in_q.get()
+            if batch is END:
+                break
+
+            started = time.perf_counter()
+            posts = comments = 0
+            if batch.texts:
+                posts, comments = _persist_batch(
+                    batch.doc_mapping, batch.scores, rid, bronze_col, pg_conn, cursor_pg
+                )
+            stage_times["write"] += time.perf_counter() - started
+            _record_batch(batch, posts, comments, totals)
+
+
+def _record_batch(batch, posts, comments, totals):
+    """Add one committed batch to the totals and the active run's metrics."""
+    elapsed = max(time.perf_counter() - batch.started, 1e-9)
+    totals["batches"] += 1
+    totals["docs"] += batch.doc_count
+    totals["texts"] += len(batch.texts)
+    totals["posts"] += posts
+    totals["comments"] += comments
+    metrics.observe_batch("silver.docs", batch.doc_count)
+    metrics.observe_batch("silver.texts", len(batch.texts))
+    metrics.observe_batch("silver.batch_ms", round(elapsed * 1000, 1))
+    logger.info(
+        "Batch %d: %d docs, %d texts in %.2fs end-to-end (%.1f docs/s, %.1f texts/s)",
+        batch.number, batch.doc_count, len(batch.texts), elapsed,
+        batch.doc_count / elapsed, len(batch.texts) / elapsed,
+    )
+
+
+def run_silver(request_id, batch_size=SILVER_BATCH_SIZE, source=None):
+    """
+    Main Silver Layer process: Cleans data, runs RoBERTa sentiment,
+    and persists to PostgreSQL with Transactional Integrity.
+
+    Drains the request's bronze backlog in batches of at most
+    ``batch_size`` (default SILVER_BATCH_SIZE), read in ``_id`` order
+    through one projected cursor so every document is visited exactly
+    once. The stages run concurrently:
+
+        fetch + clean  (thread)  → [prepared queue] →
+        inference      (caller)  → [scored queue]   →
+        persistence    (thread, own connection, one transaction per batch)
+
+    so batch N+1 is fetched while batch N is scored and batch N-1 is
+    committed. Both queues hold at most SILVER_QUEUE_DEPTH batches,
+    which bounds memory to a handful of batches.
+
+    Parameters
+    ----------
+    source : iterable of list of str, optional
+        Streaming mode: chunks of bronze meta.external_id values, as
+        yielded by iter_ingest_keyword(). Each chunk is fetched and
+        cleaned as soon as it is yielded, so inference overlaps ingestion;
+        the request's remaining pending documents are swept afterwards.
+        By default the request's pending documents are paged from bronze.
+
+    Returns
+    -------
+    dict or None
+        Totals plus per-stage busy time and per-queue depth/stall
+        metrics, or None if the request ID is invalid.
+    """
+    bronze_col, _, _ = get_mongo_collections()
+
+    # 1. ROBUST REQUEST ID HANDLING
+    try:
+        # Force integer conversion to prevent 'NoneType' or string indexing errors
+        rid = int(request_id) if request_id else 0  # Replaced None with 0 for clean validation
+        if not rid:
+            print("[SILVER] CRITICAL: No Request ID provided. Aborting.")
+            return None
+    except (TypeError, ValueError):
+        print(f"[SILVER] CRITICAL: Invalid Request ID format: {request_id}")
+        return None
+
+    # 2. FETCH UNPROCESSED DOCUMENTS - OPTIMIZED: Filter by request_id
+    # Equality on silver_processed (not $ne: True), so the request_pending
+    # index in database/mongo_indexes.py serves count, find and sort
+    query_filter = pending_filter(rid)
+    unprocessed_count = bronze_col.count_documents(query_filter)
+    logger.debug("Silver Query Filter: %s", query_filter)
+    logger.debug("Total Unprocessed in Bronze for Request %s: %s", rid, unprocessed_count)
+
+    stop = threading.Event()
+    prepared_q = StageQueue("prepared", SILVER_QUEUE_DEPTH, stop)
+    scored_q = StageQueue("scored", SILVER_QUEUE_DEPTH, stop)
+    stage_times = {"fetch": 0.0, "prepare": 0.0, "infer": 0.0, "write": 0.0}
+    totals = {"batches": 0, "docs": 0, "texts": 0, "posts": 0, "comments": 0}
+
+    if source is None:
+        fetcher = StageThread(
+            "silver-fetch", _fetch_stage, stop,
+            bronze_col, query_filter, batch_size, prepared_q, stage_times,
+        )
+    else:
+        fetcher = StageThread(
+            "silver-fetch", _stream_stage, stop,
+            bronze_col, query_filter, source, batch_size, prepared_q, stage_times,
+        )
+    writer = StageThread(
+        "silver-write", _write_stage, stop,
+        scored_q, rid, bronze_col, totals, stage_times,
+    )
+    drain_started = time.perf_counter()
+    fetcher.start()
+    writer.start()
+
+    # 4. INFERENCE PHASE: model stays on the calling thread
+    inference_error = None
+    try:
+        while True:
+            batch = prepared_q.get()
+            if batch is END:
+                break
+            if batch.texts:
+                started = time.perf_counter()
+                try:
+                    batch.scores = run_sentiment_batch_deduped(batch.texts, batch.doc_mapping[0]["keyword"])
+                except Exception as e:
+                    print(f"[SILVER] Inference Crash: {e}")
+                    raise e
+                stage_times["infer"] += time.perf_counter() - started
+            if not scored_q.put(batch):
+                break
+    except Exception as e:
+        inference_error = e
+        stop.set()
+    finally:
+        scored_q.close()
+        fetcher.join()
+        writer.join()
+
+    # Surface the first failure, upstream stages first
+    for error in (fetcher.error, inference_error, writer.error):
+        if error is not None:
+            raise error
+
+    return _summarize(totals, stage_times, (prepared_q, scored_q), drain_started)
+
+
+def _summarize(totals, stage_times, queues, drain_started):
+    """Log a finished drain, report it into the active run and return its summary."""
+    if not totals["batches"]:
+        print("[SILVER] No new data to process.")
+
+    elapsed = max(time.perf_counter() - drain_started, 1e-9)
+    summary = {
+        **totals,
+        "elapsed_s": round(elapsed, 3),
+        "stages": {name: round(busy, 3) for name, busy in stage_times.items()},
+        "queues": {q.name: q.stats() for q in queues},
+    }
+    if totals["batches"]:
+        logger.info(
+            "Drained %d docs in %d batches: %d posts, %d comments committed (%.1f texts/s overall)",
+            totals["docs"], totals["batches"], totals["posts"], totals["comments"],
+            totals["texts"] / elapsed,
+        )
+        logger.info("Stage busy time (s): %s", summary["stages"])
+        logger.info("Queue metrics: %s", summary["queues"])
+    cache_stats = get_cache_stats()
+    if cache_stats:
+        logger.info("Sentiment cache: %s", cache_stats)
+    cascade_stats = get_cascade_stats()
+    if cascade_stats:
+        logger.info("Sentiment cascade: %s", cascade_stats)
+    near_duplicate_stats = get_near_duplicate_stats()
+    if near_duplicate_stats:
+        logger.info("Near-duplicates: %s", near_duplicate_stats)
+
+    # Report into the active pipeline run (no-op outside run_pipeline)
+    for name, busy in stage_times.items():
+        metrics.add_time(f"silver.{name}", busy)
+    metrics.count("silver.fetch", totals["docs"])
+    metrics.count("silver.prepare", totals["docs"])
+    metrics.count("silver.infer", totals["texts"])
+    metrics.count("silver.write", totals["posts"] + totals["comments"])
+    metrics.count("silver.posts", totals["posts"])
+    metrics.count("silver.comments", totals["comments"])
+    metrics.annotate("silver.queues", summary["queues"])
+    if cache_stats:
+        metrics.annotate("silver.sentiment_cache", cache_stats)
+    if cascade_stats:
+        metrics.annotate("silver.sentiment_cascade", cascade_stats)
+    if near_duplicate_stats:
+        metrics.annotate("silver.near_duplicates", near_duplicate_stats)
+    return summary
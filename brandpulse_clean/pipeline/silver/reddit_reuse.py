@@ -0,0 +1,175 @@
+"""
+BrandPulse Clean – Silver Reddit Reuse
+======================================
+Reuses silver Reddit results of earlier requests for the same keyword, so
+a new request only ingests and scores the dates nobody has analysed yet.
+
+Source: New. Used by run_pipeline() before Bronze when SILVER_REUSE is on.
+
+HOW IT WORKS:
+    Window   – the request's [start_date, end_date]. A missing start is the
+               Reddit search window (time_filter="month", the last
+               REDDIT_SEARCH_WINDOW_DAYS days); a missing end is today.
+    Coverage – every earlier request for the same keyword
+               (case-insensitive) whose pipeline run finished (a COMPLETED
+               pipeline_runs row with completed_at) and whose silver posts
+               were scored by the current scorer (cascade.scorer_name():
+               SENTIMENT_MODEL, plus the lexicon cascade when it is on)
+               covers its own window, cut off the day before it last ran
+               (later posts did not exist yet).
+    Copy     – silver posts of finished requests dated inside the window are
+               copied to the new request with their comments and comment
+               summaries (pipeline/silver/reddit_fanout.build_copy_sql),
+               newest scoring first when a post was analysed more than once.
+    Gaps     – the parts of the window no coverage touches. Bronze ingests
+               only posts created inside a gap; with no gaps Bronze is
+               skipped entirely.
+
+Posts written before silver_reddit_posts.model_name existed have no model
+and are never reused. Everything runs in one transaction.
+"""
+
+from datetime import date, datetime, timedelta, timezone
+
+from database.postgres import pg_connection
+from pipeline.silver.cascade import scorer_name
+from pipeline.silver.reddit_fanout import MARK_INGESTED_SQL, build_copy_sql
+
+# ingest_keyword() searches with time_filter="month"
+REDDIT_SEARCH_WINDOW_DAYS = 30
+
+REQUEST_SQL = """
+SELECT LOWER(TRIM(keyword)), start_date, end_date
+FROM global_keywords
+WHERE global_keyword_id = %s
+"""
+
+# A request only counts once its whole pipeline finished: global_keywords is
+# already COMPLETED when Bronze ends, while Silver and Gold are still running.
+FINISHED_RUN_SQL = """
+EXISTS (
+    SELECT 1 FROM pipeline_runs pr
+    WHERE pr.request_id = {request_id} AND pr.status = 'COMPLETED'
+    AND pr.completed_at IS NOT NULL
+)
+"""
+
+COVERAGE_SQL = f"""
+SELECT COALESCE(gk.start_date, COALESCE(gk.last_run_at, gk.created_at)::DATE - %(window_days)s),
+       LEAST(COALESCE(gk.end_date, COALESCE(gk.last_run_at, gk.created_at)::DATE),
+             COALESCE(gk.last_run_at, gk.created_at)::DATE - 1)
+FROM global_keywords gk
+WHERE LOWER(TRIM(gk.keyword)) = %(keyword)s
+AND gk.global_keyword_id <> %(target)s
+AND gk.status = 'COMPLETED'
+AND {FINISHED_RUN_SQL.format(request_id="gk.global_keyword_id")}
+AND EXISTS (
+    SELECT 1 FROM silver_reddit_posts sp
+    WHERE sp.global_keyword_id = gk.global_keyword_id AND sp.model_name = %(model)s
+)
+"""
+
+REUSE_RESULTS_SQL = build_copy_sql(f"""
+    SELECT DISTINCT ON (sp.post_id) sp.*
+    FROM silver_reddit_posts sp
+    WHERE LOWER(TRIM(sp.keyword)) = %(keyword)s
+    AND sp.platform = 'reddit'
+    AND sp.model_name = %(model)s
+    AND sp.global_keyword_id <> %(target)s
+    AND sp.date_id BETWEEN %(start_id)s AND %(end_id)s
+    AND {FINISHED_RUN_SQL.format(request_id="sp.global_keyword_id")}
+    AND NOT EXISTS (
+        SELECT 1 FROM silver_reddit_posts t
+        WHERE t.global_keyword_id = %(target)s AND t.post_id = sp.post_id
+    )
+    ORDER BY sp.post_id, sp.processed_at_utc DESC, sp.silver_post_id DESC
+""")
+
+
+def request_window(start_date, end_date, today=None):
+    """(first day, last day) a request asks for, filling in open ends."""
+    today = today or datetime.now(timezone.utc).date()
+    return start_date or today - timedelta(days=REDDIT_SEARCH_WINDOW_DAYS), end_date or today
+
+
+def uncovered_ranges(window, covered):
+    """
+    Subtract ``covered`` date ranges from ``window``.
+
+    Parameters
+    ----------
+    window : tuple of date
+        Inclusive (start, end).
+    covered : iterable of tuple of date
+        Inclusive (start, end) ranges, in any order, possibly overlapping.
+
+    Returns
+    -------
+    list of tuple of date
+        The inclusive ranges of ``window`` outside every covered range.
+    """
+    start, end = window
+    gaps = []
+    cursor = start
+    for cov_start, cov_end in sorted(c for c in covered if c[0] <= c[1]):
+        if cov_end < cursor:
+            continue
+        if cov_start > end:
+            break
+        if cov_start > cursor:
+            gaps.append((cursor, cov_start - timedelta(days=1)))
+        cursor = cov_end + timedelta(days=1)
+        if cursor > end:
+            break
+    if cursor <= end:
+        gaps.append((cursor, end))
+    return gaps
+
+
+def _date_id(day: date) -> int:
+    return day.year * 10000 + day.month * 100 + day.day
+
+
+def reuse_prior_results(request_id, model_name=None):
+    """
+    Copy earlier silver results for this request's keyword and dates.
+
+    Returns
+    -------
+    tuple : (posts_copied, comments_copied, gaps)
+        ``gaps`` lists the (start, end) dates still to ingest; an empty
+        list means the whole window was covered.
+    """
+    rid = int(request_id)
+    # Uncommitted work is rolled back when the connection is returned
+    with pg_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(REQUEST_SQL, (rid,))
+            row = cur.fetchone()
+            if row is None:
+                raise ValueError(f"Unknown request ID {rid}")
+            keyword, start_date, end_date = row
+            window = request_window(start_date, end_date)
+
+            params = {
+                "target": rid,
+                "keyword": keyword,
+                "model": model_name or scorer_name(),
+                "window_days": REDDIT_SEARCH_WINDOW_DAYS,
+                "start_id": _date_id(window[0]),
+                "end_id": _date_id(window[1]),
+            }
+            cur.execute(COVERAGE_SQL, params)
+            gaps = uncovered_ranges(window, cur.fetchall())
+
+            cur.execute(REUSE_RESULTS_SQL, params)
+            posts, comments, _ = cur.fetchone()
+            if not gaps:
+                cur.execute(MARK_INGESTED_SQL, params)
+        conn.commit()
+
+    print(
+        f"[SILVER] Reused {posts} posts and {comments} comments for '{keyword}' "
+        f"({window[0]} to {window[1]}); {len(gaps)} date range(s) left to ingest."
+    )
+    return posts, comments, gaps
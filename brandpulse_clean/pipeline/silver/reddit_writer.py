@@ -0,0 +1,167 @@
+"""
+BrandPulse Clean – Silver Reddit Bulk Writer
+============================================
+Set-based persistence for the Silver Reddit tables, used by the
+persistence phase of run_silver().
+
+Source: New. Replaces the per-row cursor.execute() INSERTs for posts,
+comments and comment summaries (hundreds of round trips per batch).
+
+WRITE PATH (all inside the caller's transaction — nothing commits here):
+    1. Posts     → one multi-row INSERT via execute_values(), RETURNING
+                   (original_bronze_id, silver_post_id) so the caller can
+                   map every bronze document to its silver_post_id.
+    2. Comments  → COPY into a session temp table, then one
+                   INSERT ... SELECT ... ON CONFLICT DO NOTHING.
+    3. Summaries → COPY into a session temp table, then one
+                   INSERT ... SELECT ... ON CONFLICT (silver_post_id) DO UPDATE.
+
+The temp tables are created once per session with ON COMMIT DELETE ROWS,
+and they are cleared before each use.
+Conflict handling is identical to the former row-by-row statements.
+"""
+
+import io
+from typing import Dict, List, Sequence
+
+from psycopg2.extras import execute_values
+
+from utils import metrics
+
+# ---------------------------------------------------------------------------
+# POSTS
+# ---------------------------------------------------------------------------
+POST_COLUMNS = (
+    "original_bronze_id", "platform", "keyword", "global_keyword_id",
+    "post_id", "title_clean", "body_clean", "author_hash",
+    "subreddit_name", "post_url", "post_score", "upvote_ratio",
+    "total_comments", "post_sentiment_label", "post_sentiment_score",
+    "created_at_utc", "processed_at_utc",
+    "date_id", "time_id", "model_name", "near_duplicate_of",
+)
+
+INSERT_POSTS_SQL = f"""
+INSERT INTO silver_reddit_posts ({", ".join(POST_COLUMNS)})
+VALUES %s
+ON CONFLICT (original_bronze_id) DO UPDATE
+SET original_bronze_id = EXCLUDED.original_bronze_id
+RETURNING original_bronze_id, silver_post_id
+"""
+
+# ---------------------------------------------------------------------------
+# COMMENTS
+# ---------------------------------------------------------------------------
+COMMENT_COLUMNS = (
+    "silver_post_id", "comment_id", "comment_body_clean", "author_hash",
+    "comment_score", "comment_created_at_utc",
+    "comment_sentiment_label", "comment_sentiment_score",
+    "comment_date_id", "comment_time_id", "near_duplicate_of",
+)
+
+# ---------------------------------------------------------------------------
+# COMMENT SENTIMENT SUMMARY
+# ---------------------------------------------------------------------------
+SUMMARY_COLUMNS = ("silver_post_id", "aggregated_label", "aggregated_score")
+
+# ---------------------------------------------------------------------------
+# STAGED INSERTS (shared with the asyncio writer in pipeline/aio/silver.py)
+# ---------------------------------------------------------------------------
+COMMENTS_STAGE = "silver_reddit_comments_stage"
+SUMMARY_STAGE = "silver_reddit_comment_summary_stage"
+
+STAGE_TABLE_SQL = """
+CREATE TEMP TABLE IF NOT EXISTS {stage_table}
+ON COMMIT DELETE ROWS
+AS SELECT {cols} FROM {source_table} WITH NO DATA
+"""
+
+INSERT_COMMENTS_FROM_STAGE_SQL = f"""
+INSERT INTO silver_reddit_comments ({", ".join(COMMENT_COLUMNS)})
+SELECT {", ".join(COMMENT_COLUMNS)} FROM {COMMENTS_STAGE}
+ON CONFLICT DO NOTHING
+"""
+
+UPSERT_SUMMARIES_FROM_STAGE_SQL = f"""
+INSERT INTO silver_reddit_comment_sentiment_summary ({", ".join(SUMMARY_COLUMNS)})
+SELECT {", ".join(SUMMARY_COLUMNS)} FROM {SUMMARY_STAGE}
+ON CONFLICT (silver_post_id) DO UPDATE SET
+    aggregated_label = EXCLUDED.aggregated_label,
+    aggregated_score = EXCLUDED.aggregated_score
+"""
+
+
+def _copy_value(value) -> str:
+    """Render one value in PostgreSQL COPY text format."""
+    if value is None:
+        return r"\N"
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def _copy_rows(cur, table: str, columns: Sequence[str], rows: List[tuple]):
+    """Stream ``rows`` into ``table`` with a single COPY FROM STDIN."""
+    buf = io.StringIO()
+    for row in rows:
+        buf.write("\t".join(_copy_value(v) for v in row))
+        buf.write("\n")
+    metrics.count("silver.write.bytes", buf.tell())
+    buf.seek(0)
+    cur.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN", buf)
+
+
+def _stage(cur, stage_table: str, source_table: str, columns: Sequence[str], rows: List[tuple]):
+    """
+    Load ``rows`` into a session temp table shaped like ``source_table``.
+    Column types are copied from the real table, so COPY parses values
+    exactly as a direct INSERT would.
+    """
+    cur.execute(STAGE_TABLE_SQL.format(
+        stage_table=stage_table, cols=", ".join(columns), source_table=source_table,
+    ))
+    cur.execute(f"TRUNCATE {stage_table}")
+    _copy_rows(cur, stage_table, columns, rows)
+
+
+def write_posts(cur, rows: List[tuple]) -> Dict[str, int]:
+    """
+    Insert post rows (ordered as POST_COLUMNS) in one statement.
+
+    Returns
+    -------
+    Dict[str, int]
+        original_bronze_id → silver_post_id for every row written.
+    """
+    if not rows:
+        return {}
+    returned = execute_values(cur, INSERT_POSTS_SQL, rows, page_size=len(rows), fetch=True)
+    return {bronze_id: silver_post_id for bronze_id, silver_post_id in returned}
+
+
+def write_comments(cur, rows: List[tuple]) -> int:
+    """
+    Bulk insert comment rows (ordered as COMMENT_COLUMNS).
+
+    Returns
+    -------
+    int
+        Number of comment rows actually inserted (conflicts are skipped).
+    """
+    if not rows:
+        return 0
+    _stage(cur, COMMENTS_STAGE, "silver_reddit_comments", COMMENT_COLUMNS, rows)
+    cur.execute(INSERT_COMMENTS_FROM_STAGE_SQL)
+    return cur.rowcount
+
+
+def write_comment_summaries(cur, rows: List[tuple]) -> int:
+    """Bulk upsert comment sentiment summary rows (ordered as SUMMARY_COLUMNS)."""
+    if not rows:
+        return 0
+    _stage(cur, SUMMARY_STAGE, "silver_reddit_comment_sentiment_summary", SUMMARY_COLUMNS, rows)
+    cur.execute(UPSERT_SUMMARIES_FROM_STAGE_SQL)
+    return cur.rowcount
@@ -21,14 +21,57 @@ ARCHITECTURAL FIX:
 MODEL_NAME is read from config/settings.py (which reads SENTIMENT_MODEL
 from the environment), defaulting to the value hardcoded in the
 original: "ibrahimtime/bertweet-sentiment-finetuned".
+
+LENGTH-BUCKETED BATCHING:
+    Silver hands over a mix of short comments (10-30 tokens) and long
+    post bodies (up to the 128-token cap). Passing them in their
+    original order pads every forward pass to its longest text.
+    run_sentiment_batch() instead sorts texts by token length, groups
+    them into buckets whose padded size fits SENTIMENT_TOKEN_BUDGET,
+    runs each bucket and writes results back in the original order.
+
+RESULT CACHE:
+    Before any text reaches the model, run_sentiment_batch() looks it up
+    in the on-disk SentimentCache (pipeline/silver/sentiment_cache.py),
+    keyed by (SENTIMENT_MODEL, normalized text hash). Only misses are
+    scored, each distinct text once, and their results are written back.
+    Counters are available through get_cache_stats().
+
+LEXICON CASCADE:
+    With SENTIMENT_CASCADE on, cache misses first go through the lexicon
+    cascade (pipeline/silver/cascade.py); only the texts it is not
+    confident about reach the model, and only model results are cached.
+
+BACKENDS:
+    SENTIMENT_BACKEND=torch (default) keeps the eager PyTorch pipeline.
+    SENTIMENT_BACKEND=onnx serves the same model through onnxruntime
+    (pipeline/silver/onnx_backend.py). Both return "LABEL_x" labels, so
+    LABEL_MAP applies unchanged.
 """
 
+import threading
 from typing import List
 
 from transformers import pipeline
 import torch
 
-from config.settings import SENTIMENT_MODEL
+from config.settings import (
+    SENTIMENT_CACHE_MAX_ENTRIES,
+    SENTIMENT_CACHE_PATH,
+    SENTIMENT_BACKEND,
+    SENTIMENT_MODEL,
+    SENTIMENT_TOKEN_BUDGET,
+)
+from pipeline.silver.cascade import cascade_score
+from pipeline.silver.sentiment_cache import SentimentCache, text_hash
+
+# Truncation length used by both the pipeline and the length estimate
+MAX_LENGTH = 128
+
+# One forward pass at a time: the queue worker runs several jobs in one
+# process and the HF pipeline / fast tokenizer are not safe to share
+# between concurrent callers.
+_inference_lock = threading.Lock()
 
 # ---------------------------------------------------------------------------
 # Label map — exactly as written in silver_layer.py line 46-50
@@ -45,32 +88,142 @@ LABEL_MAP = {
 _sentiment_pipeline = None
 
 
+def _build_torch_pipeline():
+    """Create the eager PyTorch HuggingFace pipeline for SENTIMENT_MODEL."""
+    return pipeline(
+        "sentiment-analysis",
+        model=SENTIMENT_MODEL,
+        tokenizer=SENTIMENT_MODEL,
+        truncation=True,
+        max_length=MAX_LENGTH,
+        device=0 if torch.cuda.is_available() else -1,
+    )
+
+
 def _get_sentiment_pipeline():
     """
-    Return the HuggingFace sentiment pipeline, loading the model on
-    first call and caching it for subsequent calls.
+    Return the sentiment classifier for the configured backend, loading
+    the model on first call and caching it for subsequent calls.
 
     Uses SENTIMENT_MODEL from config/settings.py, which defaults to
     "ibrahimtime/bertweet-sentiment-finetuned" but can be overridden
     via the SENTIMENT_MODEL environment variable.
+
+    SENTIMENT_BACKEND selects the runtime:
+        "torch" (default) – HuggingFace pipeline on eager PyTorch
+        "onnx"            – OnnxSentimentClassifier (onnxruntime, CPU)
+
+    Raises
+    ------
+    ValueError
+        If SENTIMENT_BACKEND is not a known backend.
     """
     global _sentiment_pipeline
     if _sentiment_pipeline is None:
-        _sentiment_pipeline = pipeline(
-            "sentiment-analysis",
-            model=SENTIMENT_MODEL,
-            tokenizer=SENTIMENT_MODEL,
-            truncation=True,
-            max_length=128,
-            device=0 if torch.cuda.is_available() else -1,
-        )
+        if SENTIMENT_BACKEND == "torch":
+            _sentiment_pipeline = _build_torch_pipeline()
+        elif SENTIMENT_BACKEND == "onnx":
+            from pipeline.silver.onnx_backend import OnnxSentimentClassifier
+            _sentiment_pipeline = OnnxSentimentClassifier(SENTIMENT_MODEL)
+        else:
+            raise ValueError(
+                f"Unknown SENTIMENT_BACKEND '{SENTIMENT_BACKEND}'. "
+                "Expected 'torch' or 'onnx'."
+            )
     return _sentiment_pipeline
 
 
+# ---------------------------------------------------------------------------
+# Lazy result cache — opened on first call to run_sentiment_batch()
+# ---------------------------------------------------------------------------
+_result_cache = None
+
+
+def _get_result_cache():
+    """Return the shared SentimentCache, or None if caching is disabled."""
+    global _result_cache
+    if _result_cache is None and SENTIMENT_CACHE_PATH:
+        _result_cache = SentimentCache(
+            SENTIMENT_CACHE_PATH,
+            model_name=SENTIMENT_MODEL,
+            max_entries=SENTIMENT_CACHE_MAX_ENTRIES,
+        )
+    return _result_cache
+
+
+def get_cache_stats() -> dict:
+    """Return hit/miss counters of the result cache ({} when disabled)."""
+    cache = _get_result_cache()
+    return cache.stats() if cache is not None else {}
+
+
+def _token_lengths(tokenizer, texts: List[str]) -> List[int]:
+    """Return the truncated token count (incl. special tokens) of each text."""
+    encoded = tokenizer(texts, truncation=True, max_length=MAX_LENGTH)
+    return [len(ids) for ids in encoded["input_ids"]]
+
+
+def _length_buckets(lengths: List[int], token_budget: int) -> List[List[int]]:
+    """
+    Group text indices into buckets of similar length.
+
+    Indices are sorted by token length and appended to the current bucket
+    until (bucket size x longest length in bucket) would exceed
+    ``token_budget``. A single text longer than the budget still gets a
+    bucket of its own.
+
+    Returns
+    -------
+    List[List[int]]
+        Buckets of indices into the original list, shortest texts first.
+    """
+    buckets = []
+    current = []
+    for idx in sorted(range(len(lengths)), key=lengths.__getitem__):
+        # Sorted ascending, so the newest index is always the longest
+        if current and lengths[idx] * (len(current) + 1) > token_budget:
+            buckets.append(current)
+            current = []
+        current.append(idx)
+    if current:
+        buckets.append(current)
+    return buckets
+
+
+def _score_texts(texts: List[str], sp=None) -> List[dict]:
+    """
+    Run the model over ``texts`` in length buckets, preserving order.
+
+    ``sp`` defaults to the configured backend; onnx_backend passes an
+    explicit classifier when comparing backends.
+    """
+    sp = sp or _get_sentiment_pipeline()
+
+    results = [None] * len(texts)
+    with _inference_lock:
+        lengths = _token_lengths(sp.tokenizer, texts)
+        for bucket in _length_buckets(lengths, SENTIMENT_TOKEN_BUDGET):
+            outputs = sp([texts[i] for i in bucket], batch_size=len(bucket))
+            for i, r in zip(bucket, outputs):
+                results[i] = r
+
+    return [
+        {
+            "label": LABEL_MAP.get(r["label"], "Neutral"),
+            "score": round(float(r["score"]), 4),
+        }
+        for r in results
+    ]
+
+
 def run_sentiment_batch(texts: List[str]) -> List[dict]:
     """
     Run batch sentiment inference on a list of text strings.
 
+    Cached results are served from the SentimentCache; the remaining
+    texts are scored in length-sorted buckets (see _length_buckets). The
+    results are returned in the same order as ``texts``.
+
     Parameters
     ----------
     texts : List[str]
@@ -89,14 +242,40 @@ def run_sentiment_batch(texts: List[str]) -> List[dict]:
         # [{"label": "Positive", "score": 0.9721},
         #  {"label": "Negative", "score": 0.8834}]
     """
+    return score_with_cache(texts, _score_texts)
+
+
+def score_with_cache(texts: List[str], score) -> List[dict]:
+    """
+    Serve ``texts`` from the result cache and score the misses with
+    ``score`` (a callable with the signature of _score_texts), each
+    distinct text once. With SENTIMENT_CASCADE, misses the lexicon is
+    confident about skip ``score`` (pipeline/silver/cascade.py).
+    Shared by run_sentiment_batch() and
+    pipeline/silver/inference_pool.run_sentiment_batch_pooled().
+    """
     if not texts:
         return []
-    sp = _get_sentiment_pipeline()
-    results = sp(texts)
-    return [
-        {
-            "label": LABEL_MAP.get(r["label"], "Neutral"),
-            "score": round(float(r["score"]), 4),
-        }
-        for r in results
-    ]
+
+    cache = _get_result_cache()
+    if cache is None:
+        return cascade_score(texts, score)[0]
+
+    results = cache.get_many(texts)
+
+    # Score each distinct missing text once, even if it repeats in the batch
+    pending = {}
+    for i, r in enumerate(results):
+        if r is None:
+            pending.setdefault(text_hash(texts[i]), []).append(i)
+
+    if pending:
+        to_score = [texts[indices[0]] for indices in pending.values()]
+        scored, model_texts, model_results = cascade_score(to_score, score)
+        for indices, r in zip(pending.values(), scored):
+            for i in indices:
+                results[i] = r
+        # Cascade results are not SENTIMENT_MODEL output: keep them out
+        cache.put_many(model_texts, model_results)
+
+    return results
@@ -0,0 +1,209 @@
+"""
+BrandPulse Clean – Sentiment Result Cache
+=========================================
+Persistent, content-addressed cache of sentiment results that sits in
+front of the transformer in run_sentiment_batch().
+
+Source: New. Reposts, copy-pasta and repeated keyword runs over
+overlapping date ranges used to send identical text through the model
+on every run_silver().
+
+DESIGN:
+    - Key:      (model name, SHA-256 of the normalized text)
+                Normalization is Unicode NFC + whitespace collapsing, so
+                texts that only differ in spacing share an entry.
+    - Value:    label and score exactly as returned by run_sentiment_batch().
+    - Backend:  a local SQLite file (stdlib, no extra dependency).
+    - Eviction: least-recently-used. Every hit refreshes last_used_at and
+                the oldest entries are deleted once max_entries is exceeded.
+                The entry count is tracked in memory, so a put never scans
+                the table; it is re-read with COUNT(*) only before evicting
+                and every _RECOUNT_PUTS puts, since other processes may
+                write the same file.
+
+Hit, miss and eviction counters are kept per process and exposed via
+stats().
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from typing import List, Optional
+
+from utils.text_processing.base import WHITESPACE_PATTERN
+
+# SQLite caps the number of host parameters per statement
+_SQL_CHUNK = 500
+
+# Re-read the entry count from the table this often (puts)
+_RECOUNT_PUTS = 1000
+
+
+def normalize_text(text: str) -> str:
+    """Canonical form used for hashing: NFC, single spaces, stripped."""
+    return WHITESPACE_PATTERN.sub(" ", unicodedata.normalize("NFC", text or "")).strip()
+
+
+def text_hash(text: str) -> str:
+    """Return the SHA-256 hex digest of the normalized text."""
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+
+
+class SentimentCache:
+    """
+    LRU-bounded, SQLite-backed cache of sentiment results.
+
+    Parameters
+    ----------
+    path : str
+        Location of the SQLite database file. Parent directories are
+        created if needed.
+    model_name : str
+        Model identifier that namespaces every entry, so switching
+        SENTIMENT_MODEL never serves another model's results.
+    max_entries : int
+        Upper bound on stored entries across all models.
+    """
+
+    def __init__(self, path: str, model_name: str, max_entries: int):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.model_name = model_name
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS sentiment_cache (
+                model_name   TEXT NOT NULL,
+                text_hash    TEXT NOT NULL,
+                label        TEXT NOT NULL,
+                score        REAL NOT NULL,
+                last_used_at REAL NOT NULL,
+                PRIMARY KEY (model_name, text_hash)
+            ) WITHOUT ROWID
+        """)
+        self._conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_sentiment_cache_last_used
+            ON sentiment_cache (last_used_at)
+        """)
+        self._conn.commit()
+        self._count = self._count_entries()
+        self._puts = 0
+
+    def get_many(self, texts: List[str]) -> List[Optional[dict]]:
+        """
+        Look up cached results for ``texts``.
+
+        Returns
+        -------
+        List[Optional[dict]]
+            One entry per input text: the cached {"label", "score"} dict,
+            or None on a miss.
+        """
+        hashes = [text_hash(t) for t in texts]
+        found = {}
+        now = time.time()
+
+        with self._lock:
+            unique = list(dict.fromkeys(hashes))
+            for start in range(0, len(unique), _SQL_CHUNK):
+                chunk = unique[start:start + _SQL_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT text_hash, label, score FROM sentiment_cache "
+                    f"WHERE model_name = ? AND text_hash IN ({placeholders})",
+                    [self.model_name, *chunk],
+                ).fetchall()
+                for h, label, score in rows:
+                    found[h] = {"label": label, "score": score}
+
+            if found:
+                # LRU touch
+                self._conn.executemany(
+                    "UPDATE sentiment_cache SET last_used_at = ? "
+                    "WHERE model_name = ? AND text_hash = ?",
+                    [(now, self.model_name, h) for h in found],
+                )
+                self._conn.commit()
+
+            results = [found.get(h) for h in hashes]
+            hit_count = sum(1 for r in results if r is not None)
+            self.hits += hit_count
+            self.misses += len(results) - hit_count
+
+        return results
+
+    def put_many(self, texts: List[str], results: List[dict]):
+        """Store freshly computed results and evict the oldest overflow."""
+        if not texts:
+            return
+        now = time.time()
+        rows = [
+            (self.model_name, text_hash(t), r["label"], r["score"], now)
+            for t, r in zip(texts, results)
+        ]
+
+        with self._lock:
+            # Insert new keys first so rowcount is the number of new entries
+            inserted = self._conn.executemany(
+                "INSERT OR IGNORE INTO sentiment_cache "
+                "(model_name, text_hash, label, score, last_used_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            ).rowcount
+            self._conn.executemany(
+                "UPDATE sentiment_cache SET label = ?, score = ?, last_used_at = ? "
+                "WHERE model_name = ? AND text_hash = ?",
+                [(label, score, used, model, h) for model, h, label, score, used in rows],
+            )
+            self._count += inserted
+            self._puts += 1
+            if self._puts % _RECOUNT_PUTS == 0:
+                self._count = self._count_entries()
+            self._evict()
+            self._conn.commit()
+
+    def _count_entries(self) -> int:
+        """Number of stored entries across all models (full scan)."""
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM sentiment_cache").fetchone()
+        return count
+
+    def _evict(self):
+        """Delete least-recently-used entries beyond max_entries (lock held)."""
+        if self._count <= self.max_entries:
+            return
+        # Other processes may have evicted too: confirm before deleting
+        self._count = self._count_entries()
+        overflow = self._count - self.max_entries
+        if overflow <= 0:
+            return
+        deleted = self._conn.execute("""
+            DELETE FROM sentiment_cache
+            WHERE (model_name, text_hash) IN (
+                SELECT model_name, text_hash FROM sentiment_cache
+                ORDER BY last_used_at ASC
+                LIMIT ?
+            )
+        """, (overflow,)).rowcount
+        self._count -= deleted
+        self.evictions += deleted
+
+    def stats(self) -> dict:
+        """Return hit/miss/eviction counters for this process."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
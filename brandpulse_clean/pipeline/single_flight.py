@@ -0,0 +1,190 @@
+"""
+BrandPulse Clean – Single-Flight Request Coalescing
+===================================================
+Runs identical concurrent requests once. When several users analyse the
+same keyword for the same platform and date range at the same time, the
+first request (the leader) runs Bronze → Silver as usual. The others
+(followers) wait for it, then copy its silver rows to their own request
+ID and run only Gold. The keyword is ingested once and the model scores
+its texts once.
+
+Source: New. Used by run_pipeline() when PIPELINE_SINGLE_FLIGHT is on.
+
+HOW IT WORKS:
+    Flight key – normalized keyword | platform | start_date | end_date,
+                 read from the request's global_keywords row.
+    Leader     – holds a session-level advisory lock on the key through
+                 Bronze and Silver (pipeline_flights records which request
+                 leads) and releases it before its own Gold stage.
+                 If the process dies, Postgres drops the lock with the
+                 session, so a crashed leader never blocks a flight.
+    Follower   – polls pg_try_advisory_lock every FLIGHT_POLL_SECONDS,
+                 refreshing its own global_keywords.last_run_at while it
+                 waits. Once it holds the lock, the leader is past Silver:
+                   COMPLETED → release the lock, copy the leader's results
+                   anything else (failed, crashed) → lead a fresh run
+                 A follower that waits longer than FLIGHT_WAIT_SECONDS
+                 stops waiting and runs on its own.
+
+Only requests that overlap in time are coalesced. A request arriving after
+the leader finished takes the lock at once and runs normally.
+"""
+
+import time
+
+from config.settings import FLIGHT_POLL_SECONDS, FLIGHT_WAIT_SECONDS
+from database.postgres import get_pg_connection
+from models.enums import PipelineStatus
+from utils.logging import get_logger
+
+logger = get_logger("FLIGHT")
+
+# First key of the two-key advisory lock form, so flight locks never
+# collide with other advisory lock users of the database.
+FLIGHT_LOCK_NAMESPACE = 0x4250
+
+FLIGHT_KEY_SQL = """
+SELECT LOWER(TRIM(keyword)), start_date, end_date
+FROM global_keywords
+WHERE global_keyword_id = %s
+"""
+
+TRY_LOCK_SQL = "SELECT pg_try_advisory_lock(%s, hashtext(%s))"
+
+CURRENT_LEADER_SQL = """
+SELECT leader_request_id
+FROM pipeline_flights
+WHERE flight_key = %s AND status = 'RUNNING'
+"""
+
+# The leader this request waited for: the flight's last run, if it ended
+# after this request started waiting
+FINISHED_LEADER_SQL = """
+SELECT leader_request_id, status
+FROM pipeline_flights
+WHERE flight_key = %s AND finished_at >= %s
+"""
+
+START_FLIGHT_SQL = """
+INSERT INTO pipeline_flights (flight_key, leader_request_id, status, started_at, finished_at)
+VALUES (%s, %s, 'RUNNING', NOW(), NULL)
+ON CONFLICT (flight_key) DO UPDATE
+SET leader_request_id = EXCLUDED.leader_request_id,
+    status = 'RUNNING',
+    started_at = NOW(),
+    finished_at = NULL
+"""
+
+FINISH_FLIGHT_SQL = """
+UPDATE pipeline_flights
+SET status = %s, finished_at = NOW()
+WHERE flight_key = %s AND leader_request_id = %s
+"""
+
+TOUCH_REQUEST_SQL = "UPDATE global_keywords SET last_run_at = NOW() WHERE global_keyword_id = %s"
+
+
+class Flight:
+    """
+    One request's membership in a single flight.
+
+    Usage:
+        flight = Flight(keyword, request_id, platform)
+        try:
+            leader_rid = flight.join()
+            if leader_rid is not None:
+                ...copy results of leader_rid...
+            else:
+                ...run the pipeline...
+            flight.finish(PipelineStatus.COMPLETED.value)
+        except Exception:
+            flight.finish(PipelineStatus.FAILED.value)
+            raise
+    """
+
+    def __init__(self, keyword, request_id, platform):
+        self.keyword = keyword
+        self.request_id = int(request_id)
+        self.platform = platform.strip().lower()
+        self.key = None
+        self._conn = None
+        self._leading = False
+
+    def _flight_key(self, cur):
+        cur.execute(FLIGHT_KEY_SQL, (self.request_id,))
+        row = cur.fetchone()
+        if row is None:
+            keyword, start_date, end_date = self.keyword.strip().lower(), None, None
+        else:
+            keyword, start_date, end_date = row
+        return f"{keyword}|{self.platform}|{start_date or ''}|{end_date or ''}"
+
+    def join(self):
+        """
+        Lead this flight, or wait for the request currently leading it.
+
+        Returns
+        -------
+        int or None
+            Request ID of a leader that completed while this request
+            waited (copy its results), or None if this request must run
+            the pipeline itself.
+        """
+        # Dedicated session: closing it must release the advisory lock
+        self._conn = get_pg_connection(autocommit=True, pooled=False)
+        cur = self._conn.cursor()
+        self.key = self._flight_key(cur)
+        cur.execute("SELECT clock_timestamp()")
+        joined_at = cur.fetchone()[0]
+
+        waited = announced = False
+        deadline = time.monotonic() + FLIGHT_WAIT_SECONDS
+        while True:
+            cur.execute(TRY_LOCK_SQL, (FLIGHT_LOCK_NAMESPACE, self.key))
+            if cur.fetchone()[0]:
+                break
+            waited = True
+
+            if not announced:
+                cur.execute(CURRENT_LEADER_SQL, (self.key,))
+                row = cur.fetchone()
+                if row is not None:
+                    announced = True
+                    logger.info("Request %s waiting for in-flight request %s (%s)", self.request_id, row[0], self.key)
+
+            if time.monotonic() >= deadline:
+                logger.warning("Request %s gave up waiting on %s; running on its own", self.request_id, self.key)
+                self.close()
+                return None
+
+            cur.execute(TOUCH_REQUEST_SQL, (self.request_id,))
+            time.sleep(FLIGHT_POLL_SECONDS)
+
+        if waited:
+            cur.execute(FINISHED_LEADER_SQL, (self.key, joined_at))
+            row = cur.fetchone()
+            if row is not None and row[1] == PipelineStatus.COMPLETED.value and row[0] != self.request_id:
+                self.close()
+                return row[0]
+            logger.info("No completed leader for %s; request %s leads a new run", self.key, self.request_id)
+
+        cur.execute(START_FLIGHT_SQL, (self.key, self.request_id))
+        self._leading = True
+        return None
+
+    def finish(self, status):
+        """Record the leader's outcome for its followers and release the flight."""
+        if self._leading and self._conn is not None:
+            try:
+                with self._conn.cursor() as cur:
+                    cur.execute(FINISH_FLIGHT_SQL, (status, self.key, self.request_id))
+            except Exception as e:
+                print(f"[ORCHESTRATOR ERROR]: Failed to record flight outcome for {self.key}: {e}")
+        self.close()
+
+    def close(self):
+        """End the lock session, which releases the advisory lock if held."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        self._leading = False
@@ -0,0 +1,181 @@
+"""
+BrandPulse Clean – Persistent Pipeline Worker
+=============================================
+Long-running process that keeps the expensive resources warm and
+executes pipeline jobs received over a local Unix socket.
+
+Source: New. Replaces the per-request `spawn(python main.py ...)` in
+routes/pipeline.js when PIPELINE_WORKER_SOCKET is configured.
+
+WHY:
+    Every spawned run paid for interpreter startup, the torch/transformers
+    import and the _get_sentiment_pipeline() model load before scoring a
+    single text. The worker pays those costs once in warm_up() and every
+    job afterwards only costs its own I/O and inference.
+
+PROTOCOL (one job per connection, newline-delimited JSON):
+    client → {"keyword": "tesla", "request_id": 42, "platform": "reddit"}
+    worker → {"status": "QUEUED", "position": 1}
+    worker → {"status": "COMPLETED"}            (or "FAILED" + "error")
+
+    The connection stays open until the job finishes so the caller can
+    treat the final status exactly like the exit code of a spawned run.
+
+Jobs are executed one at a time, in arrival order, by a single runner
+thread. run_pipeline() still writes PROCESSING/COMPLETED/FAILED into
+global_keywords, so status polling from the MERN backend is unchanged.
+"""
+
+import json
+import os
+import queue
+import socketserver
+import threading
+
+from config.settings import INFERENCE_WORKERS, MONGO_ENSURE_INDEXES, WORKER_SOCKET_PATH
+from database.mongo import _get_client
+from database.mongo_indexes import ensure_indexes
+from database.postgres import close_pool, pg_connection
+from models.enums import PipelineStatus
+from pipeline.orchestrator import run_pipeline
+from pipeline.silver.inference_pool import close_inference_pool, get_inference_pool
+from pipeline.silver.sentiment import _get_sentiment_pipeline
+from utils.logging import get_logger
+
+logger = get_logger("WORKER")
+
+# Jobs waiting for the runner thread
+_job_queue = queue.Queue()
+
+
+class _Job:
+    """A single pipeline request plus the event its client waits on."""
+
+    def __init__(self, keyword, request_id, platform="reddit"):
+        self.keyword = keyword
+        self.request_id = request_id
+        self.platform = platform
+        self.status = None
+        self.error = None
+        self.done = threading.Event()
+
+
+# ---------------------------------------------------------------------------
+# WARM-UP
+# ---------------------------------------------------------------------------
+def warm_up():
+    """
+    Load the sentiment model and open the database clients once, so the
+    first job does not pay the cold-start cost.
+    """
+    logger.info("Loading sentiment model...")
+    if INFERENCE_WORKERS:
+        # Loads the model, then forks the workers before any job thread starts
+        get_inference_pool()
+    else:
+        _get_sentiment_pipeline()
+
+    logger.info("Connecting to MongoDB...")
+    _get_client().admin.command("ping")
+    if MONGO_ENSURE_INDEXES:
+        logger.info("Ensuring MongoDB indexes...")
+        ensure_indexes()
+
+    logger.info("Checking PostgreSQL connectivity...")
+    with pg_connection() as conn, conn.cursor() as cur:
+        cur.execute("SELECT 1")
+
+    logger.info("Worker warm.")
+
+
+# ---------------------------------------------------------------------------
+# JOB RUNNER
+# ---------------------------------------------------------------------------
+def _run_jobs():
+    """Execute queued jobs sequentially for the lifetime of the worker."""
+    while True:
+        job = _job_queue.get()
+        try:
+            run_pipeline(job.keyword, job.request_id, job.platform)
+            job.status = PipelineStatus.COMPLETED.value
+        except Exception as e:
+            job.status = PipelineStatus.FAILED.value
+            job.error = str(e)
+        finally:
+            job.done.set()
+            _job_queue.task_done()
+
+
+# ---------------------------------------------------------------------------
+# SOCKET SERVER
+# ---------------------------------------------------------------------------
+class _JobHandler(socketserver.StreamRequestHandler):
+    """Accept one JSON job per connection and reply when it finishes."""
+
+    def _reply(self, payload):
+        self.wfile.write((json.dumps(payload) + "\n").encode())
+        self.wfile.flush()
+
+    def handle(self):
+        line = self.rfile.readline()
+        try:
+            payload = json.loads(line)
+            job = _Job(
+                payload["keyword"],
+                payload["request_id"],
+                payload.get("platform") or "reddit",
+            )
+        except (ValueError, KeyError, TypeError) as e:
+            self._reply({"status": PipelineStatus.FAILED.value, "error": f"Malformed job: {e}"})
+            return
+
+        _job_queue.put(job)
+        try:
+            self._reply({"status": "QUEUED", "position": _job_queue.qsize()})
+        except (BrokenPipeError, ConnectionResetError):
+            # The job still runs; the client just won't hear about it.
+            pass
+
+        job.done.wait()
+
+        reply = {"status": job.status}
+        if job.error:
+            reply["error"] = job.error
+        try:
+            self._reply(reply)
+        except (BrokenPipeError, ConnectionResetError):
+            logger.warning("Client for request %s disconnected before completion.", job.request_id)
+
+
+class _WorkerServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def serve(socket_path=WORKER_SOCKET_PATH):
+    """
+    Warm up and serve jobs on the given Unix socket until interrupted.
+
+    Parameters
+    ----------
+    socket_path : str
+        Filesystem path of the Unix socket (default: WORKER_SOCKET_PATH).
+    """
+    warm_up()
+
+    # A stale socket file from a crashed worker would make bind() fail
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+
+    threading.Thread(target=_run_jobs, name="pipeline-runner", daemon=True).start()
+
+    with _WorkerServer(socket_path, _JobHandler) as server:
+        logger.info("Listening on %s", socket_path)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            logger.info("Shutting down.")
+        finally:
+            if os.path.exists(socket_path):
+                os.unlink(socket_path)
+            close_pool()
+            close_inference_pool()
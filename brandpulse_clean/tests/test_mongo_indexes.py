@@ -0,0 +1,91 @@
+"""
+Explain-plan checks of database/mongo_indexes.py against canned explain()
+documents; no MongoDB server is needed.
+
+    python -m pytest tests
+"""
+
+import pytest
+
+pytest.importorskip("pymongo")
+
+from database.mongo_indexes import _stages, check_plan, pending_filter  # noqa: E402
+
+
+def _explain(winning_plan):
+    return {"queryPlanner": {"winningPlan": winning_plan}}
+
+
+CLASSIC_INDEXED = _explain({
+    "stage": "LIMIT",
+    "inputStage": {
+        "stage": "FETCH",
+        "inputStage": {"stage": "IXSCAN", "indexName": "request_pending"},
+    },
+})
+
+CLASSIC_COLLSCAN = _explain({
+    "stage": "SORT",
+    "inputStage": {"stage": "COLLSCAN", "direction": "forward"},
+})
+
+IN_MEMORY_SORT = _explain({
+    "stage": "SORT",
+    "sortPattern": {"started_at": -1},
+    "inputStage": {
+        "stage": "FETCH",
+        "inputStage": {"stage": "IXSCAN", "indexName": "keyword_only"},
+    },
+})
+
+# MongoDB 7+ (slot-based engine): the stage tree sits under queryPlan
+SBE_INDEXED = _explain({
+    "queryPlan": {
+        "stage": "FETCH",
+        "inputStage": {"stage": "IXSCAN", "indexName": "request_started"},
+    },
+    "slotBasedPlan": {"slots": "...", "stages": "..."},
+})
+
+
+def test_classic_ixscan_fetch_is_ok():
+    stages, ok = check_plan(CLASSIC_INDEXED)
+    assert stages == ["LIMIT", "FETCH", "IXSCAN"]
+    assert ok
+
+
+def test_collscan_fails():
+    stages, ok = check_plan(CLASSIC_COLLSCAN)
+    assert "COLLSCAN" in stages
+    assert not ok
+
+
+def test_in_memory_sort_fails_even_with_ixscan():
+    stages, ok = check_plan(IN_MEMORY_SORT)
+    assert stages == ["SORT", "FETCH", "IXSCAN"]
+    assert not ok
+
+
+def test_sbe_query_plan_is_walked():
+    stages, ok = check_plan(SBE_INDEXED)
+    assert stages == ["FETCH", "IXSCAN"]
+    assert ok
+
+
+def test_stages_walks_every_input_stage():
+    plan = {
+        "stage": "OR",
+        "inputStages": [
+            {"stage": "IXSCAN"},
+            {"stage": "FETCH", "inputStage": {"stage": "COLLSCAN"}},
+        ],
+    }
+    assert _stages(plan) == ["OR", "IXSCAN", "FETCH", "COLLSCAN"]
+
+
+def test_missing_plan_is_not_ok():
+    assert check_plan({}) == ([], False)
+
+
+def test_pending_filter_uses_equality_on_indexed_fields():
+    assert pending_filter("42") == {"global_keyword_id": 42, "silver_processed": False}
@@ -0,0 +1,59 @@
+"""
+BrandPulse Clean – Dimension Keys
+=================================
+Computes the dim_date / dim_time surrogate keys of a timestamp, so silver
+rows carry them from the moment they are written.
+
+Source: New. Gold used to derive the keys per row at load time with
+    dim_date.calendar_date = DATE(created_at_utc)
+    dim_time.time_id      = EXTRACT(HOUR) * 100 + EXTRACT(MINUTE)
+which no plain index can serve. Storing the integers lets gold join
+dim_date / dim_time on their primary keys and lets date-range filters
+use integer range predicates.
+
+Key formats (match the live dimension tables):
+    date_id – YYYYMMDD, e.g. 20260105
+    time_id – HHMM,     e.g. 1259 for 12:59
+
+Keys are computed in UTC. Naive datetimes are taken to be UTC already.
+"""
+
+from datetime import date, datetime, timezone
+from typing import Optional, Tuple
+
+
+def _as_utc(dt: datetime) -> datetime:
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+def to_date_id(value) -> Optional[int]:
+    """Return the YYYYMMDD key of a datetime or date (None for None)."""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        value = _as_utc(value).date()
+    elif not isinstance(value, date):
+        raise TypeError(f"Expected date or datetime, got {type(value).__name__}")
+    return value.year * 10000 + value.month * 100 + value.day
+
+
+def to_time_id(value: Optional[datetime]) -> Optional[int]:
+    """Return the HHMM key of a datetime (None for None)."""
+    if value is None:
+        return None
+    value = _as_utc(value)
+    return value.hour * 100 + value.minute
+
+
+def dim_keys(value: Optional[datetime]) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Return ``(date_id, time_id)`` for a timestamp.
+
+    Example
+    -------
+        dim_keys(datetime(2026, 1, 5, 12, 59, tzinfo=timezone.utc))
+        # (20260105, 1259)
+    """
+    return to_date_id(value), to_time_id(value)
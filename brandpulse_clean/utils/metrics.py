@@ -0,0 +1,199 @@
+"""
+BrandPulse Clean – Run Metrics
+==============================
+Lightweight timers and counters for one pipeline run, so a slow request
+can be attributed to Reddit latency, model inference or Postgres.
+
+Source: New. Used by run_pipeline(), which writes the summary() of every
+run into pipeline_runs.metrics.
+
+NAMING:
+    Timers and counters share dotted names, layer first:
+        bronze, bronze.search, bronze.comments, bronze.write
+        silver, silver.fetch, silver.prepare, silver.infer, silver.write,
+        silver.reuse
+        stream (Bronze and Silver overlapped, PIPELINE_STREAMING)
+        gold,   gold.posts, gold.comments
+    A counter with the same name as a timer is reported as that stage's
+    item count (and items/sec); "<name>.bytes" as its byte count.
+    Batch observations are sizes (silver.docs, silver.texts) or, with an
+    "_ms" suffix, per-batch latencies (silver.batch_ms).
+
+The active RunMetrics lives in a ContextVar. Module-level helpers
+(timed, count, add_time, observe_batch, annotate) are no-ops when no
+run is active, so instrumented code also works outside run_pipeline().
+Threads do not inherit context variables; StageThread copies the
+caller's context so stage threads record into the same run.
+
+Usage:
+    from utils import metrics
+    with metrics.timed("silver.infer"):
+        scores = run_sentiment_batch(texts)
+    metrics.count("silver.infer", len(texts))
+"""
+
+import math
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+_current_run: ContextVar[Optional["RunMetrics"]] = ContextVar("brandpulse_run_metrics", default=None)
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of ``values`` (None if empty)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class RunMetrics:
+    """Thread-safe accumulator of stage timings, counters and batch sizes."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self._lock = threading.Lock()
+        self.timers = {}    # name -> {"seconds": float, "calls": int}
+        self.counters = {}  # name -> int
+        self.batches = {}   # name -> list of batch sizes
+        self.details = {}   # name -> any JSON-serializable value
+
+    def add_time(self, name: str, seconds: float):
+        with self._lock:
+            timer = self.timers.setdefault(name, {"seconds": 0.0, "calls": 0})
+            timer["seconds"] += seconds
+            timer["calls"] += 1
+
+    @contextmanager
+    def timer(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - started)
+
+    def count(self, name: str, n: int = 1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def observe_batch(self, name: str, size: int):
+        with self._lock:
+            self.batches.setdefault(name, []).append(size)
+
+    def annotate(self, name: str, value):
+        with self._lock:
+            self.details[name] = value
+
+    def summary(self) -> dict:
+        """
+        Return a JSON-serializable summary of the run.
+
+        Returns
+        -------
+        dict
+            total_s, per-stage seconds/calls/items/items_per_s/bytes,
+            remaining counters, per-name batch statistics
+            (count/min/max/avg/p50/p95) and annotated details.
+        """
+        with self._lock:
+            stages = {}
+            for name, timer in sorted(self.timers.items()):
+                stage = {"seconds": round(timer["seconds"], 3), "calls": timer["calls"]}
+                if name in self.counters:
+                    items = self.counters[name]
+                    stage["items"] = items
+                    stage["items_per_s"] = round(items / timer["seconds"], 2) if timer["seconds"] else None
+                if f"{name}.bytes" in self.counters:
+                    stage["bytes"] = self.counters[f"{name}.bytes"]
+                stages[name] = stage
+
+            reported = set(stages) | {f"{name}.bytes" for name in stages}
+            counters = {k: v for k, v in sorted(self.counters.items()) if k not in reported}
+
+            batches = {
+                name: {
+                    "count": len(sizes),
+                    "min": min(sizes),
+                    "max": max(sizes),
+                    "avg": round(sum(sizes) / len(sizes), 2),
+                    "p50": percentile(sizes, 50),
+                    "p95": percentile(sizes, 95),
+                }
+                for name, sizes in sorted(self.batches.items())
+            }
+
+            return {
+                "total_s": round(time.perf_counter() - self.started, 3),
+                "stages": stages,
+                "counters": counters,
+                "batches": batches,
+                "details": dict(self.details),
+            }
+
+
+# ---------------------------------------------------------------------------
+# ACTIVE RUN
+# ---------------------------------------------------------------------------
+def start_run():
+    """
+    Activate a fresh RunMetrics for the current context.
+
+    Returns
+    -------
+    tuple : (RunMetrics, token)
+        Pass the token to end_run() when the run finishes.
+    """
+    run = RunMetrics()
+    return run, _current_run.set(run)
+
+
+def end_run(token):
+    """Deactivate the run started with ``token``."""
+    _current_run.reset(token)
+
+
+def current_run() -> Optional[RunMetrics]:
+    """Return the active RunMetrics, or None outside a run."""
+    return _current_run.get()
+
+
+# ---------------------------------------------------------------------------
+# NO-OP-SAFE HELPERS
+# ---------------------------------------------------------------------------
+@contextmanager
+def timed(name: str):
+    """Time the enclosed block under ``name`` if a run is active."""
+    run = _current_run.get()
+    if run is None:
+        yield
+        return
+    with run.timer(name):
+        yield
+
+
+def add_time(name: str, seconds: float):
+    run = _current_run.get()
+    if run is not None:
+        run.add_time(name, seconds)
+
+
+def count(name: str, n: int = 1):
+    run = _current_run.get()
+    if run is not None:
+        run.count(name, n)
+
+
+def observe_batch(name: str, size: int):
+    run = _current_run.get()
+    if run is not None:
+        run.observe_batch(name, size)
+
+
+def annotate(name: str, value):
+    run = _current_run.get()
+    if run is not None:
+        run.annotate(name, value)
@@ -0,0 +1,72 @@
+"""
+BrandPulse Clean – Shared Rate Limiter
+======================================
+Thread-safe token bucket for sharing one API request budget across
+concurrent workers.
+
+Source: New. Used by bronze Reddit ingestion, where comment trees are
+fetched from a thread pool and each thread has its own PRAW client.
+PRAW's built-in limiter only tracks its own client, so it cannot keep the
+combined request rate of several clients inside Reddit's quota.
+
+Usage:
+    from utils.rate_limit import RateLimiter
+    limiter = RateLimiter(requests_per_minute=60)
+    limiter.acquire()   # blocks until a request slot is available
+
+    # asyncio callers must not block the event loop:
+    await asyncio.sleep(limiter.reserve())
+"""
+
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Token bucket refilled continuously at ``requests_per_minute``.
+
+    Parameters
+    ----------
+    requests_per_minute : float
+        Sustained request rate shared by every caller.
+    burst : int, optional
+        Bucket capacity, i.e. how many requests may start back to back
+        after an idle period (default: 5).
+    """
+
+    def __init__(self, requests_per_minute: float, burst: int = 5):
+        self.rate = requests_per_minute / 60.0
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.waited_s = 0.0
+
+    def acquire(self):
+        """Block until one request may be made, then consume its token."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+                self.waited_s += wait
+            time.sleep(wait)
+
+    def reserve(self) -> float:
+        """
+        Consume one token now and return how many seconds to wait before
+        using it. Never blocks, so asyncio code can await the delay.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = max(0.0, -self._tokens / self.rate)
+            self.waited_s += wait
+            return wait
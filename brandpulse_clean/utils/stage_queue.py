@@ -0,0 +1,162 @@
+"""
+BrandPulse Clean – Stage Hand-off Queues
+========================================
+Bounded queues and threads for running pipeline stages concurrently
+(producer → consumer), with the metrics needed to see which stage is
+the bottleneck.
+
+Source: New. Used by run_silver() to overlap Mongo fetch/cleaning,
+model inference and Postgres writes.
+
+Metrics per StageQueue:
+    put_stall_s  – time producers spent blocked because the queue was
+                   full (the downstream stage is the bottleneck)
+    get_stall_s  – time consumers spent blocked because the queue was
+                   empty (the upstream stage is the bottleneck)
+    max_depth / avg_depth – queue occupancy sampled at every put
+
+All queues in one pipeline share a stop Event. When any stage fails,
+the event is set, every blocked put()/get() returns promptly and the
+error is re-raised by the coordinating thread.
+
+StageThread runs its target in a copy of the creating thread's context,
+so context variables (e.g. the active utils.metrics run) carry over.
+
+AsyncStageQueue is the asyncio counterpart (pipeline/aio/silver.py), with
+the same metrics. asyncio stages stop by task cancellation, so it needs
+no stop event.
+"""
+
+import asyncio
+import contextvars
+import queue
+import threading
+import time
+
+# Marks the end of a stream; never yielded to callers of get()
+END = object()
+
+# How often blocked put()/get() calls re-check the stop event
+_POLL_SECONDS = 0.1
+
+
+class StageQueue:
+    """Bounded queue between two stages that records depth and stall time."""
+
+    def __init__(self, name: str, maxsize: int, stop: threading.Event):
+        self.name = name
+        self.stop = stop
+        self._queue = queue.Queue(maxsize=maxsize)
+        self.items = 0
+        self.put_stall_s = 0.0
+        self.get_stall_s = 0.0
+        self.max_depth = 0
+        self._depth_total = 0
+
+    def put(self, item) -> bool:
+        """Block until ``item`` is queued. Returns False if the pipeline stopped."""
+        started = time.perf_counter()
+        try:
+            while not self.stop.is_set():
+                try:
+                    self._queue.put(item, timeout=_POLL_SECONDS)
+                except queue.Full:
+                    continue
+                depth = self._queue.qsize()
+                self.max_depth = max(self.max_depth, depth)
+                self._depth_total += depth
+                if item is not END:
+                    self.items += 1
+                return True
+            return False
+        finally:
+            self.put_stall_s += time.perf_counter() - started
+
+    def get(self):
+        """Block for the next item. Returns END when the stream ends or stops."""
+        started = time.perf_counter()
+        try:
+            while not self.stop.is_set():
+                try:
+                    return self._queue.get(timeout=_POLL_SECONDS)
+                except queue.Empty:
+                    continue
+            return END
+        finally:
+            self.get_stall_s += time.perf_counter() - started
+
+    def close(self):
+        """Signal end-of-stream to the consumer."""
+        self.put(END)
+
+    def stats(self) -> dict:
+        puts = self.items + 1  # the END marker is sampled too
+        return {
+            "items": self.items,
+            "max_depth": self.max_depth,
+            "avg_depth": round(self._depth_total / puts, 2),
+            "put_stall_s": round(self.put_stall_s, 3),
+            "get_stall_s": round(self.get_stall_s, 3),
+        }
+
+
+class StageThread(threading.Thread):
+    """
+    Daemon thread for one pipeline stage. An exception in ``target``
+    is stored on ``error`` and sets the shared stop event.
+    """
+
+    def __init__(self, name: str, target, stop: threading.Event, *args):
+        super().__init__(name=name, daemon=True)
+        self._target_fn = target
+        self._args = args
+        self.stop = stop
+        self.error = None
+        self._context = contextvars.copy_context()
+
+    def run(self):
+        try:
+            self._context.run(self._target_fn, *self._args)
+        except Exception as e:
+            self.error = e
+            self.stop.set()
+
+
+class AsyncStageQueue:
+    """Bounded asyncio queue between two stage tasks; same metrics as StageQueue."""
+
+    def __init__(self, name: str, maxsize: int):
+        self.name = name
+        self._queue = asyncio.Queue(maxsize=maxsize)
+        self.items = 0
+        self.put_stall_s = 0.0
+        self.get_stall_s = 0.0
+        self.max_depth = 0
+        self._depth_total = 0
+
+    async def put(self, item):
+        """Wait until ``item`` is queued."""
+        started = time.perf_counter()
+        try:
+            await self._queue.put(item)
+        finally:
+            self.put_stall_s += time.perf_counter() - started
+        depth = self._queue.qsize()
+        self.max_depth = max(self.max_depth, depth)
+        self._depth_total += depth
+        if item is not END:
+            self.items += 1
+
+    async def get(self):
+        """Wait for the next item (END when the stream ends)."""
+        started = time.perf_counter()
+        try:
+            return await self._queue.get()
+        finally:
+            self.get_stall_s += time.perf_counter() - started
+
+    async def close(self):
+        """Signal end-of-stream to the consumer."""
+        await self.put(END)
+
+    stats = StageQueue.stats
@@ -0,0 +1,158 @@
+"""
+BrandPulse Clean – MinHash / LSH
+================================
+MinHash signatures and a banded LSH index for near-duplicate text
+detection (cross-posts, bot replies, quoted comments).
+
+Like the rest of utils/text_processing, these are pure data
+transformations with ZERO database side effects; persistence lives in
+pipeline/silver/near_duplicates.py.
+
+Source: New.
+
+HOW IT WORKS:
+    Shingles  – overlapping SHINGLE_SIZE-character windows of the text,
+                lowercased, with punctuation dropped and whitespace
+                collapsed.
+    Signature – for each of ``num_perm`` hash functions
+                h(x) = (a * x + b) mod PRIME, the minimum over the text's
+                shingle hashes. Two signatures agree at a position with
+                probability equal to the texts' Jaccard similarity.
+    Banding   – a signature is cut into ``bands`` bands of
+                num_perm / bands rows. Texts that agree on every row of at
+                least one band become candidates; a candidate only counts
+                as a near-duplicate when the signature similarity reaches
+                the threshold.
+"""
+
+import hashlib
+import re
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from utils.text_processing.base import WHITESPACE_PATTERN
+
+# Characters per shingle
+SHINGLE_SIZE = 5
+
+# Smallest prime above 2**32; with a, x < 2**32, a * x + b fits in uint64
+_PRIME = np.uint64((1 << 32) + 15)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+_NON_WORD_PATTERN = re.compile(r"[^\w\s]")
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> set:
+    """Return the set of ``size``-character shingles of the normalized text."""
+    normalized = WHITESPACE_PATTERN.sub(" ", _NON_WORD_PATTERN.sub(" ", text.lower())).strip()
+    if len(normalized) <= size:
+        return {normalized} if normalized else set()
+    return {normalized[i:i + size] for i in range(len(normalized) - size + 1)}
+
+
+def _shingle_hashes(items) -> np.ndarray:
+    """32-bit hash of every shingle."""
+    return np.fromiter(
+        (int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=4).digest(), "little") for s in items),
+        dtype=np.uint64,
+    )
+
+
+class MinHasher:
+    """
+    Computes fixed-length MinHash signatures.
+
+    Parameters
+    ----------
+    num_perm : int
+        Number of hash functions (signature length).
+    seed : int
+        Seed of the hash coefficients. Signatures are only comparable
+        between hashers with the same ``num_perm`` and ``seed``.
+    """
+
+    def __init__(self, num_perm: int = 128, seed: int = 1):
+        rng = np.random.RandomState(seed)
+        self.num_perm = num_perm
+        self._a = rng.randint(1, 1 << 32, size=num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, 1 << 32, size=num_perm, dtype=np.uint64)
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """Return the uint32 signature of ``text``, or None if it has no shingles."""
+        items = shingles(text)
+        if not items:
+            return None
+        hashes = _shingle_hashes(items)
+        permuted = (np.outer(self._a, hashes) + self._b[:, None]) % _PRIME
+        return (permuted.min(axis=1) & _MAX_HASH).astype(np.uint32)
+
+
+def similarity(sig_a: np.ndarray, sig_b: np.ndarray) -> float:
+    """Estimated Jaccard similarity: the share of equal signature positions."""
+    return float(np.mean(sig_a == sig_b))
+
+
+class LSHIndex:
+    """
+    In-memory banded LSH index of MinHash signatures.
+
+    Parameters
+    ----------
+    num_perm : int
+        Signature length.
+    bands : int
+        Number of bands; must divide ``num_perm``.
+
+    Raises
+    ------
+    ValueError
+        If ``bands`` does not divide ``num_perm``.
+    """
+
+    def __init__(self, num_perm: int, bands: int):
+        if bands <= 0 or num_perm % bands:
+            raise ValueError(f"bands ({bands}) must divide num_perm ({num_perm})")
+        self.bands = bands
+        self.rows = num_perm // bands
+        self._buckets: Dict[str, List[str]] = {}
+        self._signatures: Dict[str, np.ndarray] = {}
+
+    def band_keys(self, signature: np.ndarray) -> List[str]:
+        """One "<band>:<hash>" key per band, stable across processes."""
+        return [
+            f"{band}:" + hashlib.blake2b(
+                signature[band * self.rows:(band + 1) * self.rows].tobytes(), digest_size=8,
+            ).hexdigest()
+            for band in range(self.bands)
+        ]
+
+    def add(self, key: str, signature: np.ndarray, band_keys: Optional[List[str]] = None):
+        """Index ``signature`` under ``key`` (a no-op if ``key`` is already indexed)."""
+        if key in self._signatures:
+            return
+        self._signatures[key] = signature
+        for band_key in band_keys or self.band_keys(signature):
+            self._buckets.setdefault(band_key, []).append(key)
+
+    def query(
+        self, signature: np.ndarray, threshold: float, band_keys: Optional[List[str]] = None,
+    ) -> Optional[Tuple[str, float]]:
+        """
+        Return (key, similarity) of the most similar indexed signature at
+        or above ``threshold``, or None.
+        """
+        candidates = {
+            key
+            for band_key in band_keys or self.band_keys(signature)
+            for key in self._buckets.get(band_key, ())
+        }
+        best = None
+        for key in candidates:
+            score = similarity(signature, self._signatures[key])
+            if score >= threshold and (best is None or score > best[1]):
+                best = (key, score)
+        return best
+
+    def __len__(self):
+        return len(self._signatures)
@@ -4,7 +4,7 @@ import pool, { getDBstatus } from './db.js';
 
 // Route Imports
 import authRouter from './routes/auth.js';
-import pipelineRouter from './routes/pipeline.js'; // The Python Trigger logic
+import pipelineRouter, { saveQueuedJobHistory } from './routes/pipeline.js'; // The Python Trigger logic
 import dataRouter from './routes/data.js';         // The Gold Layer Data logic
 
 const app = express();
@@ -35,7 +35,14 @@ setInterval(async () => {
             SET status = 'FAILED' 
             WHERE status = 'PROCESSING' 
             AND last_run_at < NOW() - INTERVAL '10 minutes'
-        `;
+        ` + (process.env.PIPELINE_DISPATCH === 'queue'
+            // Queued jobs are just waiting for a worker; running ones heartbeat last_run_at
+            ? `AND NOT EXISTS (
+                SELECT 1 FROM pipeline_jobs pj
+                WHERE pj.global_keyword_id = global_keywords.global_keyword_id
+                AND pj.status = 'queued'
+            )`
+            : '');
         const result = await pool.query(query);
         if (result.rowCount > 0) {
             console.log(`[MAINTENANCE] Healed ${result.rowCount} stuck processes.`);
@@ -45,6 +52,25 @@ setInterval(async () => {
     }
 }, 5 * 60 * 1000);
 
+/**
+ * Queue dispatch: save analysis_history for jobs the Python queue workers
+ * have finished. global_keywords turns COMPLETED when Bronze ends, before
+ * Silver and Gold, so only pipeline_jobs.status = 'done' marks a whole run.
+ */
+if (process.env.PIPELINE_DISPATCH === 'queue') {
+    const sweepMs = (parseFloat(process.env.HISTORY_SWEEP_SECONDS) || 10) * 1000;
+    setInterval(async () => {
+        try {
+            const saved = await saveQueuedJobHistory();
+            if (saved > 0) {
+                console.log(`[MAINTENANCE] Saved history for ${saved} finished job(s).`);
+            }
+        } catch (err) {
+            console.error("[HISTORY_SWEEP_ERROR]:", err.message);
+        }
+    }, sweepMs);
+}
+
 // ==========================================
 // BASE ENDPOINT & HEALTH CHECK
 // ==========================================
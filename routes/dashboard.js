@@ -4,11 +4,12 @@ router.get('/summary/:keyword', async (req, res) => {
         const query = `
             SELECT 
                 ds.sentiment_label as name, 
-                COUNT(*)::int as value
-            FROM fact_sentiment_events fse
-            JOIN silver_reddit_posts srp ON fse.silver_content_id = srp.silver_post_id
-            JOIN dim_sentiment ds ON fse.sentiment_id = ds.sentiment_id
-            WHERE srp.keyword = $1
+                SUM(r.item_count)::int as value
+            FROM gold_daily_sentiment_rollup r
+            JOIN global_keywords gk ON gk.global_keyword_id = r.request_id
+            JOIN dim_sentiment ds ON r.sentiment_id = ds.sentiment_id
+            WHERE gk.keyword = $1
+            AND r.content_type_id = 1 -- posts
             GROUP BY ds.sentiment_label;
         `;
         const result = await pool.query(query, [keyword]);
@@ -23,35 +23,20 @@ router.get("/results/:requestId", async (req, res) => {
         const rid = parseInt(req.params.requestId);
         console.log(`[API] Fetching results for Request ID: ${rid}`);
 
-        // Reddit: Query silver tables
-        const postsResult = await pool.query(`
-            SELECT 
-                sp.post_sentiment_label as name, 
-                COUNT(*)::INT as value 
-            FROM silver_reddit_posts sp
-            JOIN global_keywords gk ON gk.global_keyword_id = sp.global_keyword_id
-            JOIN dim_sentiment ds ON ds.sentiment_label = sp.post_sentiment_label
-            WHERE sp.global_keyword_id = $1
-            AND (gk.start_date IS NULL OR DATE(sp.created_at_utc) >= gk.start_date)
-            AND (gk.end_date IS NULL OR DATE(sp.created_at_utc) <= gk.end_date)
-            GROUP BY sp.post_sentiment_label, ds.sentiment_order
-            ORDER BY ds.sentiment_order ASC
-        `, [rid]);
-
-        const commentsResult = await pool.query(`
+        // Reddit: read the gold daily rollup (one row per day x label, not per post)
+        const rollupQuery = `
             SELECT 
-                sc.comment_sentiment_label as name, 
-                COUNT(*)::INT as value 
-            FROM silver_reddit_comments sc
-            JOIN silver_reddit_posts sp ON sc.silver_post_id = sp.silver_post_id
-            JOIN global_keywords gk ON gk.global_keyword_id = sp.global_keyword_id
-            JOIN dim_sentiment ds ON ds.sentiment_label = sc.comment_sentiment_label
-            WHERE sp.global_keyword_id = $1
-            AND (gk.start_date IS NULL OR DATE(sc.comment_created_at_utc) >= gk.start_date)
-            AND (gk.end_date IS NULL OR DATE(sc.comment_created_at_utc) <= gk.end_date)
-            GROUP BY sc.comment_sentiment_label, ds.sentiment_order
+                ds.sentiment_label as name, 
+                SUM(r.item_count)::INT as value 
+            FROM gold_daily_sentiment_rollup r
+            JOIN dim_sentiment ds ON ds.sentiment_id = r.sentiment_id
+            WHERE r.request_id = $1
+            AND r.content_type_id = $2
+            GROUP BY ds.sentiment_label, ds.sentiment_order
             ORDER BY ds.sentiment_order ASC
-        `, [rid]);
+        `;
+        const postsResult = await pool.query(rollupQuery, [rid, 1]);     // content_type_id 1 = post
+        const commentsResult = await pool.query(rollupQuery, [rid, 2]);  // content_type_id 2 = comment
 
         // Calculate totals
         const postTotal = postsResult.rows.reduce((sum, r) => sum + r.value, 0);
@@ -94,8 +79,8 @@ router.get("/details/:requestId", async (req, res) => {
             FROM silver_reddit_posts sp
             JOIN global_keywords gk ON gk.global_keyword_id = sp.global_keyword_id
             WHERE sp.global_keyword_id = $1
-            AND (gk.start_date IS NULL OR DATE(sp.created_at_utc) >= gk.start_date)
-            AND (gk.end_date IS NULL OR DATE(sp.created_at_utc) <= gk.end_date)
+            AND (gk.start_date IS NULL OR sp.date_id >= TO_CHAR(gk.start_date, 'YYYYMMDD')::INT)
+            AND (gk.end_date IS NULL OR sp.date_id <= TO_CHAR(gk.end_date, 'YYYYMMDD')::INT)
             ORDER BY sp.post_score DESC
             LIMIT 50
         `, [rid]);
@@ -114,8 +99,8 @@ router.get("/details/:requestId", async (req, res) => {
             JOIN silver_reddit_posts p ON c.silver_post_id = p.silver_post_id
             JOIN global_keywords gk ON gk.global_keyword_id = p.global_keyword_id
             WHERE p.global_keyword_id = $1
-            AND (gk.start_date IS NULL OR DATE(c.comment_created_at_utc) >= gk.start_date)
-            AND (gk.end_date IS NULL OR DATE(c.comment_created_at_utc) <= gk.end_date)
+            AND (gk.start_date IS NULL OR c.comment_date_id >= TO_CHAR(gk.start_date, 'YYYYMMDD')::INT)
+            AND (gk.end_date IS NULL OR c.comment_date_id <= TO_CHAR(gk.end_date, 'YYYYMMDD')::INT)
             ORDER BY c.comment_score DESC
             LIMIT 100
         `, [rid]);
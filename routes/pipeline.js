@@ -1,4 +1,5 @@
 import { spawn } from 'child_process';
+import net from 'net';
 import { Router } from 'express';
 import pool from '../db.js'; // Ensure you import your DB pool
 import { calculateCacheCoverage } from './cacheHelper.js';
@@ -10,40 +11,37 @@ async function saveAnalysisToHistory(requestId, keyword, userId, startDate, endD
     try {
         console.log(`[History] Starting to save analysis for Request ID: ${requestId}`);
 
-        // Reddit: Query silver_reddit_posts and silver_reddit_comments
-        const postsQuery = await pool.query(`
+        // Reddit: read counts and score sums from the gold daily rollup
+        // (content_type_id 1 = post, 2 = comment)
+        const rollupQuery = `
             SELECT 
-                COUNT(*) as post_count,
-                COUNT(*) FILTER (WHERE LOWER(post_sentiment_label) = 'positive') as positive_posts,
-                COUNT(*) FILTER (WHERE LOWER(post_sentiment_label) = 'neutral') as neutral_posts,
-                COUNT(*) FILTER (WHERE LOWER(post_sentiment_label) = 'negative') as negative_posts,
-                AVG(post_sentiment_score) as avg_post_score
-            FROM silver_reddit_posts sp
-            JOIN global_keywords gk ON gk.global_keyword_id = sp.global_keyword_id
-            WHERE sp.global_keyword_id = $1
-            AND post_sentiment_label IS NOT NULL
-            AND (gk.start_date IS NULL OR DATE(sp.created_at_utc) >= gk.start_date)
-            AND (gk.end_date IS NULL OR DATE(sp.created_at_utc) <= gk.end_date)
-        `, [requestId]);
-
-        const commentsQuery = await pool.query(`
-            SELECT 
-                COUNT(*) as comment_count,
-                COUNT(*) FILTER (WHERE LOWER(sc.comment_sentiment_label) = 'positive') as positive_comments,
-                COUNT(*) FILTER (WHERE LOWER(sc.comment_sentiment_label) = 'neutral') as neutral_comments,
-                COUNT(*) FILTER (WHERE LOWER(sc.comment_sentiment_label) = 'negative') as negative_comments,
-                AVG(sc.comment_sentiment_score) as avg_comment_score
-            FROM silver_reddit_comments sc
-            JOIN silver_reddit_posts sp ON sc.silver_post_id = sp.silver_post_id
-            JOIN global_keywords gk ON gk.global_keyword_id = sp.global_keyword_id
-            WHERE sp.global_keyword_id = $1
-            AND sc.comment_sentiment_label IS NOT NULL
-            AND (gk.start_date IS NULL OR DATE(sc.comment_created_at_utc) >= gk.start_date)
-            AND (gk.end_date IS NULL OR DATE(sc.comment_created_at_utc) <= gk.end_date)
-        `, [requestId]);
-
-        const posts = postsQuery.rows[0];
-        const comments = commentsQuery.rows[0];
+                COALESCE(SUM(r.item_count), 0) as item_count,
+                COALESCE(SUM(r.item_count) FILTER (WHERE LOWER(ds.sentiment_label) = 'positive'), 0) as positive,
+                COALESCE(SUM(r.item_count) FILTER (WHERE LOWER(ds.sentiment_label) = 'neutral'), 0) as neutral,
+                COALESCE(SUM(r.item_count) FILTER (WHERE LOWER(ds.sentiment_label) = 'negative'), 0) as negative,
+                SUM(r.score_sum) / NULLIF(SUM(r.item_count), 0) as avg_score
+            FROM gold_daily_sentiment_rollup r
+            JOIN dim_sentiment ds ON ds.sentiment_id = r.sentiment_id
+            WHERE r.request_id = $1
+            AND r.content_type_id = $2
+        `;
+        const postsRow = (await pool.query(rollupQuery, [requestId, 1])).rows[0];
+        const commentsRow = (await pool.query(rollupQuery, [requestId, 2])).rows[0];
+
+        const posts = {
+            post_count: postsRow.item_count,
+            positive_posts: postsRow.positive,
+            neutral_posts: postsRow.neutral,
+            negative_posts: postsRow.negative,
+            avg_post_score: postsRow.avg_score
+        };
+        const comments = {
+            comment_count: commentsRow.item_count,
+            positive_comments: commentsRow.positive,
+            neutral_comments: commentsRow.neutral,
+            negative_comments: commentsRow.negative,
+            avg_comment_score: commentsRow.avg_score
+        };
 
         // Check if we have any data to save
         const totalPosts = parseInt(posts.post_count) || 0;
@@ -116,6 +114,85 @@ async function saveAnalysisToHistory(requestId, keyword, userId, startDate, endD
 }
 
 
+// Send a job to the long-running Python worker (python main.py --worker) over its
+// Unix socket. Resolves with 0/1 like a spawned process exit code.
+function runViaWorker(socketPath, job) {
+    return new Promise((resolve) => {
+        let buffered = '';
+        let finalStatus = null;
+        const socket = net.createConnection(socketPath, () => {
+            socket.write(JSON.stringify(job) + '\n');
+        });
+
+        socket.on('data', (chunk) => {
+            buffered += chunk.toString();
+            let newline;
+            while ((newline = buffered.indexOf('\n')) !== -1) {
+                const line = buffered.slice(0, newline);
+                buffered = buffered.slice(newline + 1);
+                try {
+                    const message = JSON.parse(line);
+                    console.log(`Worker Output (ID: ${job.request_id}):`, message);
+                    if (message.status !== 'QUEUED') {
+                        finalStatus = message.status;
+                    }
+                } catch (parseErr) {
+                    console.error('Worker sent malformed message:', line);
+                }
+            }
+        });
+
+        socket.on('error', (err) => {
+            console.error(`Worker connection failed (ID: ${job.request_id}):`, err.message);
+            finalStatus = finalStatus || 'FAILED';
+        });
+
+        socket.on('close', () => resolve(finalStatus === 'COMPLETED' ? 0 : 1));
+    });
+}
+
+// Queue dispatch: the Python queue worker finishes the run, so nothing in this
+// process sees it end. index.js sweeps finished jobs on an interval and saves
+// their history here, whether or not any client is still polling. Each job's
+// history_saved flag is claimed atomically, so concurrent sweeps (one per
+// backend instance) never save the same run twice.
+export async function saveQueuedJobHistory() {
+    let saved = 0;
+    const failedJobs = [];
+    for (;;) {
+        const claim = await pool.query(`
+            UPDATE pipeline_jobs SET history_saved = TRUE
+            WHERE job_id = (
+                SELECT job_id FROM pipeline_jobs
+                WHERE status = 'done' AND NOT history_saved
+                AND job_id <> ALL($1::BIGINT[])
+                ORDER BY finished_at
+                LIMIT 1
+                FOR UPDATE SKIP LOCKED
+            )
+            RETURNING job_id, global_keyword_id
+        `, [failedJobs]);
+        if (claim.rowCount === 0) return saved;
+
+        const { job_id: jobId, global_keyword_id: requestId } = claim.rows[0];
+        try {
+            const gk = await pool.query(
+                "SELECT keyword, user_id, start_date, end_date FROM global_keywords WHERE global_keyword_id = $1",
+                [requestId]
+            );
+            const { keyword, user_id, start_date, end_date } = gk.rows[0];
+            await saveAnalysisToHistory(requestId, keyword, user_id, start_date, end_date);
+            console.log(`✅ Analysis results saved to history (ID: ${requestId})`);
+            saved += 1;
+        } catch (historyErr) {
+            // Release the claim so the next sweep retries
+            await pool.query("UPDATE pipeline_jobs SET history_saved = FALSE WHERE job_id = $1", [jobId]);
+            failedJobs.push(jobId);
+            console.error(`⚠️ Failed to save to history (ID: ${requestId}):`, historyErr.message);
+        }
+    }
+}
+
 // NEW: Polling Route for React Hook
 router.get('/status/id/:requestId', async (req, res) => {
     try {
@@ -123,7 +200,8 @@ router.get('/status/id/:requestId', async (req, res) => {
             "SELECT status FROM global_keywords WHERE global_keyword_id = $1",
             [req.params.requestId] // Use ID instead of keyword
         );
-        res.json({ status: result.rows[0]?.status || 'IDLE' });
+        const status = result.rows[0]?.status || 'IDLE';
+        res.json({ status });
     } catch (err) {
         res.status(500).json({ error: "Failed to fetch status" });
     }
@@ -191,6 +269,22 @@ router.post('/analyze', async (req, res) => {
 
         const requestId = result.rows[0].global_keyword_id;
 
+        // 3b. QUEUE DISPATCH: only enqueue; python main.py --queue-worker claims the job
+        if (process.env.PIPELINE_DISPATCH === 'queue') {
+            await pool.query(`
+                INSERT INTO pipeline_jobs (global_keyword_id, keyword, platform)
+                VALUES ($1, $2, 'reddit')
+                ON CONFLICT (global_keyword_id) WHERE status IN ('queued', 'running') DO NOTHING
+            `, [requestId, keyword]);
+
+            return res.status(202).json({
+                message: "Analysis queued",
+                trigger: true,
+                status: 'PROCESSING',
+                requestId: requestId
+            });
+        }
+
         // 4. RESPOND TO FRONTEND IMMEDIATELY
         res.status(202).json({
             message: "Analysis started",
@@ -199,24 +293,8 @@ router.post('/analyze', async (req, res) => {
             requestId: requestId
         });
 
-        const pythonExe = process.env.PYTHON_EXE_PATH || 'python';
-        const pythonScript = process.env.PYTHON_SCRIPT_PATH;
-        if (!pythonExe || !pythonScript) {
-            console.error("CRITICAL: Environment variables for Python are missing!");
-        }
-
-        // 6. SPAWN ORCHESTRATOR (Reddit only)
-        console.log('[API DEBUG] Spawning Python with args:', [pythonScript, keyword, requestId.toString(), 'reddit']);
-        const pythonProcess = spawn(pythonExe, [
-            pythonScript,
-            keyword,
-            requestId.toString(), // Request ID
-            'reddit' // Platform (Reddit only)
-        ]);
-        pythonProcess.stdout.on('data', (data) => console.log(`Python Output: ${data}`));
-        pythonProcess.stderr.on('data', (data) => console.error(`Python Error: ${data}`));
-
-        pythonProcess.on('close', async (code) => {
+        // 5. HANDLE PIPELINE EXIT (same for spawned process and worker)
+        const onPipelineExit = async (code) => {
             console.log(`Pipeline (ID: ${requestId}) exited with code ${code}`);
             if (code !== 0) {
                 await pool.query(
@@ -239,7 +317,40 @@ router.post('/analyze', async (req, res) => {
                     // Don't fail the entire pipeline if history save fails
                 }
             }
-        });
+        };
+
+        // 6a. HAND OFF TO WARM WORKER (model already loaded, no process spawn)
+        const workerSocket = process.env.PIPELINE_WORKER_SOCKET;
+        if (workerSocket) {
+            console.log('[API DEBUG] Sending job to pipeline worker at', workerSocket);
+            runViaWorker(workerSocket, {
+                keyword,
+                request_id: requestId,
+                platform: 'reddit'
+            })
+                .then(onPipelineExit)
+                .catch((workerErr) => console.error(`Worker job failed (ID: ${requestId}):`, workerErr.message));
+            return;
+        }
+
+        const pythonExe = process.env.PYTHON_EXE_PATH || 'python';
+        const pythonScript = process.env.PYTHON_SCRIPT_PATH;
+        if (!pythonExe || !pythonScript) {
+            console.error("CRITICAL: Environment variables for Python are missing!");
+        }
+
+        // 6b. SPAWN ORCHESTRATOR (Reddit only)
+        console.log('[API DEBUG] Spawning Python with args:', [pythonScript, keyword, requestId.toString(), 'reddit']);
+        const pythonProcess = spawn(pythonExe, [
+            pythonScript,
+            keyword,
+            requestId.toString(), // Request ID
+            'reddit' // Platform (Reddit only)
+        ]);
+        pythonProcess.stdout.on('data', (data) => console.log(`Python Output: ${data}`));
+        pythonProcess.stderr.on('data', (data) => console.error(`Python Error: ${data}`));
+
+        pythonProcess.on('close', onPipelineExit);
 
     } catch (err) {
         console.error("PIPELINE ERROR:", err.message);